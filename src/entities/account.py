@@ -1,12 +1,14 @@
-from datetime import date
-from dateutil.relativedelta import relativedelta
-from entities.external_entities.bank import Bank
-from entities.external_entities.internal_revenue_service import InternalRevenueService
-from entities.external_entities.stock_market import StockMarket
+from datetime import date, timedelta
+from typing import Tuple
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.warning_log import WarningLog
 from models.configs.account_config import AccountConfig
 from models.enums.account_type import AccountType
 from models.enums.time_period_type import TimePeriodType
+from services.date_calculator import DateCalculator
 from services.financial_calculator import FinancialCalculator
+from services.output_sink import OutputSink
 
 
 class Account:
@@ -29,8 +31,23 @@ class Account:
   _pays_capital_gains_tax: bool
   _pays_income_tax: bool
   _currently_untaxed_gains: float
+  _age_milestones: AgeMilestones
+  _post_tax_balance: float | None
+  _post_tax_balance_penalty_rate: float
+  _warning_log: WarningLog
+  _output_sink: OutputSink
+  _ledger: Ledger
 
-  def __init__(self, today: date, account_config: AccountConfig):
+  def __init__(
+    self,
+    today: date,
+    account_config: AccountConfig,
+    ledger: Ledger,
+    age_milestones: AgeMilestones,
+    warning_log: WarningLog,
+    output_sink: OutputSink
+  ):
+    self._ledger = ledger
     self._name = account_config.name
     self._type = account_config.type
     self._balance = account_config.balance
@@ -41,18 +58,18 @@ class Account:
     self._pays_capital_gains_tax = account_config.pays_capital_gains_tax
     self._pays_income_tax = account_config.pays_income_tax
     self._currently_untaxed_gains = 0.0
+    self._age_milestones = age_milestones
+    self._post_tax_balance = None
+    self._post_tax_balance_penalty_rate = 0.0
+    self._warning_log = warning_log
+    self._output_sink = output_sink
 
   def __init_last_interest_date(self, today: date, account_config: AccountConfig):
-    if account_config.interest_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(days=account_config.interest_period_value)
-    elif account_config.interest_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(weeks=account_config.interest_period_value)
-    elif account_config.interest_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(months=account_config.interest_period_value)
-    elif account_config.interest_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(years=account_config.interest_period_value)
-    else:
-      raise RuntimeError("Unknown interest_period_type")
+    OLDEST_HAPPY_LAST_INTEREST_DATE = DateCalculator.subtract_period(
+      today,
+      account_config.interest_period_type,
+      account_config.interest_period_value
+    )
     if account_config.last_interest_date >= OLDEST_HAPPY_LAST_INTEREST_DATE:
       self._last_interest_date = account_config.last_interest_date
     else:
@@ -72,17 +89,7 @@ class Account:
       return False
     if self._type not in self._account_types_that_gain_interest:
       return False
-    if self._interest_period_type == TimePeriodType.DAYS:
-      next_interest_day = self._last_interest_date + relativedelta(days=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.WEEKS:
-      next_interest_day = self._last_interest_date + relativedelta(weeks=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.MONTHS:
-      next_interest_day = self._last_interest_date + relativedelta(months=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.YEARS:
-      next_interest_day = self._last_interest_date + relativedelta(years=self._interest_period_value)
-    else:
-      raise RuntimeError("Unknown interest_period_type")
-    return today == next_interest_day
+    return today == self.__get_next_interest_day()
 
   def is_capital_gains_today(self, today: date) -> bool:
     if not self._interest_rate:
@@ -98,17 +105,27 @@ class Account:
       return False
     if not self._type in self._account_types_that_accrue_capital_gains:
       return False
-    if self._interest_period_type == TimePeriodType.DAYS:
-      next_interest_day = self._last_interest_date + relativedelta(days=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.WEEKS:
-      next_interest_day = self._last_interest_date + relativedelta(weeks=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.MONTHS:
-      next_interest_day = self._last_interest_date + relativedelta(months=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.YEARS:
-      next_interest_day = self._last_interest_date + relativedelta(years=self._interest_period_value)
-    else:
-      raise RuntimeError("Unknown interest_period_type")
-    return today == next_interest_day
+    return today == self.__get_next_interest_day()
+
+  def get_next_interest_date(self) -> date | None:
+    if not self._interest_rate:
+      return None
+    if not self._interest_period_type:
+      return None
+    if not self._interest_period_value:
+      return None
+    if not self._last_interest_date:
+      return None
+    if self._balance == 0:
+      return None
+    if self._type in self._account_types_that_gain_interest:
+      return self.__get_next_interest_day()
+    if self._type in self._account_types_that_accrue_capital_gains:
+      return self.__get_next_interest_day()
+    return None
+
+  def __get_next_interest_day(self) -> date:
+    return DateCalculator.add_period(self._last_interest_date, self._interest_period_type, self._interest_period_value)
 
   def get_name(self) -> str:
     return self._name
@@ -122,67 +139,124 @@ class Account:
   def get_type(self) -> AccountType:
     return self._type
 
-  def get_post_tax_balance(self, age: relativedelta) -> float:
+  def get_untaxed_gains(self) -> float:
+    return self._currently_untaxed_gains
+
+  def get_withdrawal_tax_rates(self, today: date) -> Tuple[float, float]:
+    """The rates withdraw charges: on the untaxed gains it takes, and on every dollar (income tax plus penalty)."""
+    capital_gains_rate = 0.15 if self._pays_capital_gains_tax else 0.0
+    income_tax_rate = 0.22 if self._pays_income_tax else 0.0
+    return capital_gains_rate, income_tax_rate + self._age_milestones.get_penalty_rate(self._type, today)
+
+  def get_post_tax_balance(self, today: date) -> float:
+    # Cached until the balance moves or a penalty lapses; payments and the shuffle ask repeatedly
+    penalty_rate = self._age_milestones.get_penalty_rate(self._type, today)
+    if self._post_tax_balance is None or penalty_rate != self._post_tax_balance_penalty_rate:
+      self._post_tax_balance = self.__get_post_tax_balance(self._balance, self._currently_untaxed_gains, penalty_rate)
+      self._post_tax_balance_penalty_rate = penalty_rate
+    return self._post_tax_balance
+
+  def get_projected_post_tax_balance(self, balance: float, untaxed_gains: float, today: date) -> float:
+    """What get_post_tax_balance would return were the balance and untaxed gains these."""
+    return self.__get_post_tax_balance(balance, untaxed_gains, self._age_milestones.get_penalty_rate(self._type, today))
+
+  def __get_post_tax_balance(self, balance: float, untaxed_gains: float, penalty_rate: float) -> float:
     capital_gains_tax = 0
     income_tax = 0
     penalty = 0
-    account_type = self.get_type()
     if self._pays_capital_gains_tax:
-      taxable_gains = self._currently_untaxed_gains
+      taxable_gains = untaxed_gains
       capital_gains_tax = taxable_gains * 0.15
     if self._pays_income_tax:
-      income_tax = self._balance * 0.22
-    AGE_IN_MONTHS = age.years * 12 + age.months
-    FOURK_AGE_IN_MONTHS = 59 * 12 + 6
-    IS_BELOW_FOURK_AGE = AGE_IN_MONTHS < FOURK_AGE_IN_MONTHS
-    if IS_BELOW_FOURK_AGE:
-      if account_type == AccountType.FOURK or account_type == AccountType.ROTH_IRA:
-        penalty = self._balance * 0.1
-    HSA_AGE_IN_MONTHS = 65 * 12
-    IS_BELOW_HSA_AGE = AGE_IN_MONTHS < HSA_AGE_IN_MONTHS
-    if IS_BELOW_HSA_AGE:
-      if account_type == AccountType.HSA:
-        penalty = self._balance * 0.2
-    return self._balance - (capital_gains_tax + income_tax + penalty)
+      income_tax = balance * 0.22
+    if penalty_rate:
+      penalty = balance * penalty_rate
+    return balance - (capital_gains_tax + income_tax + penalty)
+
+  def invalidate_post_tax_balance(self) -> None:
+    """For an owner that changes the balance without going through the account, like AccountStore."""
+    self._post_tax_balance = None
 
-  def withdraw(self, asking_amount: float, age: relativedelta) -> float:
+  def get_withdrawal_taxes(self, asking_amount: float, untaxed_gains: float, today: date) -> Tuple[float, float, float]:
+    """The capital gains tax, income tax and penalty withdraw charges on `asking_amount`, given `untaxed_gains`."""
     capital_gains_tax = 0
     income_tax = 0
     penalty = 0
-    account_type = self.get_type()
     if self._pays_capital_gains_tax:
-      taxable_gains = min(asking_amount, self._currently_untaxed_gains)
+      taxable_gains = min(asking_amount, untaxed_gains)
       capital_gains_tax = taxable_gains * 0.15
     if self._pays_income_tax:
       income_tax = asking_amount * 0.22
-    AGE_IN_MONTHS = age.years * 12 + age.months
-    FOURK_AGE_IN_MONTHS = 59 * 12 + 6
-    IS_BELOW_FOURK_AGE = AGE_IN_MONTHS < FOURK_AGE_IN_MONTHS
-    if IS_BELOW_FOURK_AGE:
-      if account_type == AccountType.FOURK or account_type == AccountType.ROTH_IRA:
-        penalty = asking_amount * 0.1
-        input(f"\n\033[38;2;255;0;0mWARNING:\033[0m Withdrawing from \033[38;2;255;0;0m{self.get_name()}\033[0m before age of 59.5")  # pylint: disable=line-too-long
-    HSA_AGE_IN_MONTHS = 65 * 12
-    IS_BELOW_HSA_AGE = AGE_IN_MONTHS < HSA_AGE_IN_MONTHS
-    if IS_BELOW_HSA_AGE:
+    penalty_rate = self._age_milestones.get_penalty_rate(self._type, today)
+    if penalty_rate:
+      penalty = asking_amount * penalty_rate
+    return capital_gains_tax, income_tax, penalty
+
+  def withdraw(self, asking_amount: float, today: date) -> float:
+    account_type = self.get_type()
+    capital_gains_tax, income_tax, penalty = self.get_withdrawal_taxes(
+      asking_amount,
+      self._currently_untaxed_gains,
+      today
+    )
+    if self._age_milestones.get_penalty_rate(account_type, today):
       if account_type == AccountType.HSA:
-        penalty = asking_amount * 0.2
-        input(f"\n\033[38;2;255;0;0mWARNING:\033[0m Withdrawing from \033[38;2;255;0;0m{self.get_name()}\033[0m before age of 65")  # pylint: disable=line-too-long
+        self._warning_log.warn("Withdrawing from", self.get_name(), "before age of 65")
+      else:
+        self._warning_log.warn("Withdrawing from", self.get_name(), "before age of 59.5")
     assert self._balance >= asking_amount + capital_gains_tax + income_tax + penalty
     self._currently_untaxed_gains -= capital_gains_tax
     assert self._currently_untaxed_gains >= 0
     amount_to_withdraw_with_tax = (asking_amount + capital_gains_tax + income_tax + penalty)
-    self._balance -= amount_to_withdraw_with_tax
-    InternalRevenueService.give(capital_gains_tax)
-    InternalRevenueService.give(income_tax)
-    InternalRevenueService.give(penalty)
+    self.__adjust_balance(-amount_to_withdraw_with_tax)
+    self._ledger.get_internal_revenue_service().give(capital_gains_tax)
+    self._ledger.get_internal_revenue_service().give(income_tax)
+    self._ledger.get_internal_revenue_service().give(penalty)
     return asking_amount
 
   def deposit(self, adjustment_amount) -> None:
-    self._balance += adjustment_amount
+    self.__adjust_balance(adjustment_amount)
+
+  def __adjust_balance(self, amount: float) -> None:
+    self._balance += amount
+    self._post_tax_balance = None
+    self._ledger.get_journal().post_user(amount)
+
+  def handle_skipped_days(self, last_day: date, today: date) -> None:
+    # Mirrors the per-day side effect of is_interest_today/is_capital_gains_today for days the event loop skipped
+    if (today - last_day).days <= 1:
+      return
+    if not self._interest_rate or not self._interest_period_type or not self._interest_period_value:
+      return
+    if self._balance == 0:
+      self._last_interest_date = today - timedelta(days=1)
 
-  def print_balance(self) -> None:
-    print(f"    {self._name} Balance: \033[38;2;0;255;0m${self.get_balance():,.2f}\033[0m")
+  def accrue(self, until: date) -> None:
+    # Posts every interest period that came due by `until` as one compounded amount
+    next_interest_day = self.get_next_interest_date()
+    if not next_interest_day or next_interest_day > until:
+      return
+    posting_day = DateCalculator.get_last_period_date(
+      self._last_interest_date,
+      self._interest_period_type,
+      self._interest_period_value,
+      until
+    )
+    gains = FinancialCalculator.get_interest(
+      principal=self._balance,
+      interest_rate=self._interest_rate,
+      last_interest_date=self._last_interest_date,
+      today=posting_day
+    )
+    if gains == 0:
+      return
+    if gains < 0:
+      raise RuntimeError(f"Account gained below 0 interest: {gains}")
+    self._last_interest_date = posting_day
+    if self._type in self._account_types_that_gain_interest:
+      self.__adjust_balance(self._ledger.get_bank().take(gains))
+    else:
+      self.__adjust_balance(self._ledger.get_stock_market().take(gains))
 
   def handle_interest(self, today: date, is_print_day: bool) -> None:
     if not self.is_interest_today(today):
@@ -203,9 +277,9 @@ class Account:
     if interest_gained < 0:
       raise RuntimeError(f"Account gained below 0 interest: {interest_gained}")
     self._last_interest_date = today
-    self._balance += Bank.take(interest_gained)
+    self.__adjust_balance(self._ledger.get_bank().take(interest_gained))
     if is_print_day:
-      print(f"  [Daily]   {self._name} Interest: \033[38;2;0;255;0m+${interest_gained:,.2f}\033[0m")
+      self._output_sink.account_interest(self._name, interest_gained)
 
   def handle_capital_gains(self, today: date, is_print_day: bool) -> None:
     if not self.is_capital_gains_today(today):
@@ -227,14 +301,14 @@ class Account:
       raise RuntimeError(f"Account gained below 0 interest: {capital_gains}")
     self._last_interest_date = today
     if self._type == AccountType.FOURK:
-      self._balance += StockMarket.take(capital_gains)
+      self.__adjust_balance(self._ledger.get_stock_market().take(capital_gains))
     elif self._type == AccountType.HSA:
-      self._balance += StockMarket.take(capital_gains)
+      self.__adjust_balance(self._ledger.get_stock_market().take(capital_gains))
     elif self._type == AccountType.INVESTMENT:
-      self._balance += StockMarket.take(capital_gains)
+      self.__adjust_balance(self._ledger.get_stock_market().take(capital_gains))
     elif self._type == AccountType.ROTH_IRA:
-      self._balance += StockMarket.take(capital_gains)
+      self.__adjust_balance(self._ledger.get_stock_market().take(capital_gains))
     else:
       raise RuntimeError("Unknown AccountType")
     if is_print_day:
-      print(f"  [Daily]   {self._name} Capital Gains: \033[38;2;0;255;0m+${capital_gains:,.2f}\033[0m")
+      self._output_sink.capital_gains(self._name, capital_gains)
@@ -0,0 +1,262 @@
+from datetime import date, timedelta
+from typing import List
+import numpy as np
+from entities.account import Account
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.warning_log import WarningLog
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from services.output_sink import OutputSink
+
+
+class StoredAccount(Account):
+  """An Account whose balance, untaxed gains and last interest date live in one row of an AccountStore."""
+  _store: "AccountStore"
+  _balances: np.ndarray
+  _untaxed_gains: np.ndarray
+  _last_interest_ordinals: np.ndarray
+  _index: int
+
+  def __init__(
+    self,
+    today: date,
+    account_config: AccountConfig,
+    ledger: Ledger,
+    store: "AccountStore",
+    index: int,
+    age_milestones: AgeMilestones,
+    warning_log: WarningLog,
+    output_sink: OutputSink
+  ):
+    self._store = store
+    self._balances = store.get_balances()
+    self._untaxed_gains = store.get_untaxed_gains()
+    self._last_interest_ordinals = store.get_last_interest_ordinals()
+    self._index = index
+    super().__init__(today, account_config, ledger, age_milestones, warning_log, output_sink)
+
+  @property
+  def _balance(self) -> float:  # type: ignore[override]
+    self._store.settle()
+    return self._balances.item(self._index)
+
+  @_balance.setter
+  def _balance(self, balance: float) -> None:
+    self._store.settle()
+    self._balances[self._index] = balance
+
+  @property
+  def _currently_untaxed_gains(self) -> float:  # type: ignore[override]
+    return self._untaxed_gains.item(self._index)
+
+  @_currently_untaxed_gains.setter
+  def _currently_untaxed_gains(self, untaxed_gains: float) -> None:
+    self._untaxed_gains[self._index] = untaxed_gains
+
+  @property
+  def _last_interest_date(self) -> date:  # type: ignore[override]
+    self._store.settle()
+    return date.fromordinal(self._last_interest_ordinals.item(self._index))
+
+  @_last_interest_date.setter
+  def _last_interest_date(self, last_interest_date: date) -> None:
+    self._store.settle()
+    self._last_interest_ordinals[self._index] = last_interest_date.toordinal()
+
+  def get_post_tax_balance(self, today: date) -> float:
+    # The cached figure is only good once the deferred growth is in
+    self._store.settle()
+    return super().get_post_tax_balance(today)
+
+
+class AccountStore:
+  """
+  Keeps every account's numeric state in parallel NumPy arrays so run-wide totals and
+  accruals are single vector operations. Interest and capital gains are not posted on the day
+  they come due: the store notes how far growth is owed and settles it in one closed-form pass
+  the next time anything reads or writes a balance, which in practice is only on days with
+  payments, payouts or output. Accounts with month or year periods fall back to
+  `Account.accrue`, since calendar clamping has no closed form.
+  """
+  _accounts: List[StoredAccount]
+  _balances: np.ndarray
+  _untaxed_gains: np.ndarray
+  _last_interest_ordinals: np.ndarray
+  _interest_rates: np.ndarray
+  _growth_bases: np.ndarray
+  _period_days: np.ndarray
+  _has_interest_period: np.ndarray
+  _grows: np.ndarray
+  _gains_interest: np.ndarray
+  _is_fourk_or_roth_ira: np.ndarray
+  _is_hsa: np.ndarray
+  _pays_capital_gains_tax: np.ndarray
+  _pays_income_tax: np.ndarray
+  _calendar_period_indexes: List[int]
+  _is_settled: bool
+  _growth_ordinal: int
+  _idle_restart_ordinal: int
+  _age_milestones: AgeMilestones
+  _ledger: Ledger
+
+  def __init__(
+    self,
+    today: date,
+    account_configs: List[AccountConfig],
+    ledger: Ledger,
+    age_milestones: AgeMilestones,
+    warning_log: WarningLog,
+    output_sink: OutputSink
+  ):
+    count = len(account_configs)
+    self._ledger = ledger
+    self._age_milestones = age_milestones
+    self._balances = np.zeros(count)
+    self._untaxed_gains = np.zeros(count)
+    self._last_interest_ordinals = np.zeros(count, dtype=np.int64)
+    self._interest_rates = np.array([config.interest_rate or 0.0 for config in account_configs], dtype=float)
+    self._growth_bases = 1 + (self._interest_rates / 100) / 365
+    self._period_days = np.array([AccountStore.__get_period_days(config) for config in account_configs], dtype=np.int64)
+    types = [config.type for config in account_configs]
+    self._gains_interest = np.array([t in Account._account_types_that_gain_interest for t in types], dtype=bool)
+    accrues_capital_gains = np.array([t in Account._account_types_that_accrue_capital_gains for t in types], dtype=bool)
+    self._is_fourk_or_roth_ira = np.array([t in (AccountType.FOURK, AccountType.ROTH_IRA) for t in types], dtype=bool)
+    self._is_hsa = np.array([t == AccountType.HSA for t in types], dtype=bool)
+    self._pays_capital_gains_tax = np.array([config.pays_capital_gains_tax for config in account_configs], dtype=bool)
+    self._pays_income_tax = np.array([config.pays_income_tax for config in account_configs], dtype=bool)
+    self._calendar_period_indexes = [
+      index for index, config in enumerate(account_configs)
+      if config.interest_period_value and config.interest_period_type in (TimePeriodType.MONTHS, TimePeriodType.YEARS)
+    ]
+    self._has_interest_period = (self._interest_rates != 0) & (self._period_days > 0)
+    self._grows = (self._gains_interest | accrues_capital_gains) & self._has_interest_period
+    self._has_interest_period[self._calendar_period_indexes] = self._interest_rates[self._calendar_period_indexes] != 0
+    self._is_settled = True
+    self._growth_ordinal = 0
+    self._idle_restart_ordinal = 0
+    self._accounts = []
+    for index, config in enumerate(account_configs):
+      self._accounts.append(StoredAccount(today, config, ledger, self, index, age_milestones, warning_log, output_sink))
+
+  @staticmethod
+  def __get_period_days(account_config: AccountConfig) -> int:
+    if not account_config.interest_period_value:
+      return 0
+    if account_config.interest_period_type == TimePeriodType.DAYS:
+      return account_config.interest_period_value
+    if account_config.interest_period_type == TimePeriodType.WEEKS:
+      return account_config.interest_period_value * 7
+    return 0
+
+  def get_accounts(self) -> List[Account]:
+    return list(self._accounts)
+
+  def get_balances(self) -> np.ndarray:
+    return self._balances
+
+  def get_untaxed_gains(self) -> np.ndarray:
+    return self._untaxed_gains
+
+  def get_last_interest_ordinals(self) -> np.ndarray:
+    return self._last_interest_ordinals
+
+  def get_total_balance(self) -> float:
+    self.settle()
+    return float(self._balances.sum())
+
+  def get_post_tax_balances(self, today: date) -> np.ndarray:
+    # Vector form of Account.get_post_tax_balance
+    self.settle()
+    capital_gains_tax = np.where(self._pays_capital_gains_tax, self._untaxed_gains * 0.15, 0.0)
+    income_tax = np.where(self._pays_income_tax, self._balances * 0.22, 0.0)
+    penalty = np.zeros_like(self._balances)
+    if today < self._age_milestones.get_fourk_penalty_end_date():
+      penalty = np.where(self._is_fourk_or_roth_ira, self._balances * 0.1, penalty)
+    if today < self._age_milestones.get_hsa_penalty_end_date():
+      penalty = np.where(self._is_hsa, self._balances * 0.2, penalty)
+    return self._balances - (capital_gains_tax + income_tax + penalty)
+
+  def handle_skipped_days(self, last_day: date, today: date) -> None:
+    # Deferred form of Account.handle_skipped_days
+    if (today - last_day).days <= 1:
+      return
+    self.__defer_idle_restart((today - timedelta(days=1)).toordinal())
+
+  def accrue(self, until: date) -> None:
+    # Deferred form of Account.accrue
+    self.__defer_growth(until.toordinal())
+
+  def handle_interest(self, today: date) -> None:
+    # Deferred form of Account.handle_interest on a day with no output
+    self.__defer_idle_restart(today.toordinal())
+    self.__defer_growth(today.toordinal())
+
+  def handle_capital_gains(self, today: date) -> None:
+    # Deferred form of Account.handle_capital_gains on a day with no output
+    self.__defer_idle_restart(today.toordinal())
+    self.__defer_growth(today.toordinal())
+
+  def __defer_idle_restart(self, ordinal: int) -> None:
+    self._idle_restart_ordinal = ordinal
+    self._is_settled = False
+
+  def __defer_growth(self, ordinal: int) -> None:
+    if ordinal > self._growth_ordinal:
+      self._growth_ordinal = ordinal
+      self._is_settled = False
+
+  def settle(self) -> None:
+    """Posts the deferred growth; balances and last interest dates are read through here."""
+    if self._is_settled:
+      return
+    # Set first, since the calendar period accounts below read their balances back through here
+    self._is_settled = True
+    if self._idle_restart_ordinal:
+      self.__restart_idle_accounts(self._idle_restart_ordinal)
+      self._idle_restart_ordinal = 0
+    if not self._growth_ordinal:
+      return
+    self.__post_growth(self._growth_ordinal)
+    until = date.fromordinal(self._growth_ordinal)
+    for index in self._calendar_period_indexes:
+      self._accounts[index].accrue(until)
+
+  def __restart_idle_accounts(self, last_interest_ordinal: int) -> None:
+    # Empty accounts keep pushing their last interest date forward, as is_interest_today does
+    idle = self._has_interest_period & (self._balances == 0)
+    if idle.any():
+      self._last_interest_ordinals[idle] = last_interest_ordinal
+
+  def __post_growth(self, until_ordinal: int) -> None:
+    due_indexes = np.flatnonzero(
+      self._grows
+      & (self._balances != 0)
+      & (self._last_interest_ordinals + self._period_days <= until_ordinal)
+    )
+    if not due_indexes.size:
+      return
+    last_ordinals = self._last_interest_ordinals[due_indexes]
+    period_days = self._period_days[due_indexes]
+    days_elapsed = (until_ordinal - last_ordinals) // period_days * period_days
+    gains = self._balances[due_indexes] * (np.power(self._growth_bases[due_indexes], days_elapsed) - 1)
+    if gains.min() <= 0:
+      if gains.min() < 0:
+        raise RuntimeError(f"Account gained below 0 interest: {gains.min()}")
+      posted = gains != 0
+      due_indexes = due_indexes[posted]
+      last_ordinals = last_ordinals[posted]
+      days_elapsed = days_elapsed[posted]
+      gains = gains[posted]
+    self._last_interest_ordinals[due_indexes] = last_ordinals + days_elapsed
+    self._balances[due_indexes] += gains
+    for index in due_indexes.tolist():
+      self._accounts[index].invalidate_post_tax_balance()
+    is_interest = self._gains_interest[due_indexes]
+    bank_gains = float(gains[is_interest].sum())
+    stock_market_gains = float(gains[~is_interest].sum())
+    if bank_gains:
+      self._ledger.get_journal().post_user(self._ledger.get_bank().take(bank_gains))
+    if stock_market_gains:
+      self._ledger.get_journal().post_user(self._ledger.get_stock_market().take(stock_market_gains))
@@ -1,9 +1,10 @@
 from datetime import date
-from dateutil.relativedelta import relativedelta
 from models.configs.asset_config import AssetConfig
 from models.enums.asset_type import AssetType
 from models.enums.time_period_type import TimePeriodType
+from services.date_calculator import DateCalculator
 from services.financial_calculator import FinancialCalculator
+from services.output_sink import OutputSink
 
 
 class Asset:
@@ -19,8 +20,9 @@ class Asset:
   _pays_capital_gains_tax: bool
   _sell_date: date | None
   _currently_untaxed_gains: float
+  _output_sink: OutputSink
 
-  def __init__(self, is_paid_off: bool, today: date, asset_config: AssetConfig):
+  def __init__(self, is_paid_off: bool, today: date, asset_config: AssetConfig, output_sink: OutputSink):
     self._name = asset_config.name
     self._type = asset_config.type
     self._value = asset_config.value
@@ -33,6 +35,7 @@ class Asset:
     self._pays_capital_gains_tax = asset_config.pays_capital_gains_tax
     self._sell_date = asset_config.sell_date
     self._currently_untaxed_gains = 0.0
+    self._output_sink = output_sink
 
   def __eq__(self, other):
     if not isinstance(other, Asset):
@@ -56,22 +59,22 @@ class Asset:
 
   def appreciates_today(self, today: date) -> bool:
     assert not self._sold
-    if self._value == 0:
+    next_appreciation_day = self.get_next_appreciation_date()
+    if not next_appreciation_day:
       return False
-    elif self._value < 0:
-      raise RuntimeError("Asset value is below 0")
-    if self._appreciation_period_type == TimePeriodType.DAYS:
-      next_appreciation_day = self._last_appreciation_date + relativedelta(days=self._appreciation_period_value)
-    elif self._appreciation_period_type == TimePeriodType.WEEKS:
-      next_appreciation_day = self._last_appreciation_date + relativedelta(weeks=self._appreciation_period_value)
-    elif self._appreciation_period_type == TimePeriodType.MONTHS:
-      next_appreciation_day = self._last_appreciation_date + relativedelta(months=self._appreciation_period_value)
-    elif self._appreciation_period_type == TimePeriodType.YEARS:
-      next_appreciation_day = self._last_appreciation_date + relativedelta(years=self._appreciation_period_value)
-    else:
-      raise RuntimeError("Unknown appreciation_period_type")
     return today >= next_appreciation_day
 
+  def get_next_appreciation_date(self) -> date | None:
+    if self._value == 0:
+      return None
+    if self._value < 0:
+      raise RuntimeError("Asset value is below 0")
+    return DateCalculator.add_period(
+      self._last_appreciation_date,
+      self._appreciation_period_type,
+      self._appreciation_period_value
+    )
+
   def get_post_tax_value(self) -> float:
     assert not self._sold
     capital_gains_tax = 0
@@ -94,6 +97,9 @@ class Asset:
   def get_sell_date(self) -> date | None:
     return self._sell_date
 
+  def set_sell_date(self, sell_date: date | None) -> None:
+    self._sell_date = sell_date
+
   def get_type(self) -> AssetType:
     assert not self._sold
     return self._type
@@ -107,13 +113,28 @@ class Asset:
     self._sold = True
     return post_tax_value
 
-  def print_value(self) -> None:
+  def accrue(self, until: date) -> None:
+    # Posts every appreciation period that came due by `until` as one compounded amount
     assert not self._sold
-    print(f"    {self._name} Value: \033[38;2;91;91;255m${self.get_value():,.2f}\033[0m")
-
-  def print_post_tax_value(self) -> None:
-    assert not self._sold
-    print(f"    {self._name} Post-Tax Value: \033[38;2;91;91;255m${self.get_post_tax_value():,.2f}\033[0m")
+    next_appreciation_day = self.get_next_appreciation_date()
+    if not next_appreciation_day or next_appreciation_day > until:
+      return
+    posting_day = DateCalculator.get_last_period_date(
+      self._last_appreciation_date,
+      self._appreciation_period_type,
+      self._appreciation_period_value,
+      until
+    )
+    interest_gained = FinancialCalculator.get_interest(
+      principal=self._value,
+      interest_rate=self._appreciation_rate,
+      last_interest_date=self._last_appreciation_date,
+      today=posting_day
+    )
+    if interest_gained == 0:
+      return
+    self._last_appreciation_date = posting_day
+    self._value += interest_gained
 
   def handle_appreciation(self, today: date, is_print_day: bool) -> None:
     assert not self._sold
@@ -130,7 +151,4 @@ class Asset:
     self._last_appreciation_date = today
     self._value += interest_gained
     if is_print_day:
-      if interest_gained > 0:
-        print(f"  [Daily]   {self._name} Appreciation: \033[38;2;0;255;0m+${interest_gained:,.2f}\033[0m")
-      else:
-        print(f"  [Daily]   {self._name} Depreciation: \033[38;2;255;0;0m-${abs(interest_gained):,.2f}\033[0m")
+      self._output_sink.appreciation(self._name, interest_gained)
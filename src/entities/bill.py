@@ -1,11 +1,10 @@
 from datetime import date
 from typing import List
-from dateutil.relativedelta import relativedelta
-from entities.account import Account
-from entities.external_entities.biller import Biller
-from exceptions.bankrupt_exception import BankruptException
+from entities.ledger import Ledger
 from models.configs.bill_config import BillConfig
 from models.enums.time_period_type import TimePeriodType
+from services.date_calculator import DateCalculator
+from services.output_sink import OutputSink
 
 
 class Bill():
@@ -21,8 +20,12 @@ class Bill():
   _start_date: date
   _end_date: date | None
   _last_charge_date: date
+  _ledger: Ledger
+  _output_sink: OutputSink
 
-  def __init__(self, today: date, bill_config: BillConfig):
+  def __init__(self, today: date, bill_config: BillConfig, ledger: Ledger, output_sink: OutputSink):
+    self._ledger = ledger
+    self._output_sink = output_sink
     self._name = bill_config.name
     self._charge = bill_config.charge
     self._charge_period_type = bill_config.charge_period_type
@@ -45,56 +48,31 @@ class Bill():
     if not self._annual_inflation_period_value:
       self._last_increase_date = None
       return
-    if bill_config.annual_inflation_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(days=self._annual_inflation_period_value)
-    elif bill_config.annual_inflation_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(weeks=self._annual_inflation_period_value)
-    elif bill_config.annual_inflation_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(months=self._annual_inflation_period_value)
-    elif bill_config.annual_inflation_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(years=self._annual_inflation_period_value)
-    else:
-      raise RuntimeError("Unknown inflation_period_value")
+    OLDEST_HAPPY_LAST_INCREASE_DATE = DateCalculator.subtract_period(
+      today,
+      self._annual_inflation_period_type,
+      self._annual_inflation_period_value
+    )
     if bill_config.start_date >= OLDEST_HAPPY_LAST_INCREASE_DATE:
       self._last_increase_date = bill_config.start_date
     else:
       self._last_increase_date = OLDEST_HAPPY_LAST_INCREASE_DATE
 
   def __init_last_charge_date(self, today: date, bill_config: BillConfig):
-    if bill_config.charge_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(days=bill_config.charge_period_value)
-    elif bill_config.charge_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(weeks=bill_config.charge_period_value)
-    elif bill_config.charge_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(months=bill_config.charge_period_value)
-    elif bill_config.charge_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(years=bill_config.charge_period_value)
-    else:
-      raise RuntimeError("Unknown charge_period_value")
+    OLDEST_HAPPY_LAST_CHARGE_DATE = DateCalculator.subtract_period(
+      today,
+      bill_config.charge_period_type,
+      bill_config.charge_period_value
+    )
     if bill_config.start_date >= OLDEST_HAPPY_LAST_CHARGE_DATE:
       self._last_charge_date = bill_config.start_date
     else:
       self._last_charge_date = OLDEST_HAPPY_LAST_CHARGE_DATE
 
   def increases_today(self, today: date) -> bool:
-    if not self._annual_inflation_percentage and not self._annual_inflation_flat:
-      return False
-    if not self._annual_inflation_period_type:
-      return False
-    if not self._annual_inflation_period_value:
+    next_increase_day = self.get_next_increase_date()
+    if not next_increase_day:
       return False
-    if not self._last_increase_date:
-      return False
-    if self._annual_inflation_period_type == TimePeriodType.DAYS:
-      next_increase_day = self._last_increase_date + relativedelta(days=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.WEEKS:
-      next_increase_day = self._last_increase_date + relativedelta(weeks=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.MONTHS:
-      next_increase_day = self._last_increase_date + relativedelta(months=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.YEARS:
-      next_increase_day = self._last_increase_date + relativedelta(years=self._annual_inflation_period_value)
-    else:
-      raise RuntimeError("Unknown inflation_period_type")
     return today == next_increase_day
 
   def is_charge_today(self, today: date) -> bool:
@@ -102,17 +80,30 @@ class Bill():
       return False
     if today == self._start_date:
       return True
-    if self._charge_period_type == TimePeriodType.DAYS:
-      next_charge_day = self._last_charge_date + relativedelta(days=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.WEEKS:
-      next_charge_day = self._last_charge_date + relativedelta(weeks=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.MONTHS:
-      next_charge_day = self._last_charge_date + relativedelta(months=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.YEARS:
-      next_charge_day = self._last_charge_date + relativedelta(years=self._charge_period_value)
-    else:
-      raise RuntimeError("Unknown charge_period_value")
-    return today == next_charge_day
+    return today == self.__get_next_charge_day()
+
+  def get_next_increase_date(self) -> date | None:
+    if not self._annual_inflation_percentage and not self._annual_inflation_flat:
+      return None
+    if not self._annual_inflation_period_type:
+      return None
+    if not self._annual_inflation_period_value:
+      return None
+    if not self._last_increase_date:
+      return None
+    return DateCalculator.add_period(
+      self._last_increase_date,
+      self._annual_inflation_period_type,
+      self._annual_inflation_period_value
+    )
+
+  def get_next_charge_date(self) -> date | None:
+    if self._charge == 0:
+      return None
+    return self.__get_next_charge_day()
+
+  def __get_next_charge_day(self) -> date:
+    return DateCalculator.add_period(self._last_charge_date, self._charge_period_type, self._charge_period_value)
 
   def get_name(self) -> str:
     return self._name
@@ -120,9 +111,18 @@ class Bill():
   def get_charge(self) -> float:
     return self._charge
 
+  def get_annual_inflation_percentage(self) -> float | None:
+    return self._annual_inflation_percentage
+
+  def get_start_date(self) -> date:
+    return self._start_date
+
   def get_end_date(self) -> date | None:
     return self._end_date
 
+  def set_end_date(self, end_date: date | None) -> None:
+    self._end_date = end_date
+
   def handle_potential_charge_increase(self, today: date, is_print_day: bool) -> None:
     if not self._annual_inflation_percentage and not self._annual_inflation_flat:
       return
@@ -133,7 +133,7 @@ class Bill():
     if not self.increases_today(today):
       return
     if self._annual_inflation_period_type == TimePeriodType.MONTHS:
-      past_date = today - relativedelta(months=self._annual_inflation_period_value)
+      past_date = DateCalculator.subtract_period(today, TimePeriodType.MONTHS, self._annual_inflation_period_value)
       days_elapsed = (today - past_date).days
     elif self._annual_inflation_period_type == TimePeriodType.YEARS:
       days_elapsed = self._annual_inflation_period_value * 365
@@ -154,55 +154,18 @@ class Bill():
     self._charge += daily_increase_dollar_amount
     self._last_increase_date = today
     if is_print_day:
-      if self._annual_inflation_period_type == TimePeriodType.DAYS:
-        print(f"  [Daily]   {self._name} increased by \033[38;2;255;0;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.WEEKS:
-        print(f"  [Weekly]  {self._name} increased by \033[38;2;255;0;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.MONTHS:
-        print(f"  [Monthly] {self._name} increased by \033[38;2;255;0;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.YEARS:
-        print(f"  [Yearly]  {self._name} increased by \033[38;2;255;0;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      else:
-        raise RuntimeError("Unknown IncreasePeriodValue")
-
-  def handle_potential_charge(
-    self,
-    is_print_day: bool,
-    today: date,
-    age: relativedelta,
-    accounts: List[Account]
-  ) -> None:
-    if not self.is_charge_today(today):
-      return
-    if not self._last_charge_date:
-      if today == self._start_date:
-        self._last_charge_date = today
-      else:
-        return
-    total_account_balances = 0
-    for account in accounts:
-      total_account_balances += account.get_post_tax_balance(age)
-    if total_account_balances < self._charge:
-      raise BankruptException(self._charge)
-    running_charge = self._charge
-    for account in accounts:
-      account_balance = account.get_post_tax_balance(age)
-      if account_balance > running_charge:
-        Biller.give(account.withdraw(running_charge, age))
-        running_charge = 0
-        break
-      else:
-        Biller.give(account.withdraw(account_balance, age))
-        running_charge -= account_balance
+      self._output_sink.bill_increase(self._name, self._annual_inflation_period_type, daily_increase_dollar_amount)
+
+  def get_charge_due(self, today: date) -> float | None:
+    """What pay_charge takes on a day is_charge_today holds, or None when nothing is due after all."""
+    if not self._last_charge_date and today != self._start_date:
+      return None
+    return self._charge
+
+  def pay_charge(self, is_print_day: bool, today: date, withdrawals: List[float]) -> None:
+    """`withdrawals` are the amounts a WithdrawalPlanner took from the accounts for this charge."""
+    for withdrawal in withdrawals:
+      self._ledger.get_biller().give(withdrawal)
     self._last_charge_date = today
     if is_print_day:
-      if self._charge_period_type == TimePeriodType.DAYS:
-        print(f"  [Daily]   {self._name} Charge: \033[38;2;255;0;0m-${self._charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.WEEKS:
-        print(f"  [Weekly]  {self._name} Charge: \033[38;2;255;0;0m-${self._charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.MONTHS:
-        print(f"  [Monthly] {self._name} Charge: \033[38;2;255;0;0m-${self._charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.YEARS:
-        print(f"  [Yearly]  {self._name} Charge: \033[38;2;255;0;0m-${self._charge:,.2f}\033[0m")
-      else:
-        raise RuntimeError("Unknown ChargePeriodType")
+      self._output_sink.bill_charge(self._name, self._charge_period_type, self._charge)
@@ -1,13 +1,14 @@
-from datetime import date
+from bisect import bisect_left
+from datetime import date, timedelta
 from typing import List
-from dateutil.relativedelta import relativedelta
-from entities.account import Account
 from entities.asset import Asset
-from entities.external_entities.debtor import Debtor
-from exceptions.bankrupt_exception import BankruptException
+from entities.ledger import Ledger
 from models.configs.debt_config import DebtConfig
 from models.enums.time_period_type import TimePeriodType
+from models.results.amortization_schedule import AmortizationSchedule
+from services.date_calculator import DateCalculator
 from services.financial_calculator import FinancialCalculator
+from services.output_sink import OutputSink
 
 
 class Debt:
@@ -23,9 +24,15 @@ class Debt:
   _charge_period_type: TimePeriodType
   _charge_period_value: int
   _last_charge_date: date
+  _minimum_payment: float | None
+  _amortization_schedule: AmortizationSchedule | None
   _asset: Asset | None
+  _ledger: Ledger
+  _output_sink: OutputSink
 
-  def __init__(self, today: date, debt_config: DebtConfig):
+  def __init__(self, today: date, debt_config: DebtConfig, ledger: Ledger, output_sink: OutputSink):
+    self._ledger = ledger
+    self._output_sink = output_sink
     self._name = debt_config.name
     self._principal = debt_config.principal
     self._balance = debt_config.balance
@@ -38,37 +45,29 @@ class Debt:
     self._charge_period_type = debt_config.charge_period_type
     self._charge_period_value = debt_config.charge_period_value
     self.__init_last_charge_date(today, debt_config)
+    self._minimum_payment = None
+    self._amortization_schedule = None
     self._asset = None
     if debt_config.asset:
-      self._asset = Asset(False, today, debt_config.asset)
+      self._asset = Asset(False, today, debt_config.asset, output_sink)
 
   def __init_last_interest_date(self, today: date, debt_config: DebtConfig):
-    if debt_config.interest_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(days=debt_config.interest_period_value)
-    elif debt_config.interest_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(weeks=debt_config.interest_period_value)
-    elif debt_config.interest_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(months=debt_config.interest_period_value)
-    elif debt_config.interest_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_INTEREST_DATE = today - relativedelta(years=debt_config.interest_period_value)
-    else:
-      raise RuntimeError("Unknown interest_period_value")
+    OLDEST_HAPPY_LAST_INTEREST_DATE = DateCalculator.subtract_period(
+      today,
+      debt_config.interest_period_type,
+      debt_config.interest_period_value
+    )
     if debt_config.start_date >= OLDEST_HAPPY_LAST_INTEREST_DATE:
       self._last_interest_date = debt_config.start_date
     else:
       self._last_interest_date = OLDEST_HAPPY_LAST_INTEREST_DATE
 
   def __init_last_charge_date(self, today: date, debt_config: DebtConfig):
-    if debt_config.charge_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(days=debt_config.charge_period_value)
-    elif debt_config.charge_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(weeks=debt_config.charge_period_value)
-    elif debt_config.charge_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(months=debt_config.charge_period_value)
-    elif debt_config.charge_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_CHARGE_DATE = today - relativedelta(years=debt_config.charge_period_value)
-    else:
-      raise RuntimeError("Unknown charge_period_value")
+    OLDEST_HAPPY_LAST_CHARGE_DATE = DateCalculator.subtract_period(
+      today,
+      debt_config.charge_period_type,
+      debt_config.charge_period_value
+    )
     if debt_config.start_date >= OLDEST_HAPPY_LAST_CHARGE_DATE:
       self._last_charge_date = debt_config.start_date
     else:
@@ -80,17 +79,7 @@ class Debt:
       return False
     if today == self._start_date:
       return True
-    if self._interest_period_type == TimePeriodType.DAYS:
-      next_interest_day = self._last_interest_date + relativedelta(days=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.WEEKS:
-      next_interest_day = self._last_interest_date + relativedelta(weeks=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.MONTHS:
-      next_interest_day = self._last_interest_date + relativedelta(months=self._interest_period_value)
-    elif self._interest_period_type == TimePeriodType.YEARS:
-      next_interest_day = self._last_interest_date + relativedelta(years=self._interest_period_value)
-    else:
-      raise RuntimeError("Unknown interest_period_value")
-    return today == next_interest_day
+    return today == self.__get_next_interest_day()
 
   def is_charge_today(self, today: date) -> bool:
     if self._balance == 0:
@@ -98,17 +87,23 @@ class Debt:
       return False
     if today == self._start_date:
       return True
-    if self._charge_period_type == TimePeriodType.DAYS:
-      next_charge_day = self._last_charge_date + relativedelta(days=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.WEEKS:
-      next_charge_day = self._last_charge_date + relativedelta(weeks=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.MONTHS:
-      next_charge_day = self._last_charge_date + relativedelta(months=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.YEARS:
-      next_charge_day = self._last_charge_date + relativedelta(years=self._charge_period_value)
-    else:
-      raise RuntimeError("Unknown charge_period_value")
-    return today == next_charge_day
+    return today == self.__get_next_charge_day()
+
+  def get_next_interest_date(self) -> date | None:
+    if self._balance == 0:
+      return None
+    return self.__get_next_interest_day()
+
+  def get_next_charge_date(self) -> date | None:
+    if self._balance == 0:
+      return None
+    return self.__get_next_charge_day()
+
+  def __get_next_interest_day(self) -> date:
+    return DateCalculator.add_period(self._last_interest_date, self._interest_period_type, self._interest_period_value)
+
+  def __get_next_charge_day(self) -> date:
+    return DateCalculator.add_period(self._last_charge_date, self._charge_period_type, self._charge_period_value)
 
   def get_name(self) -> str:
     return self._name
@@ -132,17 +127,82 @@ class Debt:
   def get_asset(self) -> Asset | None:
     return self._asset
 
+  def get_minimum_payment(self) -> float:
+    # Fixed by the loan's original terms, so it is computed on the first charge and kept; deferring
+    # it keeps numpy_financial out of runs that never charge a debt
+    if self._minimum_payment is None:
+      self._minimum_payment = FinancialCalculator.get_minimum_monthly_payment(
+        self._interest_rate,
+        self._principal,
+        self._start_date,
+        self._end_date
+      )
+    return self._minimum_payment
+
+  def get_amortization_schedule(self, today: date) -> AmortizationSchedule:
+    """Projected from the balance as of the last extra payment; scheduled charges keep it current."""
+    if self._amortization_schedule is None:
+      first_charge_date = self._start_date if today <= self._start_date else self.__get_next_charge_day()
+      self._amortization_schedule = FinancialCalculator.build_amortization_schedule(
+        payment=self.get_minimum_payment(),
+        balance=self._balance,
+        interest_rate=self._interest_rate,
+        last_interest_date=self._last_interest_date,
+        interest_period_type=self._interest_period_type,
+        interest_period_value=self._interest_period_value,
+        first_charge_date=first_charge_date,
+        charge_period_type=self._charge_period_type,
+        charge_period_value=self._charge_period_value,
+        end_date=self._end_date
+      )
+    return self._amortization_schedule
+
   def pay(self, adjustment_amount: float) -> None:
+    # An extra payment outside the schedule, so the projection has to be re-amortized
+    self.__reduce_balance(adjustment_amount)
+    self._amortization_schedule = None
+
+  def __reduce_balance(self, adjustment_amount: float) -> None:
     assert adjustment_amount <= self._balance
     self._balance -= adjustment_amount
     assert self._balance >= 0
 
-  def print_balance(self, today: date) -> None:
-    if self.get_balance(today) > 0:
-      print(f"    {self._name} Balance: \033[38;2;255;128;0m${self.get_balance(today):,.2f}\033[0m")
+  def handle_skipped_days(self, last_day: date, today: date) -> None:
+    # Mirrors the per-day side effect of is_interest_today/is_charge_today for days the event loop skipped
+    if (today - last_day).days <= 1:
+      return
+    if self._balance == 0:
+      self._last_interest_date = today - timedelta(days=1)
+      self._last_charge_date = today - timedelta(days=1)
+
+  def accrue(self, until: date) -> None:
+    # Posts every interest period that came due by `until` as one compounded amount
+    next_interest_day = self.get_next_interest_date()
+    if not next_interest_day or next_interest_day > until:
+      return
+    posting_day = DateCalculator.get_last_period_date(
+      self._last_interest_date,
+      self._interest_period_type,
+      self._interest_period_value,
+      until
+    )
+    interest_gained = FinancialCalculator.get_interest(
+      principal=self._balance,
+      interest_rate=self._interest_rate,
+      last_interest_date=self._last_interest_date,
+      today=posting_day
+    )
+    if interest_gained == 0:
+      return
+    if interest_gained < 0:
+      raise RuntimeError(f"Debt gained below 0 interest: {interest_gained}")
+    self._last_interest_date = posting_day
+    self._balance += interest_gained
 
   def handle_interest(self, today: date, is_print_day: bool) -> None:
-    if not self.is_interest_today(today):
+    """Call on a day is_interest_today holds; a paycheck routed to debt may have paid it off since."""
+    if self._balance == 0:
+      self._last_interest_date = today
       return
     interest_gained = FinancialCalculator.get_interest(
       principal=self._balance,
@@ -157,92 +217,52 @@ class Debt:
     self._last_interest_date = today
     self._balance += interest_gained
     if is_print_day:
-      print(f"  [Daily]   {self._name} Interest: \033[38;2;255;128;0m+${interest_gained:,.2f}\033[0m")
+      self._output_sink.debt_interest(self._name, interest_gained)
+
+  def get_charge_due(self, today: date) -> float | None:
+    """What pay_charge takes on a day is_charge_today holds, or None when nothing is due after all."""
+    if self._balance == 0:
+      self._last_charge_date = today
+      return None
+    if not self._last_charge_date:
+      if today < self._start_date:
+        return None
+      if today > self._start_date:
+        raise RuntimeError("No last_charge_date AND is later than start_date")
+    schedule = self.get_amortization_schedule(today)
+    row = bisect_left(schedule.dates, today)
+    if row == len(schedule.dates) or schedule.dates[row] != today:
+      # Projected from a different charge calendar (a resumed run, say), so re-amortize from today
+      self._amortization_schedule = None
+      schedule = self.get_amortization_schedule(today)
+      row = 0
+    if row == len(schedule.dates) - 1 or schedule.payments[row] >= self._balance:
+      return self._balance
+    return schedule.payments[row]
 
-  def handle_charges(
+  def pay_charge(
     self,
     is_print_day: bool,
     today: date,
-    age: relativedelta,
-    accounts: List[Account],
-    assets: List[Asset]
-  ) -> None:
-    if not self.is_charge_today(today):
-      return
-    if self.__is_last_charge():
-      charge = self._balance
-    else:
-      charge = FinancialCalculator.get_minimum_monthly_payment(
-        self._interest_rate,
-        self._principal,
-        self._start_date,
-        self._end_date
-      )
-    if not self._last_charge_date:
-      if today == self._start_date:
-        self._last_charge_date = today
-      elif today < self._start_date:
-        return
-      elif today > self._start_date:
-        raise RuntimeError("No last_charge_date AND is later than start_date")
-    total_balance = 0
-    for account in accounts:
-      total_balance += account.get_post_tax_balance(age)
-    if total_balance < charge:
-      raise BankruptException(charge)
-    running_charge = charge
-    assert running_charge <= self._balance + 0.01
-    for account in accounts:
-      account_balance = account.get_post_tax_balance(age)
-      if account_balance > running_charge:
-        running_charge_withdrawn = account.withdraw(running_charge, age)
-        self.pay(running_charge_withdrawn)
-        Debtor.give(running_charge_withdrawn)
-        running_charge = 0
-        break
-      else:
-        account_balance_withdrawn = account.withdraw(account_balance, age)
-        self.pay(account_balance_withdrawn)
-        Debtor.give(account_balance_withdrawn)
-        running_charge -= account_balance_withdrawn
+    withdrawals: List[float],
+    assets: List[Asset],
+    charge: float
+  ) -> Asset | None:
+    """
+    `withdrawals` are the amounts a WithdrawalPlanner took from the accounts for `charge`; returns
+    the asset this payment paid off, if any.
+    """
+    assert charge <= self._balance + 0.01
+    for withdrawal in withdrawals:
+      self.__reduce_balance(withdrawal)
+      self._ledger.get_debtor().give(withdrawal)
     self._last_charge_date = today
     if is_print_day:
-      if self._charge_period_type == TimePeriodType.DAYS:
-        print(f"  [Daily]   {self._name} Charge: \033[38;2;255;0;0m-${charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.WEEKS:
-        print(f"  [Weekly]  {self._name} Charge: \033[38;2;255;0;0m-${charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.MONTHS:
-        print(f"  [Monthly] {self._name} Charge: \033[38;2;255;0;0m-${charge:,.2f}\033[0m")
-      elif self._charge_period_type == TimePeriodType.YEARS:
-        print(f"  [Yearly]  {self._name} Charge: \033[38;2;255;0;0m-${charge:,.2f}\033[0m")
-      else:
-        raise RuntimeError("Unknown ChargePeriodType")
+      self._output_sink.debt_charge(self._name, self._charge_period_type, charge)
     if self._balance == 0:
       if self._asset:
         for asset in assets:
           if asset.get_name() == self._asset.get_name():
             asset.set_is_paid_off(True)
-            break
-
-  def __is_last_charge(self) -> bool:
-    if self._charge_period_type == TimePeriodType.DAYS:
-      next_charge_date = self._last_charge_date + relativedelta(days=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.WEEKS:
-      next_charge_date = self._last_charge_date + relativedelta(weeks=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.MONTHS:
-      next_charge_date = self._last_charge_date + relativedelta(months=self._charge_period_value)
-    elif self._charge_period_type == TimePeriodType.YEARS:
-      next_charge_date = self._last_charge_date + relativedelta(years=self._charge_period_value)
-    else:
-      raise RuntimeError("Unknown charge_period_type")
-    if next_charge_date > self._end_date:
-      return True
-    minimum_monthly_payment = FinancialCalculator.get_minimum_monthly_payment(
-      self._interest_rate,
-      self._principal,
-      self._start_date,
-      self._end_date
-    )
-    if minimum_monthly_payment >= self._balance:
-      return True
-    return False
+            return asset
+    return None
@@ -1,15 +1,22 @@
+from entities.journal import Journal
+
+
 class Debtor:
-  balance: float = 1000000000
+  _balance: float
+  _journal: Journal
+
+  def __init__(self, journal: Journal):
+    self._balance = 1000000000
+    self._journal = journal
 
-  @staticmethod
-  def peak_balance() -> float:
-    return Debtor.balance
+  def peak_balance(self) -> float:
+    return self._balance
 
-  @staticmethod
-  def take(amount: float) -> float:
-    Debtor.balance -= amount
+  def take(self, amount: float) -> float:
+    self._balance -= amount
+    self._journal.post_counterparty(-amount)
     return amount
 
-  @staticmethod
-  def give(amount: float) -> None:
-    Debtor.balance += amount
+  def give(self, amount: float) -> None:
+    self._balance += amount
+    self._journal.post_counterparty(amount)
@@ -1,21 +1,16 @@
 from datetime import date
 from typing import List
-from dateutil.relativedelta import relativedelta
 from entities.account import Account
-from entities.debt import Debt
-from entities.external_entities.city_government import CityGovernment
-from entities.external_entities.debtor import Debtor
-from entities.external_entities.department_of_social_security import DepartmentOfSocialSecurity
-from entities.external_entities.employer import Employer
-from entities.external_entities.internal_revenue_service import InternalRevenueService
-from entities.external_entities.healthcare_provider import HealthcareProvider
-from entities.external_entities.state_government import StateGovernment
-from entities.external_entities.us_treasury import UsTreasury
+from entities.ledger import Ledger
 from entities.misc.annual_federal_income_tax_record import AnnualFederalIncomeTaxRecord
+from entities.misc.payment_routing_plan import PaymentRoutingPlan
 from models.configs.income_stream_config import IncomeStreamConfig
 from models.enums.account_type import AccountType
 from models.enums.time_period_type import TimePeriodType
-from services.financial_calculator import FinancialCalculator
+from models.results.paycheck import Paycheck
+from services.date_calculator import DateCalculator
+from services.federal_tax_table import FederalTaxTable
+from services.output_sink import OutputSink
 
 
 class IncomeStream:
@@ -38,8 +33,12 @@ class IncomeStream:
   _end_date: date
   _last_payment_date: date
   _last_increase_date: date | None
+  _ledger: Ledger
+  _output_sink: OutputSink
 
-  def __init__(self, today: date, income_config: IncomeStreamConfig):
+  def __init__(self, today: date, income_config: IncomeStreamConfig, ledger: Ledger, output_sink: OutputSink):
+    self._ledger = ledger
+    self._output_sink = output_sink
     self._name = income_config.name
     self._annual_gross_income = income_config.gross
     self._period_health_insurance_premium = income_config.health_insurance_premium
@@ -62,16 +61,11 @@ class IncomeStream:
     self._end_date = income_config.end_date
 
   def __init_last_payment_date(self, today: date, income_config: IncomeStreamConfig):
-    if income_config.payment_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_PAYMENT_DATE = today - relativedelta(days=income_config.payment_period_value)
-    elif income_config.payment_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_PAYMENT_DATE = today - relativedelta(weeks=income_config.payment_period_value)
-    elif income_config.payment_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_PAYMENT_DATE = today - relativedelta(months=income_config.payment_period_value)
-    elif income_config.payment_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_PAYMENT_DATE = today - relativedelta(years=income_config.payment_period_value)
-    else:
-      raise RuntimeError("Unknown payment_period_value")
+    OLDEST_HAPPY_LAST_PAYMENT_DATE = DateCalculator.subtract_period(
+      today,
+      income_config.payment_period_type,
+      income_config.payment_period_value
+    )
     if income_config.start_date >= OLDEST_HAPPY_LAST_PAYMENT_DATE:
       self._last_payment_date = income_config.start_date
     else:
@@ -84,16 +78,11 @@ class IncomeStream:
     if not self._annual_inflation_period_value:
       self._last_increase_date = None
       return
-    if income_config.annual_inflation_period_type == TimePeriodType.DAYS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(days=self._annual_inflation_period_value)
-    elif income_config.annual_inflation_period_type == TimePeriodType.WEEKS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(weeks=self._annual_inflation_period_value)
-    elif income_config.annual_inflation_period_type == TimePeriodType.MONTHS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(months=self._annual_inflation_period_value)
-    elif income_config.annual_inflation_period_type == TimePeriodType.YEARS:
-      OLDEST_HAPPY_LAST_INCREASE_DATE = today - relativedelta(years=self._annual_inflation_period_value)
-    else:
-      raise RuntimeError("Unknown inflation_period_value")
+    OLDEST_HAPPY_LAST_INCREASE_DATE = DateCalculator.subtract_period(
+      today,
+      self._annual_inflation_period_type,
+      self._annual_inflation_period_value
+    )
     if income_config.start_date >= OLDEST_HAPPY_LAST_INCREASE_DATE:
       self._last_increase_date = income_config.start_date
     else:
@@ -104,38 +93,39 @@ class IncomeStream:
       return False
     if today == self._start_date:
       return True
-    if self._payment_period_type == TimePeriodType.DAYS:
-      next_payment_day = self._last_payment_date + relativedelta(days=self._payment_period_value)
-    elif self._payment_period_type == TimePeriodType.WEEKS:
-      next_payment_day = self._last_payment_date + relativedelta(weeks=self._payment_period_value)
-    elif self._payment_period_type == TimePeriodType.MONTHS:
-      next_payment_day = self._last_payment_date + relativedelta(months=self._payment_period_value)
-    elif self._payment_period_type == TimePeriodType.YEARS:
-      next_payment_day = self._last_payment_date + relativedelta(years=self._payment_period_value)
-    else:
-      raise RuntimeError("Unknown payment_period_value")
-    return today == next_payment_day
+    return today == self.__get_next_payment_day()
 
   def increases_today(self, today: date) -> bool:
-    if not self._annual_inflation_percentage and not self._annual_inflation_flat:
+    next_increase_day = self.get_next_increase_date()
+    if not next_increase_day:
       return False
+    return today == next_increase_day
+
+  def get_next_payment_date(self) -> date | None:
+    if self._annual_gross_income == 0:
+      return None
+    return self.__get_next_payment_day()
+
+  def get_next_increase_date(self) -> date | None:
+    if not self._annual_inflation_percentage and not self._annual_inflation_flat:
+      return None
     if not self._annual_inflation_period_type:
-      return False
+      return None
     if not self._annual_inflation_period_value:
-      return False
+      return None
     if not self._last_increase_date:
-      return False
-    if self._annual_inflation_period_type == TimePeriodType.DAYS:
-      next_increase_day = self._last_increase_date + relativedelta(days=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.WEEKS:
-      next_increase_day = self._last_increase_date + relativedelta(weeks=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.MONTHS:
-      next_increase_day = self._last_increase_date + relativedelta(months=self._annual_inflation_period_value)
-    elif self._annual_inflation_period_type == TimePeriodType.YEARS:
-      next_increase_day = self._last_increase_date + relativedelta(years=self._annual_inflation_period_value)
-    else:
-      raise RuntimeError("Unknown inflation_period_type")
-    return today == next_increase_day
+      return None
+    return DateCalculator.add_period(
+      self._last_increase_date,
+      self._annual_inflation_period_type,
+      self._annual_inflation_period_value
+    )
+
+  def __get_next_payment_day(self) -> date:
+    return DateCalculator.add_period(self._last_payment_date, self._payment_period_type, self._payment_period_value)
+
+  def get_name(self) -> str:
+    return self._name
 
   def get_annual_gross_income(self) -> float:
     return self._annual_gross_income
@@ -143,6 +133,9 @@ class IncomeStream:
   def get_end_date(self) -> date:
     return self._end_date
 
+  def set_end_date(self, end_date: date) -> None:
+    self._end_date = end_date
+
   def handle_potential_charge_increase(self, today: date, is_print_day: bool) -> None:
     if not self._annual_inflation_percentage and not self._annual_inflation_flat:
       return
@@ -153,7 +146,7 @@ class IncomeStream:
     if not self.increases_today(today):
       return
     if self._annual_inflation_period_type == TimePeriodType.MONTHS:
-      past_date = today - relativedelta(months=self._annual_inflation_period_value)
+      past_date = DateCalculator.subtract_period(today, TimePeriodType.MONTHS, self._annual_inflation_period_value)
       days_elapsed = (today - past_date).days
     elif self._annual_inflation_period_type == TimePeriodType.YEARS:
       days_elapsed = self._annual_inflation_period_value * 365
@@ -174,180 +167,165 @@ class IncomeStream:
     self._annual_gross_income += daily_increase_dollar_amount
     self._last_increase_date = today
     if is_print_day:
-      if self._annual_inflation_period_type == TimePeriodType.DAYS:
-        print(f"  [Daily]   {self._name} increased by \033[38;2;0;255;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.WEEKS:
-        print(f"  [Weekly]  {self._name} increased by \033[38;2;0;255;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.MONTHS:
-        print(f"  [Monthly] {self._name} increased by \033[38;2;0;255;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      elif self._annual_inflation_period_type == TimePeriodType.YEARS:
-        print(f"  [Yearly]  {self._name} increased by \033[38;2;0;255;0m+${daily_increase_dollar_amount:,.2f}\033[0m")
-      else:
-        raise RuntimeError("Unknown IncreasePeriodValue")
+      self._output_sink.income_increase(self._name, self._annual_inflation_period_type, daily_increase_dollar_amount)
 
-  def handle_potential_payout(
+  def handle_payout(
     self,
     is_print_day: bool,
-    is_married: bool,
+    federal_tax_table: FederalTaxTable,
     today: date,
     annual_federal_income_tax_record: AnnualFederalIncomeTaxRecord,
-    payment_order: List[List],
-    accounts: List[Account],
-    debts: List[Debt]
+    payment_plan: PaymentRoutingPlan,
+    accounts: List[Account]
   ) -> None:
-    if today > self._end_date:
+    """Call on a day is_payment_today holds."""
+    paycheck = self.take_paycheck(federal_tax_table, today, annual_federal_income_tax_record)
+    if paycheck is None:
       return
-    if today < self._start_date:
-      return
-    if not self.is_payment_today(today):
-      return
-    net_payout = None
-    time_since_last_payment = today - self._last_payment_date
-    if self._payment_period_type == TimePeriodType.DAYS:
-      payment_period_in_days = self._payment_period_value
-    elif self._payment_period_type == TimePeriodType.WEEKS:
-      payment_period_in_days = self._payment_period_value * 7
-    elif self._payment_period_type == TimePeriodType.MONTHS:
-      payment_period_in_days = (today - self._last_payment_date).days
-    elif self._payment_period_type == TimePeriodType.YEARS:
-      payment_period_in_days = self._payment_period_value * 365
-    else:
-      raise RuntimeError("Unknown payment_period_type")
-    if time_since_last_payment.days >= payment_period_in_days:
-      net_payout = self.__get_period_net_payout(
-        is_print_day,
-        is_married,
-        today,
-        annual_federal_income_tax_record,
-        accounts
-      )
+    self.__post_paycheck(is_print_day, paycheck, accounts)
+    net_payout = paycheck.net
     if net_payout:
       if is_print_day:
-        print(f"  {self._name} Payout: \033[38;2;0;255;0m+${net_payout:,.2f}\033[0m")
-      self.__pay_accounts(accounts, net_payout, payment_order, debts, today, is_print_day)
-    self._last_payment_date = today
+        self._output_sink.payout(self._name, net_payout, None)
+      self.__pay_accounts(payment_plan, net_payout, today, is_print_day)
 
-  def __pay_accounts(
+  def take_paycheck(
     self,
-    accounts: List[Account],
-    payout: float,
-    payment_order: List[List],
-    debts: List[Debt],
+    federal_tax_table: FederalTaxTable,
     today: date,
-    is_print_day: bool
-  ) -> None:
+    annual_federal_income_tax_record: AnnualFederalIncomeTaxRecord
+  ) -> Paycheck | None:
+    """
+    Call on a day is_payment_today holds: the pay period ending today, counted into the tax record, or None when
+    the stream is not running or a whole period has not passed. Moves no money; handle_payout does that.
+    """
+    if today > self._end_date:
+      return None
+    if today < self._start_date:
+      return None
+    paycheck = None
+    payment_period_in_days = self.__get_payment_period_in_days(today)
+    if (today - self._last_payment_date).days >= payment_period_in_days:
+      paycheck = self.__build_paycheck(federal_tax_table, payment_period_in_days)
+      annual_federal_income_tax_record.add_income(paycheck.gross)
+      annual_federal_income_tax_record.add_tax_paid(paycheck.federal_tax)
+    self._last_payment_date = today
+    return paycheck
+
+  def __get_payment_period_in_days(self, today: date) -> int:
+    if self._payment_period_type == TimePeriodType.DAYS:
+      return self._payment_period_value
+    if self._payment_period_type == TimePeriodType.WEEKS:
+      return self._payment_period_value * 7
+    if self._payment_period_type == TimePeriodType.MONTHS:
+      return (today - self._last_payment_date).days
+    if self._payment_period_type == TimePeriodType.YEARS:
+      return self._payment_period_value * 365
+    raise RuntimeError("Unknown payment_period_type")
+
+  def __pay_accounts(self, payment_plan: PaymentRoutingPlan, payout: float, today: date, is_print_day: bool) -> None:
     rollover = payout
-    sorted_debts = sorted(debts, key=lambda d: d.get_interest_rate(today), reverse=True)
-    for potential_account in payment_order:
-      account_name = str(potential_account[0])
-      if account_name.lower() == "debt":
-        pay_interest_above = potential_account[1]
-        for debt in sorted_debts:
+    for step_accounts, threshold in payment_plan.get_steps():
+      if step_accounts is None:
+        for debt in payment_plan.get_prioritized_debts():
           if rollover == 0:
             break
-          if debt.get_interest_rate(today) < pay_interest_above:
+          # A "Debt" step with no rate pays every debt
+          if threshold is not None and debt.get_interest_rate(today) < threshold:
             continue
           balance = debt.get_balance(today)
           if balance > 0:
             if is_print_day:
-              print(f"    {debt.get_name()}: \033[38;2;0;255;0m-${rollover:,.2f}\033[0m")
+              self._output_sink.debt_allocation(debt.get_name(), rollover)
             if balance > rollover:
               debt.pay(rollover)
-              Debtor.give(rollover)
+              self._ledger.get_debtor().give(rollover)
               rollover = 0
             else:
               debt.pay(balance)
-              Debtor.give(balance)
+              self._ledger.get_debtor().give(balance)
               rollover -= balance
               assert rollover > 0
       else:
-        account_goal = potential_account[1]
-        account_found = False
-        for account in accounts:
-          if rollover == 0:
+        assert step_accounts
+        for account in step_accounts:
+          if not threshold or account.get_balance() < threshold:
+            if is_print_day:
+              self._output_sink.account_allocation(account.get_name(), rollover)
+            account.deposit(rollover)
+            rollover = 0
             break
-          if account.get_name() == account_name:
-            account_found = True
-            if not account_goal or account.get_balance() < account_goal:
-              if is_print_day:
-                print(f"    {account.get_name()}: \033[38;2;0;255;0m+${rollover:,.2f}\033[0m")
-              account.deposit(rollover)
-              rollover = 0
-              break
-        assert account_found
       if rollover == 0:
         break
 
-  def __get_period_net_payout(
-    self,
-    is_print_day: bool,
-    is_married: bool,
-    today: date,
-    annual_federal_income_tax_record: AnnualFederalIncomeTaxRecord,
-    accounts: List[Account]
-  ) -> float:
-    if self._payment_period_type == TimePeriodType.DAYS:
-      payment_period_in_days = self._payment_period_value
-    elif self._payment_period_type == TimePeriodType.WEEKS:
-      payment_period_in_days = self._payment_period_value * 7
-    elif self._payment_period_type == TimePeriodType.MONTHS:
-      payment_period_in_days = (today - self._last_payment_date).days
-    elif self._payment_period_type == TimePeriodType.YEARS:
-      payment_period_in_days = self._payment_period_value * 365
-    else:
-      raise RuntimeError("Unknown payment_period_type")
+  def __build_paycheck(self, federal_tax_table: FederalTaxTable, payment_period_in_days: int) -> Paycheck:
+    periods_per_year = 365 / payment_period_in_days
     # Gross
-    pay_period_gross = self._annual_gross_income / (365 / payment_period_in_days)
-    annual_federal_income_tax_record.add_income(pay_period_gross)
-    pay_period_net = Employer.take(pay_period_gross)
+    pay_period_gross = self._annual_gross_income / periods_per_year
+    pay_period_net = pay_period_gross
     # Health Insurance Premium
     pay_period_health_insurance_premium = self._period_health_insurance_premium
     pay_period_net -= pay_period_health_insurance_premium
-    HealthcareProvider.give(pay_period_health_insurance_premium)
     # 401k
-    pay_period_fourk_contribution = self._annual_fourk_contribution / (365 / payment_period_in_days)
+    pay_period_fourk_contribution = self._annual_fourk_contribution / periods_per_year
     pay_period_net -= pay_period_fourk_contribution
-    self.__deposit_to_first_fourk(is_print_day, pay_period_fourk_contribution, accounts)
-    pay_period_fourk_employer_contribution = self._annual_fourk_employer_contribution / (365 / payment_period_in_days)
-    Employer.take(pay_period_fourk_employer_contribution)
-    self.__deposit_to_first_fourk(is_print_day, pay_period_fourk_employer_contribution, accounts)
+    pay_period_fourk_employer_contribution = self._annual_fourk_employer_contribution / periods_per_year
     # HSA
-    pay_period_hsa_contribution = self._annual_hsa_contribution / (365 / payment_period_in_days)
+    pay_period_hsa_contribution = self._annual_hsa_contribution / periods_per_year
     pay_period_net -= pay_period_hsa_contribution
-    self.__deposit_to_first_hsa(is_print_day, pay_period_hsa_contribution, accounts)
-    pay_period_hsa_employer_contribution = self._annual_hsa_employer_contribution / (365 / payment_period_in_days)
+    pay_period_hsa_employer_contribution = self._annual_hsa_employer_contribution / periods_per_year
     pay_period_net -= pay_period_hsa_employer_contribution
-    self.__deposit_to_first_hsa(is_print_day, pay_period_hsa_employer_contribution, accounts)
     # Federal Tax
-    annual_federal_tax = FinancialCalculator.calculate_federal_tax(is_married, self._annual_gross_income)
-    pay_period_federal_tax = annual_federal_tax / (365 / payment_period_in_days)
+    annual_federal_tax = federal_tax_table.get_tax(self._annual_gross_income)
+    pay_period_federal_tax = annual_federal_tax / periods_per_year
     pay_period_net -= pay_period_federal_tax
-    InternalRevenueService.give(pay_period_federal_tax)
-    annual_federal_income_tax_record.add_tax_paid(pay_period_federal_tax)
     # State Tax
     pay_period_state_tax = pay_period_gross * (self._state_tax_percentage / 100)
     pay_period_net -= pay_period_state_tax
-    StateGovernment.give(pay_period_state_tax)
     # City Tax
     pay_period_city_tax = pay_period_gross * (self._city_tax_percentage / 100)
     pay_period_net -= pay_period_city_tax
-    CityGovernment.give(pay_period_city_tax)
     # Social Security
     annual_social_security = self._annual_gross_income * 0.062
     if annual_social_security > 10453.2:
-      pay_period_social_security = 10453.2 / (365 / payment_period_in_days)
+      pay_period_social_security = 10453.2 / periods_per_year
     else:
-      pay_period_social_security = annual_social_security / (365 / payment_period_in_days)
+      pay_period_social_security = annual_social_security / periods_per_year
     pay_period_net -= pay_period_social_security
-    DepartmentOfSocialSecurity.give(pay_period_social_security)
     # Medicare
     if self._annual_gross_income > 200000:
-      pay_period_medicare_tax = ((self._annual_gross_income - 200000) * 0.009) / (365 / payment_period_in_days)
+      pay_period_medicare_tax = ((self._annual_gross_income - 200000) * 0.009) / periods_per_year
     else:
-      pay_period_medicare_tax = (self._annual_gross_income * 0.0145) / (365 / payment_period_in_days)
+      pay_period_medicare_tax = (self._annual_gross_income * 0.0145) / periods_per_year
     pay_period_net -= pay_period_medicare_tax
-    UsTreasury.give(pay_period_medicare_tax)
-    return pay_period_net
+    return Paycheck(
+      gross=pay_period_gross,
+      health_insurance_premium=pay_period_health_insurance_premium,
+      fourk_contribution=pay_period_fourk_contribution,
+      fourk_employer_contribution=pay_period_fourk_employer_contribution,
+      hsa_contribution=pay_period_hsa_contribution,
+      hsa_employer_contribution=pay_period_hsa_employer_contribution,
+      federal_tax=pay_period_federal_tax,
+      state_tax=pay_period_state_tax,
+      city_tax=pay_period_city_tax,
+      social_security=pay_period_social_security,
+      medicare_tax=pay_period_medicare_tax,
+      net=pay_period_net
+    )
+
+  def __post_paycheck(self, is_print_day: bool, paycheck: Paycheck, accounts: List[Account]) -> None:
+    self._ledger.get_employer().take(paycheck.gross)
+    self._ledger.get_healthcare_provider().give(paycheck.health_insurance_premium)
+    self.__deposit_to_first_fourk(is_print_day, paycheck.fourk_contribution, accounts)
+    self._ledger.get_employer().take(paycheck.fourk_employer_contribution)
+    self.__deposit_to_first_fourk(is_print_day, paycheck.fourk_employer_contribution, accounts)
+    self.__deposit_to_first_hsa(is_print_day, paycheck.hsa_contribution, accounts)
+    self.__deposit_to_first_hsa(is_print_day, paycheck.hsa_employer_contribution, accounts)
+    self._ledger.get_internal_revenue_service().give(paycheck.federal_tax)
+    self._ledger.get_state_government().give(paycheck.state_tax)
+    self._ledger.get_city_government().give(paycheck.city_tax)
+    self._ledger.get_department_of_social_security().give(paycheck.social_security)
+    self._ledger.get_us_treasury().give(paycheck.medicare_tax)
 
   def __deposit_to_first_fourk(self, is_print_day: bool, payout: float, accounts: List[Account]) -> None:
     for account in accounts:
@@ -355,7 +333,7 @@ class IncomeStream:
         account.deposit(payout)
         break
     if is_print_day:
-      print(f"  {self._name} 401k Payout: \033[38;2;0;255;0m+${payout:,.2f}\033[0m")
+      self._output_sink.payout(self._name, payout, AccountType.FOURK)
 
   def __deposit_to_first_hsa(self, is_print_day: bool, payout: float, accounts: List[Account]) -> None:
     for account in accounts:
@@ -363,4 +341,4 @@ class IncomeStream:
         account.deposit(payout)
         break
     if is_print_day:
-      print(f"  {self._name} HSA Payout: \033[38;2;0;255;0m+${payout:,.2f}\033[0m")
+      self._output_sink.payout(self._name, payout, AccountType.HSA)
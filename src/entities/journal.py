@@ -0,0 +1,28 @@
+class Journal:
+  """
+  Double-entry running totals for one run. Every transfer moves money between a counterparty and
+  a user account (or between two of either), and both sides post their change here, so money was
+  neither created nor lost exactly when the two totals cancel. Checking that is one addition
+  rather than a fresh sum over every account and counterparty.
+  """
+  _counterparty_change: float
+  _user_change: float
+
+  def __init__(self):
+    self._counterparty_change = 0.0
+    self._user_change = 0.0
+
+  def post_counterparty(self, amount: float) -> None:
+    self._counterparty_change += amount
+
+  def post_user(self, amount: float) -> None:
+    self._user_change += amount
+
+  def get_counterparty_change(self) -> float:
+    return self._counterparty_change
+
+  def get_user_change(self) -> float:
+    return self._user_change
+
+  def get_imbalance(self) -> float:
+    return self._counterparty_change + self._user_change
@@ -0,0 +1,84 @@
+from entities.external_entities.bank import Bank
+from entities.external_entities.biller import Biller
+from entities.external_entities.buyer import Buyer
+from entities.external_entities.city_government import CityGovernment
+from entities.external_entities.debtor import Debtor
+from entities.external_entities.department_of_social_security import DepartmentOfSocialSecurity
+from entities.external_entities.employer import Employer
+from entities.external_entities.healthcare_provider import HealthcareProvider
+from entities.external_entities.internal_revenue_service import InternalRevenueService
+from entities.external_entities.state_government import StateGovernment
+from entities.external_entities.stock_market import StockMarket
+from entities.external_entities.us_treasury import UsTreasury
+from entities.journal import Journal
+
+
+class Ledger:
+  """Owns every counterparty balance for a single simulation run, and the journal they all post to."""
+  _journal: Journal
+  _bank: Bank
+  _biller: Biller
+  _buyer: Buyer
+  _city_government: CityGovernment
+  _debtor: Debtor
+  _department_of_social_security: DepartmentOfSocialSecurity
+  _employer: Employer
+  _healthcare_provider: HealthcareProvider
+  _internal_revenue_service: InternalRevenueService
+  _state_government: StateGovernment
+  _stock_market: StockMarket
+  _us_treasury: UsTreasury
+
+  def __init__(self):
+    self._journal = Journal()
+    self._bank = Bank(self._journal)
+    self._biller = Biller(self._journal)
+    self._buyer = Buyer(self._journal)
+    self._city_government = CityGovernment(self._journal)
+    self._debtor = Debtor(self._journal)
+    self._department_of_social_security = DepartmentOfSocialSecurity(self._journal)
+    self._employer = Employer(self._journal)
+    self._healthcare_provider = HealthcareProvider(self._journal)
+    self._internal_revenue_service = InternalRevenueService(self._journal)
+    self._state_government = StateGovernment(self._journal)
+    self._stock_market = StockMarket(self._journal)
+    self._us_treasury = UsTreasury(self._journal)
+
+  def get_journal(self) -> Journal:
+    return self._journal
+
+  def get_bank(self) -> Bank:
+    return self._bank
+
+  def get_biller(self) -> Biller:
+    return self._biller
+
+  def get_buyer(self) -> Buyer:
+    return self._buyer
+
+  def get_city_government(self) -> CityGovernment:
+    return self._city_government
+
+  def get_debtor(self) -> Debtor:
+    return self._debtor
+
+  def get_department_of_social_security(self) -> DepartmentOfSocialSecurity:
+    return self._department_of_social_security
+
+  def get_employer(self) -> Employer:
+    return self._employer
+
+  def get_healthcare_provider(self) -> HealthcareProvider:
+    return self._healthcare_provider
+
+  def get_internal_revenue_service(self) -> InternalRevenueService:
+    return self._internal_revenue_service
+
+  def get_state_government(self) -> StateGovernment:
+    return self._state_government
+
+  def get_stock_market(self) -> StockMarket:
+    return self._stock_market
+
+  def get_us_treasury(self) -> UsTreasury:
+    return self._us_treasury
@@ -0,0 +1,30 @@
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from models.enums.account_type import AccountType
+
+
+class AgeMilestones:
+  """
+  The days the owner turns 59½ and 65, worked out once from the date of birth. Until the first,
+  401k and Roth IRA withdrawals carry a 10% penalty; until the second, HSA withdrawals carry 20%.
+  """
+  _fourk_penalty_end_date: date
+  _hsa_penalty_end_date: date
+
+  def __init__(self, dob: date):
+    # Same as comparing relativedelta(today, dob) in whole months, leap-day birthdays included
+    self._fourk_penalty_end_date = dob + relativedelta(years=59, months=6)
+    self._hsa_penalty_end_date = dob + relativedelta(years=65)
+
+  def get_fourk_penalty_end_date(self) -> date:
+    return self._fourk_penalty_end_date
+
+  def get_hsa_penalty_end_date(self) -> date:
+    return self._hsa_penalty_end_date
+
+  def get_penalty_rate(self, account_type: AccountType, today: date) -> float:
+    if account_type == AccountType.FOURK or account_type == AccountType.ROTH_IRA:
+      return 0.1 if today < self._fourk_penalty_end_date else 0.0
+    if account_type == AccountType.HSA:
+      return 0.2 if today < self._hsa_penalty_end_date else 0.0
+    return 0.0
@@ -1,4 +1,4 @@
-from services.financial_calculator import FinancialCalculator
+from services.federal_tax_table import FederalTaxTable
 
 
 class AnnualFederalIncomeTaxRecord:
@@ -11,8 +11,8 @@ class AnnualFederalIncomeTaxRecord:
   def get_tax_paid(self) -> float:
     return self.__tax_paid
 
-  def get_annual_tax_returns(self, is_married: bool) -> float:
-    tax_owed = FinancialCalculator.calculate_federal_tax(is_married, self.__income)
+  def get_annual_tax_returns(self, federal_tax_table: FederalTaxTable) -> float:
+    tax_owed = federal_tax_table.get_tax(self.__income)
     tax_return = self.__tax_paid - tax_owed
     return tax_return
 
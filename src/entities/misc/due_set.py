@@ -0,0 +1,41 @@
+from datetime import date
+from typing import List
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+
+
+class DueSet:
+  """
+  The incomes that pay, debts that accrue or charge and bills that charge today, each asked once
+  right after the day's lifecycle checks. Handlers, section headers and the shuffle read these
+  lists instead of asking the entities again. Nothing before the payments phase can change
+  whether a debt or bill charges, so their amounts are still read when they are paid.
+  """
+  _paying_incomes: List[IncomeStream]
+  _accruing_debts: List[Debt]
+  _charging_debts: List[Debt]
+  _charging_bills: List[Bill]
+
+  def __init__(self, today: date, bills: List[Bill], debts: List[Debt], incomes: List[IncomeStream]):
+    self._paying_incomes = [income for income in incomes if income.is_payment_today(today)]
+    self._accruing_debts = []
+    self._charging_debts = []
+    for debt in debts:
+      if debt.is_interest_today(today):
+        self._accruing_debts.append(debt)
+      if debt.is_charge_today(today):
+        self._charging_debts.append(debt)
+    self._charging_bills = [bill for bill in bills if bill.is_charge_today(today)]
+
+  def get_paying_incomes(self) -> List[IncomeStream]:
+    return self._paying_incomes
+
+  def get_accruing_debts(self) -> List[Debt]:
+    return self._accruing_debts
+
+  def get_charging_debts(self) -> List[Debt]:
+    return self._charging_debts
+
+  def get_charging_bills(self) -> List[Bill]:
+    return self._charging_bills
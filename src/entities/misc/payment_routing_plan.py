@@ -0,0 +1,252 @@
+from datetime import date
+from typing import Dict, List, Sequence, Tuple
+from entities.account import Account
+from entities.debt import Debt
+from models.enums.account_type import AccountType
+
+
+class PaymentRoutingPlan:
+  """
+  payment_order resolved once against the run's accounts: paychecks walk the resolved steps and
+  the shuffle walks precomputed (account, threshold) lists, so neither matches names per day.
+  Debts are kept sorted by rate and only re-sorted when the set of open debts changes.
+  """
+  # An entry's accounts are None for a "debt" step, whose threshold is the minimum interest rate
+  _steps: List[Tuple[List[Account] | None, float | None]]
+  _underfill_targets: List[Tuple[Account, float]]
+  _overfill_candidates: List[Tuple[Account, float]]
+  _spare_fund_candidates: List[Tuple[Account, float | None]]
+  _underfill_positions: Dict[Account, int]
+  _overfill_positions: Dict[Account, int]
+  _spare_fund_positions: Dict[Account, int]
+  _first_cash_account: Account | None
+  # Overfill and underfill within this much of a threshold is left alone, so the shuffle settles
+  _shuffle_tolerance: float
+  _prioritized_debts: List[Debt]
+
+  def __init__(
+    self,
+    payment_order: List[List],
+    shuffle_tolerance: float,
+    accounts: List[Account],
+    debts: List[Debt],
+    today: date
+  ):
+    self._steps = []
+    for current in payment_order:
+      account_name = str(current[0])
+      if account_name.lower() == "debt":
+        self._steps.append((None, current[1]))
+      else:
+        self._steps.append(([account for account in accounts if account.get_name() == account_name], current[1]))
+    self._underfill_targets = []
+    for current in payment_order:
+      if not current[1]:
+        continue
+      for account in accounts:
+        if account.get_name().lower() == str(current[0]).lower():
+          self._underfill_targets.append((account, current[1]))
+    points_of_overfill = [PaymentRoutingPlan.__get_point_of_overfill(account, payment_order) for account in accounts]
+    self._overfill_candidates = []
+    for account_type in (AccountType.CASH, AccountType.SAVINGS, AccountType.INVESTMENT):
+      for account, point_of_overfill in zip(accounts, points_of_overfill):
+        if account.get_type() == account_type and point_of_overfill:
+          self._overfill_candidates.append((account, point_of_overfill))
+    self._spare_fund_candidates = []
+    for account_type in (AccountType.CASH, AccountType.SAVINGS):
+      for account, point_of_overfill in zip(accounts, points_of_overfill):
+        if account.get_type() == account_type:
+          self._spare_fund_candidates.append((account, point_of_overfill))
+    self._underfill_positions = PaymentRoutingPlan.__get_first_positions(self._underfill_targets)
+    self._overfill_positions = PaymentRoutingPlan.__get_first_positions(self._overfill_candidates)
+    self._spare_fund_positions = PaymentRoutingPlan.__get_first_positions(self._spare_fund_candidates)
+    self._first_cash_account = next((account for account in accounts if account.get_type() == AccountType.CASH), None)
+    self._shuffle_tolerance = shuffle_tolerance
+    self.set_debts(debts, today)
+
+  def set_debts(self, debts: List[Debt], today: date) -> None:
+    """Call whenever a debt opens or closes; rates are fixed once a debt has started."""
+    self._prioritized_debts = sorted(debts, key=lambda d: d.get_interest_rate(today), reverse=True)
+
+  def get_steps(self) -> List[Tuple[List[Account] | None, float | None]]:
+    return self._steps
+
+  def get_prioritized_debts(self) -> List[Debt]:
+    return self._prioritized_debts
+
+  def get_underfill_targets(self) -> List[Tuple[Account, float]]:
+    return self._underfill_targets
+
+  def get_overfill_candidates(self) -> List[Tuple[Account, float]]:
+    return self._overfill_candidates
+
+  def get_spare_fund_candidates(self) -> List[Tuple[Account, float | None]]:
+    return self._spare_fund_candidates
+
+  def get_shuffle_tolerance(self) -> float:
+    return self._shuffle_tolerance
+
+  def shuffle(self, today: date) -> int:
+    """
+    Drains overfilled cash, savings and investment accounts down the order, then tops up
+    underfilled accounts from cash and savings; returns how many transfers were made. The whole
+    day's transfers are planned first against projected balances, then made in one batch.
+    """
+    transfers = self.__plan_transfers(today)
+    for source, target, amount in transfers:
+      target.deposit(source.withdraw(amount, today))
+    return len(transfers)
+
+  def __plan_transfers(self, today: date) -> List[Tuple[Account, Account, float]]:
+    """
+    Each transfer is the one the first-match rules pick on the balances the transfers before it
+    leave. The scans resume where the last one stopped, so a phase is one pass over its lists:
+    an earlier entry can only change if the transfer just planned touched it, and then the
+    cursor steps back to it.
+    """
+    projected_accounts: Dict[Account, Tuple[float, float]] = {}
+    transfers: List[Tuple[Account, Account, float]] = []
+    self.__plan_draining_overfilled_accounts(projected_accounts, transfers, today)
+    self.__plan_filling_underfilled_accounts(projected_accounts, transfers, today)
+    return transfers
+
+  def __plan_draining_overfilled_accounts(
+    self,
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    transfers: List[Tuple[Account, Account, float]],
+    today: date
+  ) -> None:
+    overfill_cursor = 0
+    underfill_cursor = 0
+    while True:
+      overfill_cursor, source, overfill = self.__find_overfilled_account(projected_accounts, overfill_cursor)
+      if not source:
+        return
+      underfill_cursor, target, _ = self.__find_underfilled_account(projected_accounts, underfill_cursor)
+      if not target:
+        target = self.get_first_cash_account()
+      if source == target:
+        return
+      PaymentRoutingPlan.__project_transfer(projected_accounts, source, target, overfill, today)
+      transfers.append((source, target, overfill))
+      overfill_cursor = min(overfill_cursor, self._overfill_positions.get(target, overfill_cursor))
+      underfill_cursor = min(underfill_cursor, self._underfill_positions.get(source, underfill_cursor))
+
+  def __plan_filling_underfilled_accounts(
+    self,
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    transfers: List[Tuple[Account, Account, float]],
+    today: date
+  ) -> None:
+    underfill_cursor = 0
+    spare_fund_cursor = 0
+    while True:
+      underfill_cursor, target, amount_missing = self.__find_underfilled_account(projected_accounts, underfill_cursor)
+      if not target:
+        return
+      spare_fund_cursor, source, amount_spare = self.__find_account_with_spare_funds(
+        projected_accounts,
+        spare_fund_cursor,
+        today
+      )
+      if not source:
+        return
+      if source == target:
+        return
+      amount = min(amount_spare, amount_missing)
+      if amount <= 0:
+        # An empty uncapped source; nothing more can move
+        return
+      PaymentRoutingPlan.__project_transfer(projected_accounts, source, target, amount, today)
+      transfers.append((source, target, amount))
+      underfill_cursor = min(underfill_cursor, self._underfill_positions.get(source, underfill_cursor))
+      spare_fund_cursor = min(spare_fund_cursor, self._spare_fund_positions.get(target, spare_fund_cursor))
+
+  def __find_overfilled_account(
+    self,
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    start: int
+  ) -> Tuple[int, Account | None, float]:
+    for position in range(start, len(self._overfill_candidates)):
+      account, point_of_overfill = self._overfill_candidates[position]
+      overfill = PaymentRoutingPlan.__get_projected_balance(projected_accounts, account) - point_of_overfill
+      if overfill > self._shuffle_tolerance:
+        return position, account, overfill
+    return len(self._overfill_candidates), None, 0.0
+
+  def __find_underfilled_account(
+    self,
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    start: int
+  ) -> Tuple[int, Account | None, float]:
+    for position in range(start, len(self._underfill_targets)):
+      account, point_of_overfill = self._underfill_targets[position]
+      amount_missing = point_of_overfill - PaymentRoutingPlan.__get_projected_balance(projected_accounts, account)
+      if amount_missing > self._shuffle_tolerance:
+        return position, account, amount_missing
+    return len(self._underfill_targets), None, 0.0
+
+  def __find_account_with_spare_funds(
+    self,
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    start: int,
+    today: date
+  ) -> Tuple[int, Account | None, float]:
+    for position in range(start, len(self._spare_fund_candidates)):
+      account, point_of_overfill = self._spare_fund_candidates[position]
+      if not point_of_overfill:
+        if account not in projected_accounts:
+          return position, account, account.get_post_tax_balance(today)
+        balance, untaxed_gains = projected_accounts[account]
+        return position, account, account.get_projected_post_tax_balance(balance, untaxed_gains, today)
+      overfill = PaymentRoutingPlan.__get_projected_balance(projected_accounts, account) - point_of_overfill
+      if overfill > self._shuffle_tolerance:
+        return position, account, overfill
+    return len(self._spare_fund_candidates), None, 0.0
+
+  @staticmethod
+  def __get_projected_balance(projected_accounts: Dict[Account, Tuple[float, float]], account: Account) -> float:
+    if account not in projected_accounts:
+      return account.get_balance()
+    return projected_accounts[account][0]
+
+  @staticmethod
+  def __project_transfer(
+    projected_accounts: Dict[Account, Tuple[float, float]],
+    source: Account,
+    target: Account,
+    amount: float,
+    today: date
+  ) -> None:
+    """Account.withdraw then Account.deposit, on the projected balances and untaxed gains."""
+    balance, untaxed_gains = projected_accounts.get(source, (source.get_balance(), source.get_untaxed_gains()))
+    capital_gains_tax, income_tax, penalty = source.get_withdrawal_taxes(amount, untaxed_gains, today)
+    amount_with_tax = amount + capital_gains_tax + income_tax + penalty
+    projected_accounts[source] = (balance - amount_with_tax, untaxed_gains - capital_gains_tax)
+    balance, untaxed_gains = projected_accounts.get(target, (target.get_balance(), target.get_untaxed_gains()))
+    projected_accounts[target] = (balance + amount, untaxed_gains)
+
+  def get_first_cash_account(self) -> Account:
+    if self._first_cash_account is None:
+      raise RuntimeError("Must provide at least 1 cash account.")
+    return self._first_cash_account
+
+  @staticmethod
+  def __get_point_of_overfill(account: Account, payment_order: List[List]) -> float | None:
+    highest_point_of_overfill = 0.0
+    for current in payment_order:
+      if not account.get_name().lower() == str(current[0]).lower():
+        continue
+      if current[1] is None:
+        return None
+      highest_point_of_overfill = max(highest_point_of_overfill, current[1])
+    if highest_point_of_overfill == 0.0:
+      return None
+    return highest_point_of_overfill
+
+  @staticmethod
+  def __get_first_positions(entries: Sequence[Tuple[Account, float | None]]) -> Dict[Account, int]:
+    positions: Dict[Account, int] = {}
+    for position, (account, _) in enumerate(entries):
+      positions.setdefault(account, position)
+    return positions
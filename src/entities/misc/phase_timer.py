@@ -0,0 +1,50 @@
+import time
+from typing import Dict, List
+from models.enums.simulation_phase import SimulationPhase
+from models.results.phase_timing import PhaseTiming
+
+
+class PhaseTimer:
+  """
+  Accumulates wall time and call counts per stage of the day loop. Used as a context manager
+  around each stage; phases never nest, so a single start time is enough. A disabled timer
+  skips the clock reads entirely.
+  """
+  _is_enabled: bool
+  _seconds: Dict[SimulationPhase, float]
+  _calls: Dict[SimulationPhase, int]
+  _phase: SimulationPhase | None
+  _started: float
+
+  def __init__(self, is_enabled: bool = True):
+    self._is_enabled = is_enabled
+    self._seconds = {}
+    self._calls = {}
+    self._phase = None
+    self._started = 0.0
+
+  def is_enabled(self) -> bool:
+    return self._is_enabled
+
+  def measure(self, phase: SimulationPhase) -> "PhaseTimer":
+    self._phase = phase
+    return self
+
+  def __enter__(self) -> None:
+    if self._is_enabled:
+      self._started = time.perf_counter()
+
+  def __exit__(self, *_) -> None:
+    if not self._is_enabled:
+      return
+    elapsed = time.perf_counter() - self._started
+    assert self._phase
+    self._seconds[self._phase] = self._seconds.get(self._phase, 0.0) + elapsed
+    self._calls[self._phase] = self._calls.get(self._phase, 0) + 1
+
+  def get_timings(self) -> List[PhaseTiming]:
+    return [
+      PhaseTiming(phase=phase, seconds=self._seconds[phase], calls=self._calls[phase])
+      for phase in SimulationPhase
+      if phase in self._calls
+    ]
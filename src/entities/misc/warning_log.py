@@ -0,0 +1,36 @@
+from datetime import date
+from typing import List
+from models.results.simulation_warning import SimulationWarning
+
+
+class WarningLog:
+  """Prompts on each warning interactively, or records it against the current day when headless."""
+  _is_headless: bool
+  _today: date
+  _warnings: List[SimulationWarning]
+
+  def __init__(self, today: date, is_headless: bool = False):
+    self._is_headless = is_headless
+    self._today = today
+    self._warnings = []
+
+  def is_headless(self) -> bool:
+    return self._is_headless
+
+  def set_today(self, today: date) -> None:
+    self._today = today
+
+  def get_warnings(self) -> List[SimulationWarning]:
+    return self._warnings
+
+  def warn(self, action: str, subject: str, reason: str) -> None:
+    if self._is_headless:
+      self._warnings.append(SimulationWarning(date=self._today, message=f"{action} {subject} {reason}"))
+    else:
+      input(f"\n\033[38;2;255;0;0mWARNING:\033[0m {action} \033[38;2;255;0;0m{subject}\033[0m {reason}")
+
+  def pause(self, prompt: str) -> None:
+    if self._is_headless:
+      return
+    print(prompt)
+    input("\nPress enter to continue...\n")
@@ -0,0 +1,2 @@
+class IncompatibleCheckpointException(Exception):
+  pass
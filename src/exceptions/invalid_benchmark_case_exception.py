@@ -0,0 +1,2 @@
+class InvalidBenchmarkCaseException(Exception):
+  pass
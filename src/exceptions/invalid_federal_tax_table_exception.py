@@ -0,0 +1,2 @@
+class InvalidFederalTaxTableException(Exception):
+  pass
@@ -0,0 +1,2 @@
+class InvalidScenarioForkException(Exception):
+  pass
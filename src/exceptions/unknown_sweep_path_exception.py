@@ -0,0 +1,2 @@
+class UnknownSweepPathException(Exception):
+  pass
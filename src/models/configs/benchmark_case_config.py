@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class BenchmarkCaseConfig:
+  name: str
+  horizon_years: int
+  accounts: int | None
+  bills: int | None
+  debts: int | None
+  incomes: int | None
+  event_driven: bool | None
+  vectorized_accounts: bool | None
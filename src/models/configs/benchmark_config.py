@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+from models.configs.benchmark_case_config import BenchmarkCaseConfig
+
+
+@dataclass
+class BenchmarkConfig:
+  base: str
+  start_date: date
+  repeat: int
+  event_driven: bool
+  vectorized_accounts: bool
+  cases: List[BenchmarkCaseConfig]
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import List
+from models.configs.federal_tax_year_config import FederalTaxYearConfig
+
+
+@dataclass
+class FederalTaxConfig:
+  annual_inflation_percentage: float | None
+  years: List[FederalTaxYearConfig]
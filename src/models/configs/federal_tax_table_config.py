@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+@dataclass
+class FederalTaxTableConfig:
+  standard_deduction: float
+  brackets: List[Tuple[float, float]]  # (lower bound of taxable income, rate percentage), ascending
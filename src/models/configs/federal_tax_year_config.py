@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from models.configs.federal_tax_table_config import FederalTaxTableConfig
+
+
+@dataclass
+class FederalTaxYearConfig:
+  year: int
+  single: FederalTaxTableConfig
+  married: FederalTaxTableConfig
@@ -5,6 +5,7 @@ from models.configs.account_config import AccountConfig
 from models.configs.asset_config import AssetConfig
 from models.configs.bill_config import BillConfig
 from models.configs.debt_config import DebtConfig
+from models.configs.federal_tax_config import FederalTaxConfig
 from models.configs.income_stream_config import IncomeStreamConfig
 from models.configs.output_config import OutputConfig
 
@@ -13,6 +14,7 @@ from models.configs.output_config import OutputConfig
 class FullConfig:
   married: bool | int
   payment_order: List[List]
+  shuffle_tolerance: float
   accounts: List[AccountConfig]
   bills: List[BillConfig]
   debts: List[DebtConfig]
@@ -20,3 +22,4 @@ class FullConfig:
   assets: List[AssetConfig]
   dob: date
   output: OutputConfig
+  federal_tax: FederalTaxConfig
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from typing import Any, List
+
+
+@dataclass
+class SweepAxisConfig:
+  path: List[str | int]
+  values: List[Any]
+  is_scale: bool
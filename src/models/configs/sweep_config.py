@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+from models.configs.sweep_axis_config import SweepAxisConfig
+
+
+@dataclass
+class SweepConfig:
+  base: str
+  axes: List[SweepAxisConfig]
+  max_workers: int | None
+  event_driven: bool
+  fork_date: date | None
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class OutputEventType(Enum):
+  CHARGE = "charge"
+  INFLATION_ADJUSTMENT = "inflation_adjustment"
+  PAYOUT = "payout"
+  ALLOCATION = "allocation"
+  INTEREST = "interest"
+  APPRECIATION = "appreciation"
+  TAX_DAY = "tax_day"
+  ASSET_SALE = "asset_sale"
+  DAILY_SUMMARY = "daily_summary"
+  BANKRUPTCY = "bankruptcy"
+  TOTALS = "totals"
@@ -0,0 +1,17 @@
+from enum import Enum
+
+
+class SimulationPhase(Enum):
+  ACCRUALS = "accruals"
+  CIRCULATION_CHECK = "circulation_check"
+  LIFECYCLE = "lifecycle"
+  INCOME = "income"
+  APPRECIATION = "appreciation"
+  INTEREST = "interest"
+  CAPITAL_GAINS = "capital_gains"
+  INFLATION = "inflation"
+  PAYMENTS = "payments"
+  TAX_DAY = "tax_day"
+  SHUFFLE = "shuffle"
+  OUTPUT = "output"
+  SCHEDULING = "scheduling"
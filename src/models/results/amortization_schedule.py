@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+
+
+@dataclass
+class AmortizationSchedule:
+  payment: float
+  dates: List[date]
+  payments: List[float]
+  interest: List[float]
+  principal: List[float]
+  balances: List[float]
+  total_interest: float
+  payoff_date: date | None
@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+from models.results.phase_timing import PhaseTiming
+
+
+@dataclass
+class BenchmarkCaseResult:
+  name: str
+  simulated_days: int
+  bankruptcy_date: date | None
+  total_seconds: float
+  phase_timings: List[PhaseTiming]
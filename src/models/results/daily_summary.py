@@ -0,0 +1,16 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, Tuple
+
+
+@dataclass
+class DailySummary:
+  date: date
+  total_debt_balance: float
+  debt_balances: List[Tuple[str, float]]
+  total_account_balance: float
+  account_balances: List[Tuple[str, float]]
+  total_sellable_assets_value: float
+  total_assets_value: float
+  asset_values: List[Tuple[str, float, bool]]
+  net_worth: float
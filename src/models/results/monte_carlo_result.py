@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Dict, List
+
+
+@dataclass
+class MonteCarloResult:
+  paths: int
+  dates: List[date]
+  bankruptcy_probability: float
+  cumulative_bankruptcy_probability: List[float]
+  net_worth_percentiles: Dict[int, List[float]]
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class Paycheck:
+  gross: float
+  health_insurance_premium: float
+  fourk_contribution: float
+  fourk_employer_contribution: float
+  hsa_contribution: float
+  hsa_employer_contribution: float
+  federal_tax: float
+  state_tax: float
+  city_tax: float
+  social_security: float
+  medicare_tax: float
+  net: float
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+from models.enums.simulation_phase import SimulationPhase
+
+
+@dataclass
+class PhaseTiming:
+  phase: SimulationPhase
+  seconds: float
+  calls: int
@@ -0,0 +1,38 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List, TYPE_CHECKING
+from entities.account import Account
+from entities.asset import Asset
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+from entities.ledger import Ledger
+from entities.misc.annual_federal_income_tax_record import AnnualFederalIncomeTaxRecord
+from services.event_scheduler import EventScheduler
+
+if TYPE_CHECKING:
+  from entities.account_store import AccountStore
+
+
+@dataclass
+class SimulationCheckpoint:
+  """Everything a Simulator carries from one day to the next, as of the start of `today`."""
+  start_date: date
+  today: date
+  last_day: date
+  last_output_date: date
+  is_married: bool
+  year_married: int
+  ledger: Ledger
+  starting_employer_balance: float
+  starting_stock_market_balance: float
+  shuffle_transfer_count: int
+  accounts: List[Account]
+  account_store: "AccountStore | None"
+  bills: List[Bill]
+  debts: List[Debt]
+  incomes: List[IncomeStream]
+  assets: List[Asset]
+  current_years_annual_federal_tax_income_record: AnnualFederalIncomeTaxRecord
+  last_years_annual_federal_tax_income_record: AnnualFederalIncomeTaxRecord
+  scheduler: EventScheduler | None
@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import List
+from models.results.phase_timing import PhaseTiming
+from models.results.simulation_warning import SimulationWarning
+
+
+@dataclass
+class SimulationResult:
+  start_date: date
+  end_date: date
+  bankruptcy_date: date | None
+  money_needed: float
+  final_net_worth: float
+  obtained_from_employers: float
+  obtained_from_stock_market: float
+  shuffle_transfer_count: int
+  warnings: List[SimulationWarning]
+  phase_timings: List[PhaseTiming]
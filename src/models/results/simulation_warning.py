@@ -0,0 +1,8 @@
+from dataclasses import dataclass
+from datetime import date
+
+
+@dataclass
+class SimulationWarning:
+  date: date
+  message: str
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Dict
+
+
+@dataclass
+class SweepScenarioResult:
+  index: int
+  overrides: Dict[str, Any]
+  bankruptcy_date: date | None
+  final_net_worth: float
+  warning_count: int
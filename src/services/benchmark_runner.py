@@ -0,0 +1,146 @@
+import copy
+import json
+import platform
+import time
+from typing import Any, Dict, Iterator, List
+from dateutil.relativedelta import relativedelta
+from entities.ledger import Ledger
+from entities.misc.phase_timer import PhaseTimer
+from exceptions.invalid_benchmark_case_exception import InvalidBenchmarkCaseException
+from models.configs.benchmark_case_config import BenchmarkCaseConfig
+from models.configs.benchmark_config import BenchmarkConfig
+from models.results.benchmark_case_result import BenchmarkCaseResult
+from services.config_builder import ConfigBuilder
+from services.simulator import Simulator
+
+
+class BenchmarkRunner:
+  """
+  Times the engine on fixed configs of increasing size. Each case is derived from the base
+  config by cloning its accounts, bills, debts and income streams up to the requested counts
+  and by running it for a fixed horizon from a fixed start date, so results are comparable
+  across commits and machines.
+  """
+  _benchmark_config: BenchmarkConfig
+  _base_config: dict
+
+  def __init__(self, benchmark_config: BenchmarkConfig):
+    self._benchmark_config = benchmark_config
+    self._base_config = ConfigBuilder.load_raw(benchmark_config.base)
+
+  def run(self) -> Iterator[BenchmarkCaseResult]:
+    """Yields the fastest of `repeat` runs for each case, in config order."""
+    for case in self._benchmark_config.cases:
+      yaml_config = self.__build_case_config(case)
+      best: BenchmarkCaseResult | None = None
+      for _ in range(self._benchmark_config.repeat):
+        result = self.__run_case(case, yaml_config)
+        if best is None or result.total_seconds < best.total_seconds:
+          best = result
+      assert best
+      yield best
+
+  @staticmethod
+  def write_baseline(path: str, results: List[BenchmarkCaseResult]) -> None:
+    baseline = {
+      "python": platform.python_version(),
+      "cases": {
+        result.name: {
+          "simulated_days": result.simulated_days,
+          "bankruptcy_date": result.bankruptcy_date.isoformat() if result.bankruptcy_date else None,
+          "total_seconds": result.total_seconds,
+          "phases": {
+            timing.phase.value: {"seconds": timing.seconds, "calls": timing.calls}
+            for timing in result.phase_timings
+          }
+        }
+        for result in results
+      }
+    }
+    with open(path, "w", encoding="utf-8") as file:
+      json.dump(baseline, file, indent=2)
+      file.write("\n")
+
+  @staticmethod
+  def load_baseline(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as file:
+      return json.load(file)["cases"]
+
+  def __run_case(self, case: BenchmarkCaseConfig, yaml_config: dict) -> BenchmarkCaseResult:
+    full_config = ConfigBuilder.build(yaml_config)
+    start_date = self._benchmark_config.start_date
+    event_driven = self._benchmark_config.event_driven if case.event_driven is None else case.event_driven
+    vectorized_accounts = self._benchmark_config.vectorized_accounts
+    if case.vectorized_accounts is not None:
+      vectorized_accounts = case.vectorized_accounts
+    phase_timer = PhaseTimer()
+    started = time.perf_counter()
+    result = Simulator(
+      full_config,
+      start_date,
+      Ledger(),
+      event_driven=event_driven,
+      quiet=True,
+      headless=True,
+      vectorized_accounts=vectorized_accounts,
+      phase_timer=phase_timer
+    ).run()
+    total_seconds = time.perf_counter() - started
+    return BenchmarkCaseResult(
+      name=case.name,
+      simulated_days=(result.end_date - start_date).days + 1,
+      bankruptcy_date=result.bankruptcy_date,
+      total_seconds=total_seconds,
+      phase_timings=phase_timer.get_timings()
+    )
+
+  def __build_case_config(self, case: BenchmarkCaseConfig) -> dict:
+    yaml_config = copy.deepcopy(self._base_config)
+    start_date = self._benchmark_config.start_date
+    end_date = start_date + relativedelta(years=case.horizon_years)
+    output = yaml_config["output"]
+    output["pause_on_output"] = False
+    output["start_date"] = {"month": start_date.month, "day": start_date.day, "year": start_date.year}
+    output["end_date"] = {"month": end_date.month, "day": end_date.day, "year": end_date.year}
+    if case.accounts is not None:
+      yaml_config["accounts"] = BenchmarkRunner.__scale_accounts(yaml_config["accounts"], case.accounts, case.name)
+    if case.bills is not None:
+      yaml_config["bills"] = BenchmarkRunner.__scale_items(yaml_config["bills"], case.bills, case.name)
+    if case.debts is not None:
+      yaml_config["debts"] = BenchmarkRunner.__scale_items(yaml_config["debts"], case.debts, case.name)
+    if case.incomes is not None:
+      yaml_config["income"] = BenchmarkRunner.__scale_items(yaml_config["income"], case.incomes, case.name)
+    return yaml_config
+
+  @staticmethod
+  def __scale_accounts(accounts: List[dict], count: int, case_name: str) -> List[dict]:
+    # Every cash, savings and investment account has to appear in payment_order, so only
+    # retirement accounts are cloned; the originals are all kept for the same reason.
+    if count < len(accounts):
+      raise InvalidBenchmarkCaseException(
+        f"Benchmark case {case_name!r} asks for {count} accounts but the base config already has {len(accounts)}"
+      )
+    retirement_accounts = [account for account in accounts if account["type"] in ("fourk", "roth_ira", "hsa")]
+    if count > len(accounts) and not retirement_accounts:
+      raise InvalidBenchmarkCaseException(f"Benchmark case {case_name!r} needs a retirement account to clone")
+    extra_accounts: List[dict] = []
+    for index in range(count - len(accounts)):
+      account = copy.deepcopy(retirement_accounts[index % len(retirement_accounts)])
+      account["name"] = f"{account['name']} (clone {index + 1})"
+      extra_accounts.append(account)
+    return accounts + extra_accounts
+
+  @staticmethod
+  def __scale_items(items: List[dict], count: int, case_name: str) -> List[dict]:
+    if count and not items:
+      raise InvalidBenchmarkCaseException(f"Benchmark case {case_name!r} has nothing to clone {count} items from")
+    scaled_items: List[dict] = []
+    for index in range(count):
+      item = copy.deepcopy(items[index % len(items)])
+      copy_number = index // len(items)
+      if copy_number:
+        item["name"] = f"{item['name']} #{copy_number + 1}"
+        if item.get("asset"):
+          item["asset"]["name"] = f"{item['asset']['name']} #{copy_number + 1}"
+      scaled_items.append(item)
+    return scaled_items
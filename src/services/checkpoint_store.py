@@ -0,0 +1,103 @@
+from datetime import date, timedelta
+import gzip
+import io
+import os
+import pickle
+from typing import Any
+from entities.misc.warning_log import WarningLog
+from exceptions.incompatible_checkpoint_exception import IncompatibleCheckpointException
+from models.enums.time_period_type import TimePeriodType
+from models.results.simulation_checkpoint import SimulationCheckpoint
+from services.output_sink import OutputSink
+
+
+class CheckpointStore:
+  """
+  Serializes SimulationCheckpoints as a pickle preceded by FORMAT_VERSION, and keeps them in a
+  directory gzipped and named by the day they were taken. The output sink and warning log that
+  every entity points at belong to the run rather than to its state, so they are stored as
+  references and rebound to the resuming run's own on deserialize.
+  """
+  # Bump whenever an entity's attributes or SimulationCheckpoint change shape
+  FORMAT_VERSION = 3
+  FILE_SUFFIX = ".checkpoint"
+  __OUTPUT_SINK_ID = "output_sink"
+  __WARNING_LOG_ID = "warning_log"
+  _directory: str
+  _interval: TimePeriodType
+
+  def __init__(self, directory: str, interval: TimePeriodType = TimePeriodType.YEARS):
+    self._directory = directory
+    self._interval = interval
+
+  def get_next_checkpoint_date(self, today: date) -> date:
+    """The first day of the next day, week (Monday), month or year after `today`."""
+    if self._interval == TimePeriodType.DAYS:
+      return today + timedelta(days=1)
+    if self._interval == TimePeriodType.WEEKS:
+      return today + timedelta(days=7 - today.weekday())
+    if self._interval == TimePeriodType.MONTHS:
+      return date(today.year + 1, 1, 1) if today.month == 12 else date(today.year, today.month + 1, 1)
+    if self._interval == TimePeriodType.YEARS:
+      return date(today.year + 1, 1, 1)
+    raise RuntimeError("Unknown checkpoint interval")
+
+  def save(self, checkpoint: SimulationCheckpoint) -> str:
+    os.makedirs(self._directory, exist_ok=True)
+    path = os.path.join(self._directory, f"{checkpoint.today.isoformat()}{CheckpointStore.FILE_SUFFIX}")
+    # Write then rename, so a run killed mid-write never leaves a truncated latest checkpoint
+    temporary_path = f"{path}.{os.getpid()}.tmp"
+    with gzip.open(temporary_path, "wb", compresslevel=6) as checkpoint_file:
+      checkpoint_file.write(CheckpointStore.serialize(checkpoint))
+    os.replace(temporary_path, path)
+    return path
+
+  def get_latest_path(self) -> str:
+    if os.path.isdir(self._directory):
+      names = sorted(name for name in os.listdir(self._directory) if name.endswith(CheckpointStore.FILE_SUFFIX))
+      if names:
+        return os.path.join(self._directory, names[-1])
+    raise FileNotFoundError(f"No checkpoints in {self._directory}")
+
+  @staticmethod
+  def read(path: str) -> bytes:
+    """The serialized checkpoint at `path`, ready for `deserialize`."""
+    with gzip.open(path, "rb") as checkpoint_file:
+      return checkpoint_file.read()
+
+  @staticmethod
+  def serialize(checkpoint: SimulationCheckpoint) -> bytes:
+    buffer = io.BytesIO()
+    pickle.dump(CheckpointStore.FORMAT_VERSION, buffer)
+    pickler = pickle.Pickler(buffer, protocol=pickle.HIGHEST_PROTOCOL)
+    pickler.persistent_id = CheckpointStore.__get_persistent_id  # type: ignore[method-assign]
+    pickler.dump(checkpoint)
+    return buffer.getvalue()
+
+  @staticmethod
+  def deserialize(state: bytes, output_sink: OutputSink, warning_log: WarningLog) -> SimulationCheckpoint:
+    """A fresh copy of the serialized checkpoint, wired to the given output sink and warning log."""
+    references = {
+      CheckpointStore.__OUTPUT_SINK_ID: output_sink,
+      CheckpointStore.__WARNING_LOG_ID: warning_log
+    }
+    buffer = io.BytesIO(state)
+    version = pickle.load(buffer)
+    if version != CheckpointStore.FORMAT_VERSION:
+      raise IncompatibleCheckpointException(
+        f"Checkpoint has format {version}, but this version reads format {CheckpointStore.FORMAT_VERSION}"
+      )
+    unpickler = pickle.Unpickler(buffer)
+    unpickler.persistent_load = references.__getitem__  # type: ignore[assignment]
+    checkpoint = unpickler.load()
+    if not isinstance(checkpoint, SimulationCheckpoint):
+      raise IncompatibleCheckpointException("Not a simulation checkpoint")
+    return checkpoint
+
+  @staticmethod
+  def __get_persistent_id(obj: Any) -> str | None:
+    if isinstance(obj, OutputSink):
+      return CheckpointStore.__OUTPUT_SINK_ID
+    if isinstance(obj, WarningLog):
+      return CheckpointStore.__WARNING_LOG_ID
+    return None
@@ -0,0 +1,372 @@
+from datetime import date
+from typing import List
+from exceptions.invalid_federal_tax_table_exception import InvalidFederalTaxTableException
+from exceptions.unknown_account_type_exception import UnknownAccountTypeException
+from exceptions.unknown_asset_type_exception import UnknownAssetTypeException
+from exceptions.unknown_time_period_type_exception import UnknownTimePeriodTypeException
+from models.configs.account_config import AccountConfig
+from models.configs.asset_config import AssetConfig
+from models.configs.benchmark_case_config import BenchmarkCaseConfig
+from models.configs.benchmark_config import BenchmarkConfig
+from models.configs.bill_config import BillConfig
+from models.configs.debt_config import DebtConfig
+from models.configs.federal_tax_config import FederalTaxConfig
+from models.configs.federal_tax_table_config import FederalTaxTableConfig
+from models.configs.federal_tax_year_config import FederalTaxYearConfig
+from models.configs.full_config import FullConfig
+from models.configs.income_stream_config import IncomeStreamConfig
+from models.configs.output_config import OutputConfig
+from models.configs.sweep_axis_config import SweepAxisConfig
+from models.configs.sweep_config import SweepConfig
+from models.enums.account_type import AccountType
+from models.enums.asset_type import AssetType
+from models.enums.time_period_type import TimePeriodType
+
+
+class ConfigBuilder:
+  # Used when main.yml has no shuffle_tolerance: how far past an expectation an account may sit before it is shuffled
+  DEFAULT_SHUFFLE_TOLERANCE = 1000
+  # Used when main.yml has no federal_tax section: the 2025 tables, held flat in later years
+  DEFAULT_FEDERAL_TAX = {
+    "annual_inflation_percentage": None,
+    "years": [
+      {
+        "year": 2025,
+        "single": {
+          "standard_deduction": 14600,
+          "brackets": [[0, 10], [11600, 12], [47150, 22], [100525, 24], [191950, 32], [243725, 35], [609350, 37]]
+        },
+        "married": {
+          "standard_deduction": 29200,
+          "brackets": [[0, 10], [23200, 12], [94300, 22], [201050, 24], [383900, 32], [487450, 35], [731200, 37]]
+        }
+      }
+    ]
+  }
+
+  @staticmethod
+  def build_from_path(yaml_path: str) -> FullConfig:
+    return ConfigBuilder.build(ConfigBuilder.load_raw(yaml_path))
+
+  @staticmethod
+  def load_raw(yaml_path: str) -> dict:
+    with open(yaml_path, "r", encoding="utf-8") as raw_config:
+      return ConfigBuilder.parse_raw(raw_config.read())
+
+  @staticmethod
+  def parse_raw(yaml_content: str | bytes) -> dict:
+    # Deferred so runs that hit the compiled config cache never load PyYAML
+    import yaml  # pylint: disable=import-outside-toplevel
+    return yaml.safe_load(yaml_content)
+
+  @staticmethod
+  def build(yaml_config: dict) -> FullConfig:
+    dob = ConfigBuilder.__build_date(yaml_config["dob"])
+    assert dob
+    full_config = FullConfig(
+      married=yaml_config["married"],
+      payment_order=yaml_config["payment_order"],
+      shuffle_tolerance=yaml_config.get("shuffle_tolerance", ConfigBuilder.DEFAULT_SHUFFLE_TOLERANCE),
+      accounts=ConfigBuilder.__build_accounts_configs(yaml_config["accounts"]),
+      bills=ConfigBuilder.__build_bills_configs(yaml_config["bills"]),
+      debts=ConfigBuilder.__build_debts_configs(yaml_config["debts"]),
+      income=ConfigBuilder.__build_income_configs(yaml_config["income"]),
+      assets=ConfigBuilder.__build_asset_configs(yaml_config["assets"]),
+      dob=dob,
+      output=ConfigBuilder.__build_output_config(yaml_config["output"]),
+      federal_tax=ConfigBuilder.__build_federal_tax_config(
+        yaml_config.get("federal_tax", ConfigBuilder.DEFAULT_FEDERAL_TAX)
+      )
+    )
+    return full_config
+
+  @staticmethod
+  def build_sweep_config_from_path(yaml_path: str) -> SweepConfig:
+    sweep_dict = ConfigBuilder.load_raw(yaml_path)
+    return SweepConfig(
+      base=sweep_dict.get("base", "./config/prod/main.yml"),
+      axes=ConfigBuilder.__build_sweep_axis_configs(sweep_dict["axes"]),
+      max_workers=sweep_dict.get("max_workers"),
+      event_driven=sweep_dict.get("event_driven", True),
+      fork_date=ConfigBuilder.__build_date(sweep_dict.get("fork_date"))
+    )
+
+  @staticmethod
+  def build_benchmark_config_from_path(yaml_path: str) -> BenchmarkConfig:
+    benchmark_dict = ConfigBuilder.load_raw(yaml_path)
+    start_date = ConfigBuilder.__build_date(benchmark_dict["start_date"])
+    assert start_date
+    return BenchmarkConfig(
+      base=benchmark_dict.get("base", "./config/model/main.yml"),
+      start_date=start_date,
+      repeat=benchmark_dict.get("repeat", 3),
+      event_driven=benchmark_dict.get("event_driven", False),
+      vectorized_accounts=benchmark_dict.get("vectorized_accounts", False),
+      cases=ConfigBuilder.__build_benchmark_case_configs(benchmark_dict["cases"])
+    )
+
+  @staticmethod
+  def __build_benchmark_case_configs(cases_list: List[dict]) -> List[BenchmarkCaseConfig]:
+    benchmark_case_configs: List[BenchmarkCaseConfig] = []
+    for case in cases_list:
+      benchmark_case_configs.append(BenchmarkCaseConfig(
+        name=case["name"],
+        horizon_years=case["horizon_years"],
+        accounts=case.get("accounts"),
+        bills=case.get("bills"),
+        debts=case.get("debts"),
+        incomes=case.get("incomes"),
+        event_driven=case.get("event_driven"),
+        vectorized_accounts=case.get("vectorized_accounts")
+      ))
+    return benchmark_case_configs
+
+  @staticmethod
+  def __build_sweep_axis_configs(axes_list: List[dict]) -> List[SweepAxisConfig]:
+    sweep_axis_configs: List[SweepAxisConfig] = []
+    for axis in axes_list:
+      is_scale = "scale" in axis
+      if is_scale == ("values" in axis):
+        raise RuntimeError(f"Sweep axis {axis['path']} must give exactly one of \"values\" or \"scale\"")
+      sweep_axis_configs.append(SweepAxisConfig(
+        path=axis["path"],
+        values=axis["scale"] if is_scale else axis["values"],
+        is_scale=is_scale
+      ))
+    return sweep_axis_configs
+
+  @staticmethod
+  def __build_output_config(output_dict: dict) -> OutputConfig:
+    start_date = ConfigBuilder.__build_date(output_dict["start_date"])
+    end_date = ConfigBuilder.__build_date(output_dict["end_date"])
+    assert end_date
+    output_config = OutputConfig(
+      pause_on_output=output_dict["pause_on_output"],
+      every_day=output_dict["every_day"],
+      every_week=output_dict["every_week"],
+      every_month=output_dict["every_month"],
+      every_year=output_dict["every_year"],
+      every_decade=output_dict["every_decade"],
+      start_date=start_date,
+      end_date=end_date
+    )
+    return output_config
+
+  @staticmethod
+  def __build_federal_tax_config(federal_tax_dict: dict) -> FederalTaxConfig:
+    year_configs: List[FederalTaxYearConfig] = []
+    for year in federal_tax_dict["years"]:
+      year_configs.append(FederalTaxYearConfig(
+        year=year["year"],
+        single=ConfigBuilder.__build_federal_tax_table_config(year["single"], year["year"], "single"),
+        married=ConfigBuilder.__build_federal_tax_table_config(year["married"], year["year"], "married")
+      ))
+    year_configs.sort(key=lambda year_config: year_config.year)
+    if not year_configs:
+      raise InvalidFederalTaxTableException("federal_tax must list at least one year")
+    return FederalTaxConfig(
+      annual_inflation_percentage=federal_tax_dict.get("annual_inflation_percentage"),
+      years=year_configs
+    )
+
+  @staticmethod
+  def __build_federal_tax_table_config(table_dict: dict, year: int, filing_status: str) -> FederalTaxTableConfig:
+    brackets = [(lower_bound, rate) for lower_bound, rate in table_dict["brackets"]]
+    lower_bounds = [lower_bound for lower_bound, _ in brackets]
+    if not brackets or lower_bounds[0] != 0:
+      raise InvalidFederalTaxTableException(f"{year} {filing_status} brackets must start at 0")
+    if any(lower >= upper for lower, upper in zip(lower_bounds, lower_bounds[1:])):
+      raise InvalidFederalTaxTableException(f"{year} {filing_status} bracket lower bounds must be ascending")
+    return FederalTaxTableConfig(
+      standard_deduction=table_dict["standard_deduction"],
+      brackets=brackets
+    )
+
+  @staticmethod
+  def __build_accounts_configs(accounts_list: List[dict]) -> List[AccountConfig]:
+    account_configs: List[AccountConfig] = []
+    for account in accounts_list:
+      account_type = ConfigBuilder.__build_account_type(account["type"])
+      interest_period_type = ConfigBuilder.__build_time_period_type(account["interest_period_type"])
+      assert interest_period_type
+      last_interest_date = ConfigBuilder.__build_date(account["last_interest_date"])
+      assert last_interest_date
+      account_configs.append(AccountConfig(
+        name=account["name"],
+        type=account_type,
+        balance=account["balance"],
+        interest_rate=account["interest_rate"],
+        interest_period_type=interest_period_type,
+        interest_period_value=account["interest_period_value"],
+        last_interest_date=last_interest_date,
+        pays_capital_gains_tax=account["pays_capital_gains_tax"],
+        pays_income_tax=account["pays_income_tax"]
+      ))
+    return account_configs
+
+  @staticmethod
+  def __build_debts_configs(debts_list: List[dict]) -> List[DebtConfig]:
+    debt_configs: List[DebtConfig] = []
+    for debt in debts_list:
+      interest_period_type = ConfigBuilder.__build_time_period_type(debt["interest_period_type"])
+      assert interest_period_type
+      charge_period_type = ConfigBuilder.__build_time_period_type(debt["charge_period_type"])
+      assert charge_period_type
+      start_date = ConfigBuilder.__build_date(debt["start_date"])
+      assert start_date
+      end_date = ConfigBuilder.__build_date(debt["end_date"])
+      assert end_date
+      asset = None
+      if debt["asset"]:
+        asset = ConfigBuilder.__build_asset_configs([debt["asset"]])[0]
+      debt_configs.append(DebtConfig(
+        name=debt["name"],
+        principal=debt["principal"],
+        balance=debt["balance"],
+        start_date=start_date,
+        end_date=end_date,
+        interest_rate=debt["interest_rate"],
+        interest_period_type=interest_period_type,
+        interest_period_value=debt["interest_period_value"],
+        charge_period_type=charge_period_type,
+        charge_period_value=debt["charge_period_value"],
+        asset=asset
+      ))
+    return debt_configs
+
+  @staticmethod
+  def __build_income_configs(incomes_list: List[dict]) -> List[IncomeStreamConfig]:
+    income_configs: List[IncomeStreamConfig] = []
+    for income in incomes_list:
+      payment_period_type = ConfigBuilder.__build_time_period_type(income["payment_period_type"])
+      assert payment_period_type
+      annual_inflation_period_type = ConfigBuilder.__build_time_period_type(income["annual_inflation_period_type"])
+      assert annual_inflation_period_type
+      start_date = ConfigBuilder.__build_date(income["start_date"])
+      assert start_date
+      end_date = ConfigBuilder.__build_date(income["end_date"])
+      assert end_date
+      income_configs.append(IncomeStreamConfig(
+        name=income["name"],
+        gross=income["gross"],
+        health_insurance_premium=income["health_insurance_premium"],
+        annual_inflation_flat=income["annual_inflation_flat"],
+        annual_inflation_percentage=income["annual_inflation_percentage"],
+        annual_inflation_period_type=annual_inflation_period_type,
+        annual_inflation_period_value=income["annual_inflation_period_value"],
+        fourk=income["401k"],
+        fourk_employer_contribution=income["401k_employer_contribution"],
+        hsa=income["hsa"],
+        hsa_employer_contribution=income["hsa_employer_contribution"],
+        state_tax_percentage=income["state_tax_percentage"],
+        city_tax_percentage=income["city_tax_percentage"],
+        payment_period_type=payment_period_type,
+        payment_period_value=income["payment_period_value"],
+        start_date=start_date,
+        end_date=end_date
+      ))
+    return income_configs
+
+  @staticmethod
+  def __build_asset_configs(assets_list: List[dict]) -> List[AssetConfig]:
+    asset_configs: List[AssetConfig] = []
+    for asset in assets_list:
+      asset_type = ConfigBuilder.__build_asset_type(asset["type"])
+      assert asset_type
+      return_period_type = ConfigBuilder.__build_time_period_type(asset["appreciation_period_type"])
+      assert return_period_type
+      sell_date = ConfigBuilder.__build_date(asset["sell_date"])
+      asset_configs.append(AssetConfig(
+        name=asset["name"],
+        type=asset_type,
+        value=asset["value"],
+        appreciation_rate=asset["appreciation_rate"],
+        appreciation_period_type=return_period_type,
+        appreciation_period_value=asset["appreciation_period_value"],
+        pays_capital_gains_tax=asset["pays_capital_gains_tax"],
+        sell_date=sell_date
+      ))
+    return asset_configs
+
+  @staticmethod
+  def __build_bills_configs(bills_list: List[dict]) -> List[BillConfig]:
+    bill_configs: List[BillConfig] = []
+    for bill in bills_list:
+      charge_period_type = ConfigBuilder.__build_time_period_type(bill["charge_period_type"])
+      assert charge_period_type
+      annual_inflation_period_type = ConfigBuilder.__build_time_period_type(bill["annual_inflation_period_type"])
+      assert annual_inflation_period_type
+      start_date = ConfigBuilder.__build_date(bill["start_date"])
+      assert start_date
+      end_date = ConfigBuilder.__build_date(bill["end_date"])
+      bill_configs.append(BillConfig(
+        name=bill["name"],
+        charge=bill["charge"],
+        charge_period_type=charge_period_type,
+        charge_period_value=bill["charge_period_value"],
+        annual_inflation_flat=bill["annual_inflation_flat"],
+        annual_inflation_percentage=bill["annual_inflation_percentage"],
+        annual_inflation_period_type=annual_inflation_period_type,
+        annual_inflation_period_value=bill["annual_inflation_period_value"],
+        start_date=start_date,
+        end_date=end_date
+      ))
+    return bill_configs
+
+  @staticmethod
+  def __build_account_type(account_type_str: str) -> AccountType:
+    if account_type_str.lower() == AccountType.CASH.value:
+      interest_period_type = AccountType.CASH
+    elif account_type_str.lower() == AccountType.SAVINGS.value:
+      interest_period_type = AccountType.SAVINGS
+    elif account_type_str.lower() == AccountType.INVESTMENT.value:
+      interest_period_type = AccountType.INVESTMENT
+    elif account_type_str.lower() == AccountType.ROTH_IRA.value:
+      interest_period_type = AccountType.ROTH_IRA
+    elif account_type_str.lower() == AccountType.HSA.value:
+      interest_period_type = AccountType.HSA
+    elif account_type_str.lower() == AccountType.FOURK.value:
+      interest_period_type = AccountType.FOURK
+    else:
+      raise UnknownAccountTypeException(f"Given AccountType: {account_type_str}")
+    return interest_period_type
+
+  @staticmethod
+  def __build_time_period_type(time_period_type_str: str | None) -> TimePeriodType | None:
+    if time_period_type_str is None:
+      return None
+    if time_period_type_str.lower() == TimePeriodType.DAYS.value:
+      interest_period_type = TimePeriodType.DAYS
+    elif time_period_type_str.lower() == TimePeriodType.WEEKS.value:
+      interest_period_type = TimePeriodType.WEEKS
+    elif time_period_type_str.lower() == TimePeriodType.MONTHS.value:
+      interest_period_type = TimePeriodType.MONTHS
+    elif time_period_type_str.lower() == TimePeriodType.YEARS.value:
+      interest_period_type = TimePeriodType.YEARS
+    else:
+      raise UnknownTimePeriodTypeException(f"Given TimePeriodType: {time_period_type_str}")
+    return interest_period_type
+
+  @staticmethod
+  def __build_asset_type(asset_type_str: str | None) -> AssetType | None:
+    if asset_type_str is None:
+      return None
+    if asset_type_str.lower() == AssetType.HOUSE.value:
+      asset_type = AssetType.HOUSE
+    elif asset_type_str.lower() == AssetType.CAR.value:
+      asset_type = AssetType.CAR
+    elif asset_type_str.lower() == AssetType.MISC.value:
+      asset_type = AssetType.MISC
+    else:
+      raise UnknownAssetTypeException(f"Given AssetType: {asset_type_str}")
+    return asset_type
+
+  @staticmethod
+  def __build_date(date_dict: dict | None) -> date | None:
+    if date_dict is None:
+      return None
+    return date(
+      month=date_dict["month"],
+      day=date_dict["day"],
+      year=date_dict["year"]
+    )
@@ -0,0 +1,62 @@
+import hashlib
+import os
+import pickle
+from models.configs.full_config import FullConfig
+from services.config_builder import ConfigBuilder
+
+
+class ConfigCache:
+  """
+  Keeps the built FullConfig for a YAML file as a pickle next to it, under `.cache/`, named by
+  the SHA-256 of the YAML bytes and SCHEMA_VERSION. A hit skips YAML parsing and the config
+  builders entirely; editing the YAML changes the key, so stale entries are simply never read.
+  """
+  # Bump whenever a *Config dataclass, an enum it holds or ConfigBuilder's output changes shape
+  SCHEMA_VERSION = 3
+  CACHE_DIRECTORY_NAME = ".cache"
+
+  @staticmethod
+  def build_from_path(yaml_path: str) -> FullConfig:
+    with open(yaml_path, "rb") as yaml_file:
+      yaml_bytes = yaml_file.read()
+    cache_path = ConfigCache.get_cache_path(yaml_path, yaml_bytes)
+    full_config = ConfigCache.__load(cache_path)
+    if full_config:
+      return full_config
+    full_config = ConfigBuilder.build(ConfigBuilder.parse_raw(yaml_bytes))
+    ConfigCache.__store(cache_path, full_config)
+    return full_config
+
+  @staticmethod
+  def get_cache_path(yaml_path: str, yaml_bytes: bytes) -> str:
+    digest = hashlib.sha256(yaml_bytes)
+    digest.update(f"\0schema-{ConfigCache.SCHEMA_VERSION}".encode())
+    cache_directory = os.path.join(os.path.dirname(os.path.abspath(yaml_path)), ConfigCache.CACHE_DIRECTORY_NAME)
+    return os.path.join(cache_directory, f"{digest.hexdigest()}.pickle")
+
+  @staticmethod
+  def __load(cache_path: str) -> FullConfig | None:
+    try:
+      with open(cache_path, "rb") as cache_file:
+        full_config = pickle.load(cache_file)
+    except FileNotFoundError:
+      return None
+    except (pickle.UnpicklingError, EOFError, AttributeError, ImportError, TypeError):
+      # A truncated write or a renamed class; rebuild and overwrite it
+      return None
+    if not isinstance(full_config, FullConfig):
+      return None
+    return full_config
+
+  @staticmethod
+  def __store(cache_path: str, full_config: FullConfig) -> None:
+    try:
+      os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+      # Write then rename, so a concurrent reader never sees a partial file
+      temporary_path = f"{cache_path}.{os.getpid()}.tmp"
+      with open(temporary_path, "wb") as cache_file:
+        pickle.dump(full_config, cache_file, protocol=pickle.HIGHEST_PROTOCOL)
+      os.replace(temporary_path, cache_path)
+    except OSError:
+      # The cache is an optimization; a read-only config directory just means no caching
+      pass
@@ -0,0 +1,30 @@
+from datetime import date
+from dateutil.relativedelta import relativedelta
+
+
+class ConsolePrinter:
+  @staticmethod
+  def print_new_day_header(some_date: date, age: relativedelta) -> None:
+    formatted_date = ConsolePrinter.get_formatted_date(some_date)
+    print()
+    print("─" * 120)
+    print("─" * 120)
+    print("─" * 120)
+    print()
+    print(f"\t{formatted_date}")
+    print(f"\tAge:  {age.years}")
+
+  @staticmethod
+  def get_formatted_date(some_date: date) -> str:
+    day = some_date.day
+    suffix = 'th' if 11 <= day <= 13 else {1: 'st', 2: 'nd', 3: 'rd'}.get(day % 10, 'th')
+    formatted_date = some_date.strftime(f"Date: %A - %B {day}{suffix} %Y")
+    return formatted_date
+
+  @staticmethod
+  def print_header(header: str) -> None:
+    print(" " * 50)
+    print("=" * 50)
+    print(f"{header:^50}")
+    print("=" * 50)
+    print(" " * 50)
@@ -0,0 +1,63 @@
+from datetime import date, timedelta
+from models.enums.time_period_type import TimePeriodType
+
+
+class DateCalculator:
+  """
+  Period arithmetic for the daily loop. Day and week steps are ordinal offsets; month and year
+  steps look the target month's length up and clamp the day to it, which is what relativedelta
+  does, without building one per call.
+  """
+  __MONTH_LENGTHS = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+  __LEAP_YEAR_MONTH_LENGTHS = (31, 29, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+  @staticmethod
+  def add_period(some_date: date, period_type: TimePeriodType, period_value: int) -> date:
+    if period_type == TimePeriodType.DAYS:
+      return date.fromordinal(some_date.toordinal() + period_value)
+    if period_type == TimePeriodType.WEEKS:
+      return date.fromordinal(some_date.toordinal() + period_value * 7)
+    if period_type == TimePeriodType.MONTHS:
+      return DateCalculator.add_months(some_date, period_value)
+    if period_type == TimePeriodType.YEARS:
+      return DateCalculator.add_months(some_date, period_value * 12)
+    raise RuntimeError("Unknown period_type")
+
+  @staticmethod
+  def subtract_period(some_date: date, period_type: TimePeriodType, period_value: int) -> date:
+    return DateCalculator.add_period(some_date, period_type, -period_value)
+
+  @staticmethod
+  def add_months(some_date: date, months: int) -> date:
+    """Same as `some_date + relativedelta(months=months)`: the 31st of a shorter month becomes its last day."""
+    year, month_index = divmod(some_date.year * 12 + some_date.month - 1 + months, 12)
+    if year % 4 == 0 and (year % 100 != 0 or year % 400 == 0):
+      month_length = DateCalculator.__LEAP_YEAR_MONTH_LENGTHS[month_index]
+    else:
+      month_length = DateCalculator.__MONTH_LENGTHS[month_index]
+    return date(year, month_index + 1, min(some_date.day, month_length))
+
+  @staticmethod
+  def get_last_period_date(
+    last_date: date,
+    period_type: TimePeriodType,
+    period_value: int,
+    until: date
+  ) -> date:
+    """
+    Returns the last date on or before `until` that is a whole number of periods after `last_date`.
+    Months and years are stepped one period at a time so end-of-month clamping matches the daily loop.
+    """
+    if period_type == TimePeriodType.DAYS:
+      period_in_days = period_value
+    elif period_type == TimePeriodType.WEEKS:
+      period_in_days = period_value * 7
+    else:
+      period_date = last_date
+      while True:
+        next_period_date = DateCalculator.add_period(period_date, period_type, period_value)
+        if next_period_date > until:
+          return period_date
+        period_date = next_period_date
+    periods_elapsed = (until - last_date).days // period_in_days
+    return last_date + timedelta(days=periods_elapsed * period_in_days)
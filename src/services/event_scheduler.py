@@ -0,0 +1,32 @@
+import heapq
+from datetime import date, timedelta
+from typing import List, Set
+
+
+class EventScheduler:
+  """
+  Priority queue of the upcoming dates on which something can happen in the simulation.
+  Dates that are already queued are ignored, so entities may re-announce their next due date every event day.
+  """
+  _queue: List[date]
+  _scheduled: Set[date]
+
+  def __init__(self):
+    self._queue = []
+    self._scheduled = set()
+
+  def schedule(self, today: date, event_date: date | None) -> None:
+    if event_date is None or event_date <= today:
+      return
+    if event_date in self._scheduled:
+      return
+    self._scheduled.add(event_date)
+    heapq.heappush(self._queue, event_date)
+
+  def pop_next_day(self, today: date) -> date:
+    while self._queue:
+      next_day = heapq.heappop(self._queue)
+      self._scheduled.remove(next_day)
+      if next_day > today:
+        return next_day
+    return today + timedelta(days=1)
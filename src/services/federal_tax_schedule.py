@@ -0,0 +1,42 @@
+from typing import Dict, Tuple
+from models.configs.federal_tax_config import FederalTaxConfig
+from models.configs.federal_tax_year_config import FederalTaxYearConfig
+from services.federal_tax_table import FederalTaxTable
+
+
+class FederalTaxSchedule:
+  """
+  Federal brackets by tax year. A listed year uses its own tables; any other year uses the latest
+  listed year before it, indexed forward by annual_inflation_percentage per year when that is set
+  (years before the first listed one use it as is). Tables are built on first use and kept.
+  """
+  _federal_tax_config: FederalTaxConfig
+  _tables: Dict[Tuple[int, bool], FederalTaxTable]
+
+  def __init__(self, federal_tax_config: FederalTaxConfig):
+    self._federal_tax_config = federal_tax_config
+    self._tables = {}
+
+  def get_table(self, year: int, is_married: bool) -> FederalTaxTable:
+    table = self._tables.get((year, is_married))
+    if table is None:
+      table = self.__build_table(year, is_married)
+      self._tables[(year, is_married)] = table
+    return table
+
+  def __build_table(self, year: int, is_married: bool) -> FederalTaxTable:
+    year_config = self.__get_year_config(year)
+    inflation_factor = 1.0
+    inflation_percentage = self._federal_tax_config.annual_inflation_percentage
+    if inflation_percentage and year > year_config.year:
+      inflation_factor = (1 + inflation_percentage / 100) ** (year - year_config.year)
+    return FederalTaxTable(year_config.married if is_married else year_config.single, inflation_factor)
+
+  def __get_year_config(self, year: int) -> FederalTaxYearConfig:
+    year_configs = self._federal_tax_config.years
+    chosen = year_configs[0]
+    for year_config in year_configs:
+      if year_config.year > year:
+        break
+      chosen = year_config
+    return chosen
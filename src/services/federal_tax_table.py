@@ -0,0 +1,54 @@
+from bisect import bisect_left
+from typing import List, TYPE_CHECKING
+from models.configs.federal_tax_table_config import FederalTaxTableConfig
+
+if TYPE_CHECKING:
+  import numpy as np
+
+
+class FederalTaxTable:
+  """
+  One filing status' brackets for one tax year. The tax owed at each bracket's lower bound is
+  summed once up front, so a lookup is a bisect plus one multiply rather than a walk over the
+  brackets below it.
+  """
+  _standard_deduction: float
+  _lower_bounds: List[float]
+  _rates: List[float]
+  _base_taxes: List[float]
+
+  def __init__(self, table_config: FederalTaxTableConfig, inflation_factor: float = 1.0):
+    self._standard_deduction = table_config.standard_deduction * inflation_factor
+    self._lower_bounds = [lower_bound * inflation_factor for lower_bound, _ in table_config.brackets]
+    self._rates = [rate / 100 for _, rate in table_config.brackets]
+    self._base_taxes = []
+    tax = 0.0
+    for index, lower_bound in enumerate(self._lower_bounds):
+      self._base_taxes.append(tax)
+      if index + 1 < len(self._lower_bounds):
+        tax += (self._lower_bounds[index + 1] - lower_bound) * self._rates[index]
+
+  def get_standard_deduction(self) -> float:
+    return self._standard_deduction
+
+  def get_tax(self, gross_income: float) -> float:
+    taxable_income = max(0, gross_income - self._standard_deduction)
+    # Income exactly on a lower bound owes nothing at that bracket's rate, hence bisect_left
+    index = bisect_left(self._lower_bounds, taxable_income) - 1
+    if index < 0:
+      return 0.0
+    return self._base_taxes[index] + (taxable_income - self._lower_bounds[index]) * self._rates[index]
+
+  def get_taxes(self, gross_incomes: "np.ndarray") -> "np.ndarray":
+    """Element-wise get_tax over a whole batch of gross incomes."""
+    # Deferred so the day-by-day engine never imports NumPy
+    import numpy as np  # pylint: disable=import-outside-toplevel
+    lower_bounds = np.array(self._lower_bounds)
+    taxable_incomes = np.maximum(gross_incomes - self._standard_deduction, 0.0)
+    indexes = np.searchsorted(lower_bounds, taxable_incomes, side="left") - 1
+    bracket_indexes = np.maximum(indexes, 0)
+    taxes = (
+      np.array(self._base_taxes)[bracket_indexes]
+      + (taxable_incomes - lower_bounds[bracket_indexes]) * np.array(self._rates)[bracket_indexes]
+    )
+    return np.where(indexes >= 0, taxes, 0.0)
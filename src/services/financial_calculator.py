@@ -1,43 +1,12 @@
 from datetime import date
-from typing import List, Tuple
-import numpy_financial as npf
+from typing import List
 
+from models.enums.time_period_type import TimePeriodType
+from models.results.amortization_schedule import AmortizationSchedule
+from services.date_calculator import DateCalculator
 
-class FinancialCalculator:
-  @staticmethod
-  def calculate_federal_tax(is_married: bool, gross_income: float) -> float:
-    if is_married:
-      standard_deduction = 29200  # 2025 married filing jointly
-      brackets: List[Tuple[float, float, float]] = [
-        (0, 23200, 0.10),
-        (23200, 94300, 0.12),
-        (94300, 201050, 0.22),
-        (201050, 383900, 0.24),
-        (383900, 487450, 0.32),
-        (487450, 731200, 0.35),
-        (731200, float('inf'), 0.37)
-      ]
-    else:
-      standard_deduction = 14600  # 2025 single
-      brackets = [
-        (0, 11600, 0.10),
-        (11600, 47150, 0.12),
-        (47150, 100525, 0.22),
-        (100525, 191950, 0.24),
-        (191950, 243725, 0.32),
-        (243725, 609350, 0.35),
-        (609350, float('inf'), 0.37)
-      ]
-    taxable_income = max(0, gross_income - standard_deduction)
-    tax = 0.0
-    for lower, upper, rate in brackets:
-      if taxable_income > lower:
-        taxed_amount = min(taxable_income, upper) - lower
-        tax += taxed_amount * rate
-      else:
-        break
-    return tax
 
+class FinancialCalculator:
   @staticmethod
   def get_minimum_monthly_payment(
     interest_rate: float,
@@ -45,11 +14,78 @@ class FinancialCalculator:
     start_date: date,
     end_date: date
   ) -> float:
+    # Deferred: numpy_financial pulls in all of NumPy for this one call
+    import numpy_financial as npf  # pylint: disable=import-outside-toplevel
     years = (end_date - start_date).days / 365
     r = (interest_rate / 100) / 12
     n = years * 12
     return float(abs(npf.pmt(rate=r, nper=n, pv=principal)))
 
+  @staticmethod
+  def build_amortization_schedule(
+    payment: float,
+    balance: float,
+    interest_rate: float,
+    last_interest_date: date,
+    interest_period_type: TimePeriodType,
+    interest_period_value: int,
+    first_charge_date: date,
+    charge_period_type: TimePeriodType,
+    charge_period_value: int,
+    end_date: date
+  ) -> AmortizationSchedule:
+    """
+    Projects a loan forward one charge at a time the way the daily loop runs it: the interest the
+    debt's own interest dates post up to the charge, compounded by get_interest, then the fixed
+    payment, with the final charge (once the payment covers the balance, or the first one dated
+    past `end_date`) clearing it.
+    """
+    dates: List[date] = []
+    payments: List[float] = []
+    interests: List[float] = []
+    principals: List[float] = []
+    balances: List[float] = []
+    interest_date = last_interest_date
+    charge_date = first_charge_date
+    while balance > 0:
+      next_charge_date = DateCalculator.add_period(charge_date, charge_period_type, charge_period_value)
+      posting_date = DateCalculator.get_last_period_date(
+        interest_date,
+        interest_period_type,
+        interest_period_value,
+        charge_date
+      )
+      interest = FinancialCalculator.get_interest(
+        principal=balance,
+        interest_rate=interest_rate,
+        last_interest_date=interest_date,
+        today=posting_date
+      )
+      if interest:
+        interest_date = posting_date
+      balance += interest
+      is_last_charge = charge_date > end_date or payment >= balance
+      charge = balance if is_last_charge else payment
+      balance -= charge
+      dates.append(charge_date)
+      payments.append(charge)
+      interests.append(interest)
+      principals.append(charge - interest)
+      balances.append(balance)
+      if is_last_charge:
+        balance = 0.0
+      charge_date = next_charge_date
+    return AmortizationSchedule(
+      payment=payment,
+      dates=dates,
+      payments=payments,
+      interest=interests,
+      principal=principals,
+      balances=balances,
+      total_interest=sum(interests),
+      payoff_date=dates[-1] if dates else None
+    )
+
   @staticmethod
   def get_interest(
     principal: float,
@@ -0,0 +1,121 @@
+from datetime import date
+import json
+from typing import Any, TextIO
+from dateutil.relativedelta import relativedelta
+from models.enums.account_type import AccountType
+from models.enums.output_event_type import OutputEventType
+from models.enums.time_period_type import TimePeriodType
+from models.results.daily_summary import DailySummary
+from models.results.simulation_result import SimulationResult
+from services.output_sink import OutputSink
+
+
+class JsonLinesWriter(OutputSink):
+  """
+  Streams one JSON object per event to a buffered file, stamped with the day it happened on. It takes
+  every day's events, not just the print days', and closes with the run's totals. Event-driven runs
+  post interest and appreciation lazily between events, so those arrive only on the days visited.
+  """
+  _file: TextIO
+  _today: date | None
+
+  def __init__(self, path: str, buffer_size: int = 1024 * 1024):
+    self._file = open(path, "w", encoding="utf-8", buffering=buffer_size)  # pylint: disable=consider-using-with
+    self._today = None
+
+  def is_recording(self, is_print_day: bool) -> bool:
+    return True
+
+  def start_day(self, today: date, age: relativedelta) -> None:
+    self._today = today
+
+  def bill_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    self.__write(OutputEventType.CHARGE, source="bill", name=name, period=period_type.value, amount=amount)
+
+  def debt_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    self.__write(OutputEventType.CHARGE, source="debt", name=name, period=period_type.value, amount=amount)
+
+  def bill_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    period = period_type.value if period_type else None
+    self.__write(OutputEventType.INFLATION_ADJUSTMENT, source="bill", name=name, period=period, amount=amount)
+
+  def income_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    period = period_type.value if period_type else None
+    self.__write(OutputEventType.INFLATION_ADJUSTMENT, source="income", name=name, period=period, amount=amount)
+
+  def payout(self, name: str, amount: float, account_type: AccountType | None) -> None:
+    account = account_type.value if account_type else None
+    self.__write(OutputEventType.PAYOUT, name=name, account_type=account, amount=amount)
+
+  def debt_allocation(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.ALLOCATION, target="debt", name=name, amount=amount)
+
+  def account_allocation(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.ALLOCATION, target="account", name=name, amount=amount)
+
+  def account_interest(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.INTEREST, source="account", kind="interest", name=name, amount=amount)
+
+  def capital_gains(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.INTEREST, source="account", kind="capital_gains", name=name, amount=amount)
+
+  def debt_interest(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.INTEREST, source="debt", kind="interest", name=name, amount=amount)
+
+  def appreciation(self, name: str, amount: float) -> None:
+    self.__write(OutputEventType.APPRECIATION, name=name, amount=amount)
+
+  def tax_day(self, account_name: str | None, amount: float) -> None:
+    self.__write(OutputEventType.TAX_DAY, account=account_name, amount=amount)
+
+  def asset_sale(self, today: date, name: str, amount: float, is_forced: bool) -> None:
+    self.__write(OutputEventType.ASSET_SALE, some_date=today, name=name, amount=amount, forced=is_forced)
+
+  def daily_summary(self, summary: DailySummary) -> None:
+    self.__write(OutputEventType.DAILY_SUMMARY, some_date=summary.date, **JsonLinesWriter.__get_summary_fields(summary))
+
+  def bankruptcy(self, age: relativedelta, money_needed: float, summary: DailySummary) -> None:
+    self.__write(
+      OutputEventType.BANKRUPTCY,
+      some_date=summary.date,
+      money_needed=money_needed,
+      **JsonLinesWriter.__get_summary_fields(summary)
+    )
+
+  def totals(self, result: SimulationResult) -> None:
+    self.__write(
+      OutputEventType.TOTALS,
+      some_date=result.end_date,
+      bankruptcy_date=result.bankruptcy_date.isoformat() if result.bankruptcy_date else None,
+      money_needed=result.money_needed,
+      final_net_worth=result.final_net_worth,
+      obtained_from_employers=result.obtained_from_employers,
+      obtained_from_stock_market=result.obtained_from_stock_market,
+      shuffle_transfer_count=result.shuffle_transfer_count
+    )
+
+  def close(self) -> None:
+    self._file.close()
+
+  @staticmethod
+  def __get_summary_fields(summary: DailySummary) -> dict:
+    return {
+      "total_debt_balance": summary.total_debt_balance,
+      "debts": {name: balance for name, balance in summary.debt_balances},
+      "total_account_balance": summary.total_account_balance,
+      "accounts": {name: balance for name, balance in summary.account_balances},
+      "total_sellable_assets_value": summary.total_sellable_assets_value,
+      "total_assets_value": summary.total_assets_value,
+      "assets": [
+        {"name": name, "value": value, "paid_off": is_paid_off}
+        for name, value, is_paid_off in summary.asset_values
+      ],
+      "net_worth": summary.net_worth
+    }
+
+  def __write(self, event_type: OutputEventType, some_date: date | None = None, **fields: Any) -> None:
+    event_date = some_date or self._today
+    event = {"date": event_date.isoformat() if event_date else None, "type": event_type.value}
+    event.update(fields)
+    self._file.write(json.dumps(event))
+    self._file.write("\n")
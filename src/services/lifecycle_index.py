@@ -0,0 +1,122 @@
+import heapq
+from datetime import date
+from typing import Any, List, Tuple
+from entities.asset import Asset
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+from models.configs.bill_config import BillConfig
+from models.configs.debt_config import DebtConfig
+from models.configs.full_config import FullConfig
+from models.configs.income_stream_config import IncomeStreamConfig
+
+
+class LifecycleIndex:
+  """
+  Heaps of the days on which configured entities start, running ones end, debts' assets join the
+  simulation and assets are due to be sold, so each simulated day pops only what changes that
+  day. Ties keep the order things were added in, which is config order for starts. Entities have
+  to be added once they exist.
+  """
+  _bill_starts: List[Tuple[date, int, BillConfig]]
+  _debt_starts: List[Tuple[date, int, DebtConfig]]
+  _income_starts: List[Tuple[date, int, IncomeStreamConfig]]
+  _bill_ends: List[Tuple[date, int, Bill]]
+  _debt_ends: List[Tuple[date, int, Debt]]
+  _income_ends: List[Tuple[date, int, IncomeStream]]
+  _debt_assets: List[Tuple[date, int, Asset]]
+  _asset_sales: List[Tuple[date, int, Asset]]
+  _sequence: int
+
+  def __init__(self, full_config: FullConfig, today: date):
+    """Queues every config that starts on or after `today`; earlier ones are expected to be running already."""
+    self._bill_starts = []
+    self._debt_starts = []
+    self._income_starts = []
+    self._bill_ends = []
+    self._debt_ends = []
+    self._income_ends = []
+    self._debt_assets = []
+    self._asset_sales = []
+    self._sequence = 0
+    for bill_config in full_config.bills:
+      if bill_config.start_date >= today:
+        self.__push(self._bill_starts, bill_config.start_date, bill_config)
+    for debt_config in full_config.debts:
+      if debt_config.start_date >= today:
+        self.__push(self._debt_starts, debt_config.start_date, debt_config)
+    for income_config in full_config.income:
+      if income_config.start_date >= today:
+        self.__push(self._income_starts, income_config.start_date, income_config)
+
+  def add_bill(self, bill: Bill) -> None:
+    end_date = bill.get_end_date()
+    if end_date:
+      self.__push(self._bill_ends, end_date, bill)
+
+  def add_debt(self, debt: Debt, today: date) -> None:
+    """The debt's asset, if any, joins on `today`'s lifecycle step."""
+    self.__push(self._debt_ends, debt.get_end_date(), debt)
+    debt_asset = debt.get_asset()
+    if debt_asset:
+      self.__push(self._debt_assets, today, debt_asset)
+
+  def add_income(self, income: IncomeStream) -> None:
+    self.__push(self._income_ends, income.get_end_date(), income)
+
+  def add_asset(self, asset: Asset, today: date) -> None:
+    sell_date = asset.get_sell_date()
+    if sell_date and sell_date >= today:
+      self.__push(self._asset_sales, sell_date, asset)
+
+  def pop_starting_bills(self, today: date) -> List[BillConfig]:
+    return LifecycleIndex.__pop_due_on(self._bill_starts, today)
+
+  def pop_starting_debts(self, today: date) -> List[DebtConfig]:
+    return LifecycleIndex.__pop_due_on(self._debt_starts, today)
+
+  def pop_starting_incomes(self, today: date) -> List[IncomeStreamConfig]:
+    return LifecycleIndex.__pop_due_on(self._income_starts, today)
+
+  def pop_ended_bills(self, today: date) -> List[Bill]:
+    return LifecycleIndex.__pop_due_before(self._bill_ends, today)
+
+  def pop_ended_debts(self, today: date) -> List[Debt]:
+    return LifecycleIndex.__pop_due_before(self._debt_ends, today)
+
+  def pop_ended_incomes(self, today: date) -> List[IncomeStream]:
+    return LifecycleIndex.__pop_due_before(self._income_ends, today)
+
+  def pop_debt_assets(self, today: date) -> List[Asset]:
+    return LifecycleIndex.__pop_due_by(self._debt_assets, today)
+
+  def pop_assets_to_sell(self, today: date) -> List[Asset]:
+    return LifecycleIndex.__pop_due_on(self._asset_sales, today)
+
+  def __push(self, queue: List[Tuple[date, int, Any]], day: date, item: Any) -> None:
+    heapq.heappush(queue, (day, self._sequence, item))
+    self._sequence += 1
+
+  @staticmethod
+  def __pop_due_on(queue: List[Tuple[date, int, Any]], today: date) -> List[Any]:
+    # Days the event loop stepped over had nothing due, so anything older than today is stale
+    due = []
+    while queue and queue[0][0] <= today:
+      day, _, item = heapq.heappop(queue)
+      if day == today:
+        due.append(item)
+    return due
+
+  @staticmethod
+  def __pop_due_by(queue: List[Tuple[date, int, Any]], today: date) -> List[Any]:
+    due = []
+    while queue and queue[0][0] <= today:
+      due.append(heapq.heappop(queue)[2])
+    return due
+
+  @staticmethod
+  def __pop_due_before(queue: List[Tuple[date, int, Any]], today: date) -> List[Any]:
+    due = []
+    while queue and queue[0][0] < today:
+      due.append(heapq.heappop(queue)[2])
+    return due
@@ -0,0 +1,68 @@
+from typing import Dict, Iterable, List
+from entities.asset import Asset
+
+
+class LiquidationEngine:
+  """
+  Tracks the assets that can be sold (paid off and not sold yet) and picks which of them to sell
+  when the accounts cannot cover a charge. Selling an asset costs its capital gains tax plus a
+  year of the appreciation it would have earned; depreciating assets cost less than nothing.
+  """
+  # Values change daily, so costs are ranked when a sale is needed rather than kept in order
+  _sellable_assets: Dict[Asset, None]
+
+  def __init__(self, assets: List[Asset]):
+    self._sellable_assets = {}
+    for asset in assets:
+      self.add(asset)
+
+  def add(self, asset: Asset) -> None:
+    """Call when an asset joins the simulation or is paid off; unsellable ones are ignored."""
+    if asset.is_sellable():
+      self._sellable_assets[asset] = None
+
+  def remove(self, asset: Asset) -> None:
+    self._sellable_assets.pop(asset, None)
+
+  def get_total_proceeds(self) -> float:
+    return sum(asset.get_post_tax_value() for asset in self._sellable_assets)
+
+  def choose_assets_to_sell(self, shortfall: float) -> List[Asset]:
+    return LiquidationEngine.choose_cheapest(self._sellable_assets, shortfall)
+
+  @staticmethod
+  def choose_cheapest(sellable_assets: Iterable[Asset], shortfall: float) -> List[Asset]:
+    """
+    The cheapest set of `sellable_assets` whose post-tax proceeds cover `shortfall`, or an empty
+    list when all of them together fall short. Assets are taken cheapest per dollar raised first,
+    picks the rest already cover are dropped, and a single asset that covers it alone for less wins.
+    """
+    ranked_assets = sorted(
+      (asset for asset in sellable_assets if asset.get_post_tax_value() > 0),
+      key=lambda asset: (LiquidationEngine.__get_cost(asset) / asset.get_post_tax_value(), asset.get_name())
+    )
+    chosen_assets: List[Asset] = []
+    proceeds = 0.0
+    for asset in ranked_assets:
+      if proceeds >= shortfall:
+        break
+      chosen_assets.append(asset)
+      proceeds += asset.get_post_tax_value()
+    if proceeds < shortfall:
+      return []
+    for asset in reversed(list(chosen_assets)):
+      if proceeds - asset.get_post_tax_value() >= shortfall:
+        chosen_assets.remove(asset)
+        proceeds -= asset.get_post_tax_value()
+    cost = sum(LiquidationEngine.__get_cost(asset) for asset in chosen_assets)
+    for asset in ranked_assets:
+      if asset.get_post_tax_value() >= shortfall and LiquidationEngine.__get_cost(asset) < cost:
+        chosen_assets = [asset]
+        cost = LiquidationEngine.__get_cost(asset)
+    return chosen_assets
+
+  @staticmethod
+  def __get_cost(asset: Asset) -> float:
+    capital_gains_tax = asset.get_value() - asset.get_post_tax_value()
+    forgone_appreciation = asset.get_value() * asset.get_appreciation_rate() / 100
+    return capital_gains_tax + forgone_appreciation
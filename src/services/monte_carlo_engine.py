@@ -0,0 +1,826 @@
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+import numpy as np
+from entities.account import Account
+from entities.asset import Asset
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.annual_federal_income_tax_record import AnnualFederalIncomeTaxRecord
+from entities.misc.due_set import DueSet
+from entities.misc.payment_routing_plan import PaymentRoutingPlan
+from entities.misc.warning_log import WarningLog
+from models.configs.full_config import FullConfig
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from models.results.monte_carlo_result import MonteCarloResult
+from services.date_calculator import DateCalculator
+from services.event_scheduler import EventScheduler
+from services.federal_tax_schedule import FederalTaxSchedule
+from services.lifecycle_index import LifecycleIndex
+from services.liquidation_engine import LiquidationEngine
+from services.output_sink import OutputSink
+
+
+class MonteCarloEngine:  # pylint: disable=too-many-instance-attributes
+  """
+  Simulates many stochastic futures at once on the Simulator's event-driven calendar. An EventScheduler visits
+  only the days something is due, and real Bill, Debt and IncomeStream entities on a ledger of their own decide,
+  once for every path, what is due and what a paycheck comes to. Money is per path: account balances are an
+  array of shape (paths, accounts) whose growth is settled lazily in closed form, and each debt's balance, each
+  bill's charge and whether each asset is paid off or sold are arrays over the paths. A debt entity only takes
+  its scheduled interest and charges, so its growth scales every path's balance. Market-linked accounts take one
+  lognormal return shock per path each time growth is settled, and bills with percentage inflation share one
+  inflation shock per path and year. With both volatilities at zero every path is the Simulator's run. A bankrupt
+  path stops there and counts as zero net worth from then on.
+  """
+  _PERCENTILES = [5, 25, 50, 75, 95]
+  _account_types_that_gain_interest = [
+    AccountType.SAVINGS
+  ]
+  _account_types_that_accrue_capital_gains = [
+    AccountType.FOURK,
+    AccountType.HSA,
+    AccountType.INVESTMENT,
+    AccountType.ROTH_IRA
+  ]
+  _full_config: FullConfig
+  _today: date
+  _paths: int
+  _return_volatility: float
+  _inflation_volatility: float
+  _rng: np.random.Generator
+  _ledger: Ledger
+  _output_sink: OutputSink
+  _scheduler: EventScheduler
+  _lifecycle_index: LifecycleIndex
+  _alive: np.ndarray
+  _age_milestones: AgeMilestones
+  _federal_tax_schedule: FederalTaxSchedule
+  _is_married: bool
+  _year_married: int
+  _current_years_tax_record: AnnualFederalIncomeTaxRecord
+  _last_years_tax_record: AnnualFederalIncomeTaxRecord
+  # Accounts; the Account entities only resolve payment_order and are never paid into
+  _accounts: List[Account]
+  _account_indexes: Dict[Account, int]
+  _account_types: List[AccountType]
+  _payment_plan: PaymentRoutingPlan
+  _balances: np.ndarray
+  # Only read for stepped accounts; the rest post daily from the settled day, on every path alike
+  _last_interest_ordinals: np.ndarray
+  _settled_ordinal: int
+  _growth_logs: np.ndarray
+  _daily_variances: np.ndarray
+  _period_days: np.ndarray
+  _calendar_period_indexes: List[int]
+  _in_step_columns: np.ndarray
+  _stepped_columns: np.ndarray
+  _income_tax_rates: np.ndarray
+  _first_cash: int
+  _first_investment: int | None
+  _first_fourk: int | None
+  _first_hsa: int | None
+  # payment_order's shuffle lists, by account index
+  _underfill_targets: List[Tuple[int, float]]
+  _overfill_candidates: List[Tuple[int, float]]
+  _spare_fund_candidates: List[Tuple[int, float | None]]
+  # Running entities, in the order the Simulator keeps them, and their per-path amounts
+  _bills: List[Bill]
+  _bill_charges: Dict[Bill, np.ndarray]
+  _inflation_shocks: np.ndarray
+  _debts: List[Debt]
+  _debt_balances: Dict[Debt, np.ndarray]
+  _incomes: List[IncomeStream]
+  # Asset values are the same on every path; whether each is paid off or sold is not
+  _assets: List[Asset]
+  _asset_paid_off: Dict[Asset, np.ndarray]
+  _asset_sold: Dict[Asset, np.ndarray]
+
+  def __init__(
+    self,
+    full_config: FullConfig,
+    today: date,
+    paths: int,
+    seed: int | None = None,
+    return_volatility: float = 15.0,
+    inflation_volatility: float = 1.0
+  ):
+    self._full_config = full_config
+    self._today = today
+    self._paths = paths
+    self._return_volatility = return_volatility
+    self._inflation_volatility = inflation_volatility
+    self._rng = np.random.default_rng(seed)
+
+  def run(self) -> MonteCarloResult:
+    self.__init_paths()
+    end_date = self._full_config.output.end_date
+    record_dates = self.__build_record_dates()
+    self.__schedule_calendar_events(record_dates)
+    dates: List[date] = []
+    net_worths: List[np.ndarray] = []
+    cumulative_bankruptcy_probability: List[float] = []
+    today = self._today
+    last_day = today
+    while today <= end_date:
+      self.__simulate_day(last_day, today)
+      if today in record_dates:
+        dates.append(today)
+        net_worths.append(self.__get_net_worths())
+        cumulative_bankruptcy_probability.append(float((~self._alive).mean()))
+      last_day = today
+      self.__schedule_entity_events(today)
+      today = self._scheduler.pop_next_day(today)
+    percentile_table = np.percentile(np.array(net_worths), self._PERCENTILES, axis=1)
+    net_worth_percentiles: Dict[int, List[float]] = {}
+    for row, percentile in enumerate(self._PERCENTILES):
+      net_worth_percentiles[percentile] = [float(value) for value in percentile_table[row]]
+    return MonteCarloResult(
+      paths=self._paths,
+      dates=dates,
+      bankruptcy_probability=float((~self._alive).mean()),
+      cumulative_bankruptcy_probability=cumulative_bankruptcy_probability,
+      net_worth_percentiles=net_worth_percentiles
+    )
+
+  def __build_record_dates(self) -> List[date]:
+    # A row every twelve months from today, and one for the end date
+    end_date = self._full_config.output.end_date
+    record_dates: List[date] = []
+    months = 12
+    while DateCalculator.add_months(self._today, months) < end_date:
+      record_dates.append(DateCalculator.add_months(self._today, months))
+      months += 12
+    record_dates.append(end_date)
+    return record_dates
+
+  def __init_paths(self) -> None:
+    full_config = self._full_config
+    today = self._today
+    paths = self._paths
+    self._ledger = Ledger()
+    self._output_sink = OutputSink()
+    self._scheduler = EventScheduler()
+    self._alive = np.ones(paths, dtype=bool)
+    self._age_milestones = AgeMilestones(full_config.dob)
+    self._federal_tax_schedule = FederalTaxSchedule(full_config.federal_tax)
+    self.__init_marriage(full_config.married)
+    self._current_years_tax_record = AnnualFederalIncomeTaxRecord()
+    self._last_years_tax_record = AnnualFederalIncomeTaxRecord()
+    self._inflation_shocks = self._rng.normal(0.0, self._inflation_volatility, paths)
+    # Like the Simulator, a config starting today is built now and again on today's lifecycle step
+    self._bills = [
+      Bill(today, config, self._ledger, self._output_sink) for config in full_config.bills if today >= config.start_date
+    ]
+    self._debts = [
+      Debt(today, config, self._ledger, self._output_sink) for config in full_config.debts if today >= config.start_date
+    ]
+    self._incomes = [
+      IncomeStream(today, config, self._ledger, self._output_sink)
+      for config in full_config.income if today >= config.start_date
+    ]
+    self._assets = [Asset(True, today, config, self._output_sink) for config in full_config.assets]
+    self._bill_charges = {bill: np.full(paths, bill.get_charge(), dtype=float) for bill in self._bills}
+    self._debt_balances = {debt: np.full(paths, debt.get_balance(today), dtype=float) for debt in self._debts}
+    self._asset_paid_off = {asset: np.full(paths, asset.is_paid_off()) for asset in self._assets}
+    self._asset_sold = {asset: np.zeros(paths, dtype=bool) for asset in self._assets}
+    self._lifecycle_index = LifecycleIndex(full_config, today)
+    for bill in self._bills:
+      self._lifecycle_index.add_bill(bill)
+    for debt in self._debts:
+      self._lifecycle_index.add_debt(debt, today)
+    for income in self._incomes:
+      self._lifecycle_index.add_income(income)
+    for asset in self._assets:
+      self._lifecycle_index.add_asset(asset, today)
+    self.__init_accounts()
+
+  def __init_marriage(self, married: bool | int) -> None:
+    if isinstance(married, bool):
+      self._year_married = self._today.year
+      self._is_married = married
+    elif isinstance(married, int):
+      self._year_married = married
+      self._is_married = self._today.year >= married
+    else:
+      raise RuntimeError("Bad value for \"married\"")
+
+  def __init_accounts(self) -> None:
+    account_configs = self._full_config.accounts
+    today = self._today
+    warning_log = WarningLog(today, True)
+    self._accounts = [
+      Account(today, config, self._ledger, self._age_milestones, warning_log, self._output_sink)
+      for config in account_configs
+    ]
+    self._account_types = [config.type for config in account_configs]
+    self._payment_plan = PaymentRoutingPlan(
+      self._full_config.payment_order,
+      self._full_config.shuffle_tolerance,
+      self._accounts,
+      self._debts,
+      today
+    )
+    self._account_indexes = {account: index for index, account in enumerate(self._accounts)}
+    account_indexes = self._account_indexes
+    self._underfill_targets = [
+      (account_indexes[account], threshold) for account, threshold in self._payment_plan.get_underfill_targets()
+    ]
+    self._overfill_candidates = [
+      (account_indexes[account], threshold) for account, threshold in self._payment_plan.get_overfill_candidates()
+    ]
+    self._spare_fund_candidates = [
+      (account_indexes[account], threshold) for account, threshold in self._payment_plan.get_spare_fund_candidates()
+    ]
+    self._first_cash = account_indexes[self._payment_plan.get_first_cash_account()]
+    self._first_investment = MonteCarloEngine.__get_first_account_index(self._account_types, AccountType.INVESTMENT)
+    self._first_fourk = MonteCarloEngine.__get_first_account_index(self._account_types, AccountType.FOURK)
+    self._first_hsa = MonteCarloEngine.__get_first_account_index(self._account_types, AccountType.HSA)
+    self._balances = np.tile(np.array([config.balance for config in account_configs], dtype=float), (self._paths, 1))
+    self._last_interest_ordinals = np.tile(np.array([
+      max(
+        config.last_interest_date,
+        DateCalculator.subtract_period(today, config.interest_period_type, config.interest_period_value)
+      ).toordinal() for config in account_configs
+    ], dtype=np.int64), (self._paths, 1))
+    self._settled_ordinal = (today - timedelta(days=1)).toordinal()
+    self._income_tax_rates = np.array([0.22 if config.pays_income_tax else 0.0 for config in account_configs])
+    self.__init_growth()
+
+  def __init_growth(self) -> None:
+    """
+    Per account, the log of FinancialCalculator.get_interest's daily base, the market shock's variance per day
+    and the period in days. Accounts that never grow get a zero log; month and year periods have no fixed length
+    and are stepped on the calendar instead. An account that grows daily from the settled day stays in step with
+    it on every path, so only the other growing accounts are stepped path by path.
+    """
+    account_configs = self._full_config.accounts
+    count = len(account_configs)
+    growth_bases = np.ones(count)
+    self._daily_variances = np.zeros(count)
+    self._period_days = np.ones(count, dtype=np.int64)
+    self._calendar_period_indexes = []
+    for index, config in enumerate(account_configs):
+      if not config.interest_rate or not config.interest_period_type or not config.interest_period_value:
+        continue
+      is_market = config.type in self._account_types_that_accrue_capital_gains
+      if not is_market and config.type not in self._account_types_that_gain_interest:
+        continue
+      growth_bases[index] = 1 + (config.interest_rate / 100) / 365
+      if is_market:
+        self._daily_variances[index] = (self._return_volatility / 100) ** 2 / 365
+      if config.interest_period_type == TimePeriodType.DAYS:
+        self._period_days[index] = config.interest_period_value
+      elif config.interest_period_type == TimePeriodType.WEEKS:
+        self._period_days[index] = config.interest_period_value * 7
+      else:
+        self._calendar_period_indexes.append(index)
+    self._growth_logs = np.log(growth_bases)
+    is_stepped = (growth_bases != 1) & (
+      (self._period_days != 1) | (self._last_interest_ordinals[0] != self._settled_ordinal)
+    )
+    is_stepped[self._calendar_period_indexes] = True
+    self._stepped_columns = is_stepped.astype(np.int64)
+    self._in_step_columns = 1 - self._stepped_columns
+
+  def __schedule_calendar_events(self, record_dates: List[date]) -> None:
+    scheduler = self._scheduler
+    today = self._today
+    full_config = self._full_config
+    for year in range(today.year, full_config.output.end_date.year + 1):
+      scheduler.schedule(today, date(year, 1, 1))
+      scheduler.schedule(today, date(year, 4, 15))
+    scheduler.schedule(today, full_config.output.end_date)
+    for record_date in record_dates:
+      scheduler.schedule(today, record_date)
+    for bill_config in full_config.bills:
+      scheduler.schedule(today, bill_config.start_date)
+      if bill_config.end_date:
+        scheduler.schedule(today, bill_config.end_date + timedelta(days=1))
+    for debt_config in full_config.debts:
+      scheduler.schedule(today, debt_config.start_date)
+      scheduler.schedule(today, debt_config.end_date + timedelta(days=1))
+      if debt_config.asset:
+        scheduler.schedule(today, debt_config.asset.sell_date)
+    for income_config in full_config.income:
+      scheduler.schedule(today, income_config.start_date)
+      scheduler.schedule(today, income_config.end_date + timedelta(days=1))
+    for asset_config in full_config.assets:
+      scheduler.schedule(today, asset_config.sell_date)
+
+  def __schedule_entity_events(self, today: date) -> None:
+    # Interest and appreciation accrue lazily, so they never need a day of their own
+    scheduler = self._scheduler
+    for bill in self._bills:
+      scheduler.schedule(today, bill.get_next_charge_date())
+      scheduler.schedule(today, bill.get_next_increase_date())
+    for debt in self._debts:
+      scheduler.schedule(today, debt.get_next_charge_date())
+    for income in self._incomes:
+      scheduler.schedule(today, income.get_next_payment_date())
+      scheduler.schedule(today, income.get_next_increase_date())
+
+  def __simulate_day(self, last_day: date, today: date) -> None:
+    yesterday = today - timedelta(days=1)
+    for debt in self._debts:
+      debt.handle_skipped_days(last_day, today)
+      balance = debt.get_balance(today)
+      debt.accrue(yesterday)
+      self.__grow_debt(debt, balance, today)
+    for asset in self._assets:
+      asset.accrue(yesterday)
+    if today.month == 1 and today.day == 1:
+      self._inflation_shocks = self._rng.normal(0.0, self._inflation_volatility, self._paths)
+    self.__check_lifecycle(today)
+    due_set = DueSet(today, self._bills, self._debts, self._incomes)
+    self.__pay_incomes(today, due_set.get_paying_incomes())
+    for asset in self._assets:
+      asset.handle_appreciation(today, False)
+    self.__settle_accounts(today)
+    for debt in due_set.get_accruing_debts():
+      balance = debt.get_balance(today)
+      debt.handle_interest(today, False)
+      self.__grow_debt(debt, balance, today)
+    self.__handle_inflation_adjustments(today)
+    self.__pay_charges(today, due_set)
+    if today.month == 1 and today.day == 1:
+      self._last_years_tax_record = self._current_years_tax_record
+      self._current_years_tax_record = AnnualFederalIncomeTaxRecord()
+      if not self._is_married and (self._year_married + 1) == today.year:
+        self._is_married = True
+    if today.month == 4 and today.day == 15:
+      self.__handle_tax_day(today)
+    if due_set.get_paying_incomes():
+      self.__shuffle(today)
+
+  def __check_lifecycle(self, today: date) -> None:
+    """Simulator.__simulate_day's lifecycle checks, on the shared entities; sales are per path."""
+    lifecycle_index = self._lifecycle_index
+    for bill_config in lifecycle_index.pop_starting_bills(today):
+      bill = Bill(today, bill_config, self._ledger, self._output_sink)
+      self._bills.append(bill)
+      self._bill_charges[bill] = np.full(self._paths, bill.get_charge(), dtype=float)
+      lifecycle_index.add_bill(bill)
+    debt_configs = lifecycle_index.pop_starting_debts(today)
+    for debt_config in debt_configs:
+      debt = Debt(today, debt_config, self._ledger, self._output_sink)
+      self._debts.append(debt)
+      self._debt_balances[debt] = np.where(self._alive, float(debt.get_balance(today)), 0.0)
+      lifecycle_index.add_debt(debt, today)
+    if debt_configs:
+      self._payment_plan.set_debts(self._debts, today)
+    for income_config in lifecycle_index.pop_starting_incomes(today):
+      income = IncomeStream(today, income_config, self._ledger, self._output_sink)
+      self._incomes.append(income)
+      lifecycle_index.add_income(income)
+    for debt_asset in lifecycle_index.pop_debt_assets(today):
+      # A debt started twice shares its asset, as it does in the Simulator
+      if debt_asset in self._asset_sold:
+        continue
+      self._assets.append(debt_asset)
+      self._asset_paid_off[debt_asset] = np.full(self._paths, debt_asset.is_paid_off())
+      self._asset_sold[debt_asset] = ~self._alive
+      lifecycle_index.add_asset(debt_asset, today)
+    assets_to_sell = lifecycle_index.pop_assets_to_sell(today)
+    if assets_to_sell:
+      self.__settle_accounts(today - timedelta(days=1))
+    for asset in assets_to_sell:
+      self.__sell_asset(asset, self._alive & self._asset_paid_off[asset] & ~self._asset_sold[asset])
+    for bill in lifecycle_index.pop_ended_bills(today):
+      self._bills.remove(bill)
+      del self._bill_charges[bill]
+    ended_debts = lifecycle_index.pop_ended_debts(today)
+    for debt in ended_debts:
+      self._debts.remove(debt)
+      del self._debt_balances[debt]
+    if ended_debts:
+      self._payment_plan.set_debts(self._debts, today)
+    for income in lifecycle_index.pop_ended_incomes(today):
+      self._incomes.remove(income)
+
+  def __pay_incomes(self, today: date, paying_incomes: List[IncomeStream]) -> None:
+    """IncomeStream.handle_payout's deposits and routing; the 401k and HSA shares go to every running path."""
+    if not paying_incomes:
+      return
+    self.__settle_accounts(today - timedelta(days=1))
+    federal_tax_table = self._federal_tax_schedule.get_table(today.year, self._is_married)
+    for income in paying_incomes:
+      paycheck = income.take_paycheck(federal_tax_table, today, self._current_years_tax_record)
+      if paycheck is None:
+        continue
+      self.__deposit(self._first_fourk, paycheck.fourk_contribution)
+      self.__deposit(self._first_fourk, paycheck.fourk_employer_contribution)
+      self.__deposit(self._first_hsa, paycheck.hsa_contribution)
+      self.__deposit(self._first_hsa, paycheck.hsa_employer_contribution)
+      if paycheck.net:
+        self.__route_payout(today, paycheck.net)
+
+  def __deposit(self, account_index: int | None, amount: float) -> None:
+    if account_index is not None:
+      account_balances = self._balances[:, account_index]
+      np.add(account_balances, amount, out=account_balances, where=self._alive)
+
+  def __route_payout(self, today: date, net_payout: float) -> None:
+    """
+    IncomeStream's payment_order walk on every path: debts at or above their step's rate, then the first account
+    under its expectation.
+    """
+    balances = self._balances
+    rollover = np.where(self._alive, net_payout, 0.0)
+    for step_accounts, threshold in self._payment_plan.get_steps():
+      if step_accounts is None:
+        for debt in self._payment_plan.get_prioritized_debts():
+          if threshold is not None and debt.get_interest_rate(today) < threshold:
+            continue
+          debt_balances = self._debt_balances[debt]
+          paying = (rollover != 0) & (debt_balances > 0)
+          payments = np.where(debt_balances > rollover, rollover, debt_balances)[paying]
+          debt_balances[paying] -= payments
+          rollover[paying] -= payments
+      else:
+        depositing = rollover != 0
+        for account in step_accounts:
+          account_index = self._account_indexes[account]
+          depositing_here = depositing & (balances[:, account_index] < threshold) if threshold else depositing
+          balances[depositing_here, account_index] += rollover[depositing_here]
+          rollover[depositing_here] = 0.0
+          depositing &= ~depositing_here
+      if not rollover.any():
+        return
+
+  def __settle_accounts(self, until: date) -> None:
+    """
+    Account.accrue through `until` on every path in one closed-form step: empty accounts restart their period on
+    `until`, the rest grow by every whole period since they last did. Market accounts are scaled by a lognormal
+    shock over the days posted, centered so the expected growth is unchanged.
+    """
+    ordinal = until.toordinal()
+    if ordinal <= self._settled_ordinal:
+      return
+    # Accounts in step post every day since the last settle, whatever their balance, so one row covers all paths
+    days_elapsed = (ordinal - self._settled_ordinal) * self._in_step_columns
+    self._settled_ordinal = ordinal
+    if self._stepped_columns.any():
+      days_elapsed = days_elapsed + self.__get_stepped_days_elapsed(ordinal, until)
+    exponents = days_elapsed * self._growth_logs
+    balances = self._balances
+    if not self._return_volatility:
+      balances += balances * np.expm1(exponents)
+      return
+    variances = days_elapsed * self._daily_variances
+    shocked_exponents = np.multiply(self._rng.standard_normal((self._paths, 1)), np.sqrt(variances))
+    shocked_exponents += exponents - 0.5 * variances
+    balances *= np.exp(shocked_exponents, out=shocked_exponents)
+
+  def __get_stepped_days_elapsed(self, ordinal: int, until: date) -> np.ndarray:
+    """Days each path's stepped accounts post through `until`, zero for the accounts in step."""
+    last_interest_ordinals = self._last_interest_ordinals
+    np.copyto(last_interest_ordinals, ordinal, where=self._balances == 0)
+    # A last interest date still ahead of `until` has nothing due yet
+    days_elapsed = np.maximum(ordinal - last_interest_ordinals, 0)
+    days_elapsed -= days_elapsed % self._period_days
+    for account_index in self._calendar_period_indexes:
+      days_elapsed[:, account_index] = self.__get_calendar_days_elapsed(account_index, until)
+    days_elapsed *= self._stepped_columns
+    last_interest_ordinals += days_elapsed
+    return days_elapsed
+
+  def __get_calendar_days_elapsed(self, account_index: int, until: date) -> np.ndarray:
+    """Days to the last whole month or year period by `until`, found once per distinct last interest date."""
+    config = self._full_config.accounts[account_index]
+    last_interest_ordinals = self._last_interest_ordinals[:, account_index]
+    distinct_ordinals, positions = np.unique(last_interest_ordinals, return_inverse=True)
+    posting_ordinals = np.array([
+      DateCalculator.get_last_period_date(
+        date.fromordinal(int(last_interest_ordinal)),
+        config.interest_period_type,
+        config.interest_period_value,
+        until
+      ).toordinal() for last_interest_ordinal in distinct_ordinals
+    ], dtype=np.int64)
+    return posting_ordinals[positions] - last_interest_ordinals
+
+  def __grow_debt(self, debt: Debt, balance_before: float, today: date) -> None:
+    """Scales every path's balance by the interest the debt entity just took on `balance_before`."""
+    interest_gained = debt.get_balance(today) - balance_before
+    if interest_gained:
+      debt_balances = self._debt_balances[debt]
+      debt_balances += debt_balances * (interest_gained / balance_before)
+
+  def __handle_inflation_adjustments(self, today: date) -> None:
+    for bill in self._bills:
+      charge = bill.get_charge()
+      bill.handle_potential_charge_increase(today, False)
+      increase = bill.get_charge() - charge
+      if not increase:
+        continue
+      bill_charges = self._bill_charges[bill]
+      annual_inflation_percentage = bill.get_annual_inflation_percentage()
+      if annual_inflation_percentage:
+        # The bill's own rate, plus this year's shock on each path
+        shocked_rates = (annual_inflation_percentage + self._inflation_shocks) / annual_inflation_percentage
+        bill_charges += bill_charges * (increase / charge) * shocked_rates
+      else:
+        bill_charges += increase
+    for income in self._incomes:
+      income.handle_potential_charge_increase(today, False)
+
+  def __pay_charges(self, today: date, due_set: DueSet) -> None:
+    """
+    Bills, then debts, out of the accounts in order. Paths that hold enough for the whole day pay every charge at
+    once; the rest go one at a time through the Simulator's asset sales and bankruptcy checks.
+    """
+    charged_bills = [bill for bill in due_set.get_charging_bills() if bill.get_charge_due(today) is not None]
+    charged_debts: List[Tuple[Debt, float]] = []
+    for debt in due_set.get_charging_debts():
+      charge = debt.get_charge_due(today)
+      if charge is not None:
+        charged_debts.append((debt, charge))
+    if not charged_bills and not charged_debts:
+      return
+    bill_charges = [self._bill_charges[bill] for bill in charged_bills]
+    debt_charges = [self.__get_debt_charges(debt, charge, today) for debt, charge in charged_debts]
+    penalty_rates = self.__get_penalty_rates(today)
+    total_charges = np.zeros(self._paths)
+    for charges in bill_charges + debt_charges:
+      total_charges += charges
+    # Post-tax balances only fall by part of what is withdrawn, so covering the total covers every charge in turn
+    available = self._balances @ (1 - (self._income_tax_rates + penalty_rates))
+    covered = self._alive & (available >= total_charges + 0.01)
+    for charges in bill_charges + debt_charges:
+      self.__withdraw(covered, charges, penalty_rates)
+    for (debt, _), charges in zip(charged_debts, debt_charges):
+      self.__pay_debt_charge(debt, covered, charges)
+    for path in np.flatnonzero(self._alive & ~covered):
+      self.__pay_path_charges(
+        int(path),
+        today,
+        [float(charges[path]) for charges in bill_charges],
+        [(debt, float(charges[path])) for (debt, _), charges in zip(charged_debts, debt_charges)]
+      )
+    for bill in charged_bills:
+      bill.pay_charge(False, today, [])
+    for debt, charge in charged_debts:
+      debt.pay_charge(False, today, [charge], [], charge)
+
+  def __get_debt_charges(self, debt: Debt, charge: float, today: date) -> np.ndarray:
+    debt_balances = self._debt_balances[debt]
+    if charge >= debt.get_balance(today):
+      # The schedule's last charge clears whatever is left
+      return debt_balances.copy()
+    # A zero balance is charged nothing, which is the Simulator's skipped charge
+    return np.where(charge >= debt_balances, debt_balances, charge)
+
+  def __withdraw(self, paying: np.ndarray, charges: np.ndarray, penalty_rates: np.ndarray) -> None:
+    """WithdrawalPlanner.withdraw on the `paying` paths."""
+    balances = self._balances
+    income_tax_rates = self._income_tax_rates
+    running_charges = np.where(paying, charges, 0.0)
+    for account_index in range(balances.shape[1]):
+      if not running_charges.any():
+        return
+      account_balances = balances[:, account_index]
+      post_tax_balances = account_balances - (
+        account_balances * income_tax_rates[account_index] + account_balances * penalty_rates[account_index]
+      )
+      amounts = np.minimum(post_tax_balances, running_charges)
+      account_balances -= (amounts + amounts * income_tax_rates[account_index]) + amounts * penalty_rates[account_index]
+      running_charges -= amounts
+
+  def __pay_debt_charge(self, debt: Debt, paying: np.ndarray, charges: np.ndarray) -> None:
+    debt_balances = self._debt_balances[debt]
+    was_owed = paying & (debt_balances != 0)
+    debt_balances -= np.where(paying, charges, 0.0)
+    asset = debt.get_asset()
+    if asset is not None:
+      self._asset_paid_off[asset] |= was_owed & (debt_balances == 0)
+
+  def __pay_path_charges(
+    self,
+    path: int,
+    today: date,
+    bill_charges: List[float],
+    debt_charges: List[Tuple[Debt, float]]
+  ) -> None:
+    """Simulator.__handle_todays_payments for one path that may have to sell assets, or go bankrupt, to pay."""
+    debt_charges = [(debt, charge) for debt, charge in debt_charges if self._debt_balances[debt][path]]
+    charges = bill_charges + [charge for _, charge in debt_charges]
+    self.__cover_shortfall(path, self.__get_shortfall(path, today, charges))
+    for charge in bill_charges:
+      self.__cover_shortfall(path, charge - sum(self.__get_path_post_tax_balances(path, today)))
+      if self.__withdraw_on_path(path, today, charge) is None:
+        self.__go_bankrupt(path)
+        return
+    for debt, charge in debt_charges:
+      self.__cover_shortfall(path, charge - sum(self.__get_path_post_tax_balances(path, today)))
+      withdrawals = self.__withdraw_on_path(path, today, charge)
+      if withdrawals is None:
+        self.__go_bankrupt(path)
+        return
+      debt_balances = self._debt_balances[debt]
+      for withdrawal in withdrawals:
+        debt_balances[path] -= withdrawal
+      asset = debt.get_asset()
+      if asset is not None and debt_balances[path] == 0:
+        self._asset_paid_off[asset][path] = True
+
+  def __get_shortfall(self, path: int, today: date, charges: List[float]) -> float:
+    """WithdrawalPlanner.get_shortfall for one path."""
+    balances = self._balances[path].tolist()
+    per_dollar_rates = (self._income_tax_rates + self.__get_penalty_rates(today)).tolist()
+    post_tax_balances = self.__get_path_post_tax_balances(path, today)
+    shortfall = 0.0
+    for charge in charges:
+      available = sum(post_tax_balances)
+      if available < charge:
+        shortfall += charge - available
+        post_tax_balances = [0.0] * len(post_tax_balances)
+        continue
+      running_charge = charge
+      for account_index, post_tax_balance in enumerate(post_tax_balances):
+        amount = running_charge if post_tax_balance > running_charge else post_tax_balance
+        balances[account_index] -= amount + amount * per_dollar_rates[account_index]
+        balance = balances[account_index]
+        post_tax_balances[account_index] = balance - balance * per_dollar_rates[account_index]
+        if post_tax_balance > running_charge:
+          break
+        running_charge -= post_tax_balance
+    return shortfall
+
+  def __cover_shortfall(self, path: int, shortfall: float) -> None:
+    """Simulator.__cover_shortfall for one path: the LiquidationEngine's pick, sold into the first investment."""
+    if shortfall <= 0 or self._first_investment is None:
+      return
+    sellable_assets = [
+      asset for asset in self._assets if self._asset_paid_off[asset][path] and not self._asset_sold[asset][path]
+    ]
+    for asset in LiquidationEngine.choose_cheapest(sellable_assets, shortfall):
+      selling = np.zeros(self._paths, dtype=bool)
+      selling[path] = True
+      self.__sell_asset(asset, selling)
+
+  def __withdraw_on_path(self, path: int, today: date, charge: float) -> List[float] | None:
+    """WithdrawalPlanner.withdraw for one path, or None when it cannot cover `charge`."""
+    post_tax_balances = self.__get_path_post_tax_balances(path, today)
+    if sum(post_tax_balances) < charge:
+      return None
+    income_tax_rates = self._income_tax_rates
+    penalty_rates = self.__get_penalty_rates(today)
+    withdrawals: List[float] = []
+    running_charge = charge
+    for account_index, post_tax_balance in enumerate(post_tax_balances):
+      amount = running_charge if post_tax_balance > running_charge else post_tax_balance
+      self._balances[path, account_index] -= (
+        (amount + amount * income_tax_rates[account_index]) + amount * penalty_rates[account_index]
+      )
+      withdrawals.append(amount)
+      if post_tax_balance > running_charge:
+        break
+      running_charge -= post_tax_balance
+    return withdrawals
+
+  def __sell_asset(self, asset: Asset, selling: np.ndarray) -> None:
+    if self._first_investment is None:
+      return
+    self._balances[selling, self._first_investment] += asset.get_post_tax_value()
+    self._asset_sold[asset] |= selling
+
+  def __handle_tax_day(self, today: date) -> None:
+    federal_tax_table = self._federal_tax_schedule.get_table(today.year - 1, self._is_married)
+    tax_return = self._last_years_tax_record.get_annual_tax_returns(federal_tax_table)
+    if tax_return > 0:
+      self.__deposit(self._first_cash, tax_return)
+    elif tax_return < 0:
+      taxes_owed = abs(tax_return)
+      penalty_rates = self.__get_penalty_rates(today)
+      has_amount = self.__get_post_tax_balances(penalty_rates) > taxes_owed
+      for path in np.flatnonzero(self._alive & ~has_amount.any(axis=1)):
+        self.__go_bankrupt(int(path))
+      paying = np.flatnonzero(self._alive)
+      account_indexes = has_amount[paying].argmax(axis=1)
+      self._balances[paying, account_indexes] -= (
+        (taxes_owed + taxes_owed * self._income_tax_rates[account_indexes])
+        + taxes_owed * penalty_rates[account_indexes]
+      )
+
+  def __shuffle(self, today: date) -> None:
+    """
+    PaymentRoutingPlan.shuffle on every path at once: each pass makes the transfer the first-match rules pick on
+    each path that still has one, until none do.
+    """
+    balances = self._balances
+    penalty_rates = self.__get_penalty_rates(today)
+    first_cash = self._first_cash
+    shuffling = self._alive.copy()
+    while shuffling.any():
+      sources, overfills = self.__find_first(
+        shuffling,
+        [(index, balances[:, index] - point_of_overfill) for index, point_of_overfill in self._overfill_candidates]
+      )
+      shuffling &= sources >= 0
+      targets, _ = self.__find_first(
+        shuffling,
+        [(index, point_of_overfill - balances[:, index]) for index, point_of_overfill in self._underfill_targets]
+      )
+      targets[shuffling & (targets < 0)] = first_cash
+      shuffling &= sources != targets
+      self.__transfer(shuffling, sources, targets, overfills, penalty_rates)
+    shuffling = self._alive.copy()
+    while shuffling.any():
+      targets, amounts_missing = self.__find_first(
+        shuffling,
+        [(index, point_of_overfill - balances[:, index]) for index, point_of_overfill in self._underfill_targets]
+      )
+      shuffling &= targets >= 0
+      sources, amounts_spare = self.__find_spare_funds(shuffling, penalty_rates)
+      shuffling &= (sources >= 0) & (sources != targets)
+      amounts = np.minimum(amounts_spare, amounts_missing)
+      # An empty uncapped source; nothing more can move
+      shuffling &= amounts > 0
+      self.__transfer(shuffling, sources, targets, amounts, penalty_rates)
+
+  def __find_first(
+    self,
+    searching: np.ndarray,
+    candidates: List[Tuple[int, np.ndarray]]
+  ) -> Tuple[np.ndarray, np.ndarray]:
+    """Per path, the first candidate whose amount is over the shuffle tolerance (-1 if none), and that amount."""
+    shuffle_tolerance = self._payment_plan.get_shuffle_tolerance()
+    account_indexes = np.full(searching.shape, -1)
+    amounts = np.zeros(searching.shape)
+    for account_index, candidate_amounts in candidates:
+      found = searching & (account_indexes < 0) & (candidate_amounts > shuffle_tolerance)
+      account_indexes[found] = account_index
+      amounts[found] = candidate_amounts[found]
+    return account_indexes, amounts
+
+  def __find_spare_funds(self, searching: np.ndarray, penalty_rates: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    shuffle_tolerance = self._payment_plan.get_shuffle_tolerance()
+    post_tax_balances = self.__get_post_tax_balances(penalty_rates)
+    account_indexes = np.full(searching.shape, -1)
+    amounts = np.zeros(searching.shape)
+    for account_index, point_of_overfill in self._spare_fund_candidates:
+      found = searching & (account_indexes < 0)
+      if point_of_overfill:
+        spare_amounts = self._balances[:, account_index] - point_of_overfill
+        found &= spare_amounts > shuffle_tolerance
+      else:
+        spare_amounts = post_tax_balances[:, account_index]
+      account_indexes[found] = account_index
+      amounts[found] = spare_amounts[found]
+    return account_indexes, amounts
+
+  def __transfer(
+    self,
+    moving: np.ndarray,
+    sources: np.ndarray,
+    targets: np.ndarray,
+    amounts: np.ndarray,
+    penalty_rates: np.ndarray
+  ) -> None:
+    paths = np.flatnonzero(moving)
+    sources = sources[paths]
+    amounts = amounts[paths]
+    self._balances[paths, sources] -= (
+      (amounts + amounts * self._income_tax_rates[sources]) + amounts * penalty_rates[sources]
+    )
+    self._balances[paths, targets[paths]] += amounts
+
+  def __go_bankrupt(self, path: int) -> None:
+    self._alive[path] = False
+    self._balances[path] = 0.0
+    for debt_balances in self._debt_balances.values():
+      debt_balances[path] = 0.0
+    for asset_sold in self._asset_sold.values():
+      asset_sold[path] = True
+
+  def __get_net_worths(self) -> np.ndarray:
+    net_worths = self._balances.sum(axis=1)
+    for asset in self._assets:
+      net_worths += np.where(self._asset_sold[asset], 0.0, asset.get_post_tax_value())
+    for debt_balances in self._debt_balances.values():
+      net_worths -= debt_balances
+    return net_worths
+
+  def __get_penalty_rates(self, today: date) -> np.ndarray:
+    age_milestones = self._age_milestones
+    return np.array([age_milestones.get_penalty_rate(account_type, today) for account_type in self._account_types])
+
+  def __get_post_tax_balances(self, penalty_rates: np.ndarray) -> np.ndarray:
+    # Untaxed gains are never accrued, so income tax and penalties are all there is to take off
+    balances = self._balances
+    return balances - (balances * self._income_tax_rates + balances * penalty_rates)
+
+  def __get_path_post_tax_balances(self, path: int, today: date) -> List[float]:
+    balances = self._balances[path]
+    return (balances - (balances * self._income_tax_rates + balances * self.__get_penalty_rates(today))).tolist()
+
+  @staticmethod
+  def __get_first_account_index(account_types: List[AccountType], account_type: AccountType) -> int | None:
+    for account_index, current_account_type in enumerate(account_types):
+      if current_account_type == account_type:
+        return account_index
+    return None
@@ -0,0 +1,79 @@
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from models.results.daily_summary import DailySummary
+from models.results.simulation_result import SimulationResult
+
+
+class OutputSink:
+  """
+  Receives everything a run reports. The run offers every simulated day and each sink picks the
+  days it takes events for; the print frequency only decides which days get a daily summary. This
+  base class discards it all, so it doubles as the sink for quiet runs; TerminalRenderer and
+  JsonLinesWriter are the real consumers.
+  """
+
+  def is_recording(self, is_print_day: bool) -> bool:
+    """Whether to report today's events; declining lets the run skip the reporting work for the day."""
+    return False
+
+  def start_day(self, today: date, age: relativedelta) -> None:
+    pass
+
+  def start_section(self, title: str) -> None:
+    pass
+
+  def end_section(self) -> None:
+    pass
+
+  def bill_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    pass
+
+  def debt_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    pass
+
+  def bill_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    pass
+
+  def income_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    pass
+
+  def payout(self, name: str, amount: float, account_type: AccountType | None) -> None:
+    pass
+
+  def debt_allocation(self, name: str, amount: float) -> None:
+    pass
+
+  def account_allocation(self, name: str, amount: float) -> None:
+    pass
+
+  def account_interest(self, name: str, amount: float) -> None:
+    pass
+
+  def capital_gains(self, name: str, amount: float) -> None:
+    pass
+
+  def debt_interest(self, name: str, amount: float) -> None:
+    pass
+
+  def appreciation(self, name: str, amount: float) -> None:
+    pass
+
+  def tax_day(self, account_name: str | None, amount: float) -> None:
+    pass
+
+  def asset_sale(self, today: date, name: str, amount: float, is_forced: bool) -> None:
+    pass
+
+  def daily_summary(self, summary: DailySummary) -> None:
+    pass
+
+  def bankruptcy(self, age: relativedelta, money_needed: float, summary: DailySummary) -> None:
+    pass
+
+  def totals(self, result: SimulationResult) -> None:
+    pass
+
+  def close(self) -> None:
+    pass
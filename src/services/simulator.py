@@ -0,0 +1,862 @@
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, List, Tuple
+
+from dateutil.relativedelta import relativedelta
+
+from entities.account import Account
+from entities.asset import Asset
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.annual_federal_income_tax_record import AnnualFederalIncomeTaxRecord
+from entities.misc.due_set import DueSet
+from entities.misc.payment_routing_plan import PaymentRoutingPlan
+from entities.misc.phase_timer import PhaseTimer
+from entities.misc.warning_log import WarningLog
+from exceptions.bankrupt_exception import BankruptException
+from models.configs.full_config import FullConfig
+from models.enums.account_type import AccountType
+from models.enums.simulation_phase import SimulationPhase
+from models.results.daily_summary import DailySummary
+from models.results.simulation_checkpoint import SimulationCheckpoint
+from models.results.simulation_result import SimulationResult
+from services.checkpoint_store import CheckpointStore
+from services.console_printer import ConsolePrinter
+from services.date_calculator import DateCalculator
+from services.event_scheduler import EventScheduler
+from services.federal_tax_schedule import FederalTaxSchedule
+from services.lifecycle_index import LifecycleIndex
+from services.liquidation_engine import LiquidationEngine
+from services.output_sink import OutputSink
+from services.terminal_renderer import TerminalRenderer
+from services.withdrawal_planner import WithdrawalPlanner
+
+if TYPE_CHECKING:
+  from entities.account_store import AccountStore
+
+
+class Simulator:
+  _full_config: FullConfig
+  _ledger: Ledger
+  _quiet: bool
+  _warning_log: WarningLog
+  _output_sink: OutputSink
+  _phase_timer: PhaseTimer
+  _start_date: date
+  _today: date
+  _last_day: date
+  _is_married: bool
+  _year_married: int
+  _federal_tax_schedule: FederalTaxSchedule
+  _accounts: List[Account]
+  _account_store: "AccountStore | None"
+  _bills: List[Bill]
+  _debts: List[Debt]
+  _incomes: List[IncomeStream]
+  _assets: List[Asset]
+  _lifecycle_index: LifecycleIndex
+  _liquidation_engine: LiquidationEngine
+  _payment_plan: PaymentRoutingPlan
+  _last_output_date: date
+  _current_years_annual_federal_tax_income_record: AnnualFederalIncomeTaxRecord
+  _last_years_annual_federal_tax_income_record: AnnualFederalIncomeTaxRecord
+  _scheduler: EventScheduler | None
+  _checkpoint_store: CheckpointStore | None
+  _starting_employer_balance: float
+  _starting_stock_market_balance: float
+  _closing_employer_balance: float | None
+  _closing_stock_market_balance: float | None
+  _shuffle_transfer_count: int
+
+  def __init__(
+    self,
+    full_config: FullConfig,
+    today: date,
+    ledger: Ledger,
+    event_driven: bool = False,
+    quiet: bool = False,
+    headless: bool = False,
+    vectorized_accounts: bool = False,
+    output_sink: OutputSink | None = None,
+    phase_timer: PhaseTimer | None = None,
+    checkpoint_store: CheckpointStore | None = None,
+    resume_state: bytes | None = None
+  ):
+    """
+    With `resume_state` (a CheckpointStore-serialized checkpoint), the run picks up from there
+    instead of starting at `today`: its entities, ledger and mode (event-driven, vectorized
+    accounts) are the checkpoint's. full_config still decides the end date, output, payment order
+    and entities yet to start, and may move end and sell dates that have not passed.
+    """
+    self._full_config = full_config
+    self._ledger = ledger
+    self._quiet = quiet
+    self._warning_log = WarningLog(today, headless)
+    if output_sink:
+      self._output_sink = output_sink
+    elif quiet:
+      self._output_sink = OutputSink()
+    else:
+      self._output_sink = TerminalRenderer()
+    self._phase_timer = phase_timer or PhaseTimer(False)
+    self._checkpoint_store = checkpoint_store
+    self._federal_tax_schedule = FederalTaxSchedule(full_config.federal_tax)
+    if resume_state:
+      self.__restore(CheckpointStore.deserialize(resume_state, self._output_sink, self._warning_log))
+      return
+    self._start_date = today
+    self._today = today
+    self._last_day = today
+    self.__init_marriage(full_config.married)
+    self._account_store = None
+    age_milestones = AgeMilestones(full_config.dob)
+    if vectorized_accounts:
+      # Deferred so the object path never imports NumPy
+      from entities.account_store import AccountStore  # pylint: disable=import-outside-toplevel
+      self._account_store = AccountStore(today, full_config.accounts, ledger, age_milestones, self._warning_log, self._output_sink)
+      self._accounts = self._account_store.get_accounts()
+    else:
+      self._accounts = self.__build_accounts(age_milestones)
+    self._bills = self.__build_starting_bills()
+    self._debts = self.__build_starting_debts()
+    self._incomes = self.__build_starting_incomes()
+    self._assets = self.__build_all_assets()
+    self.__build_lifecycle_index()
+    self._liquidation_engine = LiquidationEngine(self._assets)
+    self._payment_plan = PaymentRoutingPlan(
+      full_config.payment_order,
+      full_config.shuffle_tolerance,
+      self._accounts,
+      self._debts,
+      today
+    )
+    self._last_output_date = today
+    self._current_years_annual_federal_tax_income_record = AnnualFederalIncomeTaxRecord()
+    self._last_years_annual_federal_tax_income_record = AnnualFederalIncomeTaxRecord()
+    self._scheduler = None
+    if event_driven:
+      self._scheduler = EventScheduler()
+      self.__schedule_calendar_events()
+    self._starting_employer_balance = ledger.get_employer().peak_balance()
+    self._starting_stock_market_balance = ledger.get_stock_market().peak_balance()
+    self._closing_employer_balance = None
+    self._closing_stock_market_balance = None
+    self._shuffle_transfer_count = 0
+
+  def __restore(self, checkpoint: SimulationCheckpoint) -> None:
+    self._ledger = checkpoint.ledger
+    self._start_date = checkpoint.start_date
+    self._today = checkpoint.today
+    self._last_day = checkpoint.last_day
+    self._warning_log.set_today(checkpoint.today)
+    self._is_married = checkpoint.is_married
+    self._year_married = checkpoint.year_married
+    self._accounts = checkpoint.accounts
+    self._account_store = checkpoint.account_store
+    self._bills = checkpoint.bills
+    self._debts = checkpoint.debts
+    self._incomes = checkpoint.incomes
+    self._assets = checkpoint.assets
+    self._payment_plan = PaymentRoutingPlan(
+      self._full_config.payment_order,
+      self._full_config.shuffle_tolerance,
+      self._accounts,
+      self._debts,
+      self._today
+    )
+    self._last_output_date = checkpoint.last_output_date
+    self._current_years_annual_federal_tax_income_record = checkpoint.current_years_annual_federal_tax_income_record
+    self._last_years_annual_federal_tax_income_record = checkpoint.last_years_annual_federal_tax_income_record
+    self._scheduler = checkpoint.scheduler
+    self.__apply_configured_end_dates()
+    self.__build_lifecycle_index()
+    self._liquidation_engine = LiquidationEngine(self._assets)
+    if self._scheduler:
+      # The end date may have moved since the checkpoint; queued dates are never queued twice
+      self.__schedule_calendar_events()
+    self._starting_employer_balance = checkpoint.starting_employer_balance
+    self._starting_stock_market_balance = checkpoint.starting_stock_market_balance
+    self._closing_employer_balance = None
+    self._closing_stock_market_balance = None
+    self._shuffle_transfer_count = checkpoint.shuffle_transfer_count
+
+  def __apply_configured_end_dates(self) -> None:
+    bill_configs = {config.name: config for config in self._full_config.bills}
+    for bill in self._bills:
+      if bill.get_name() in bill_configs:
+        bill.set_end_date(bill_configs[bill.get_name()].end_date)
+    income_configs = {config.name: config for config in self._full_config.income}
+    for income in self._incomes:
+      if income.get_name() in income_configs:
+        income.set_end_date(income_configs[income.get_name()].end_date)
+    asset_configs = {config.name: config for config in self._full_config.assets}
+    for debt_config in self._full_config.debts:
+      if debt_config.asset:
+        asset_configs[debt_config.asset.name] = debt_config.asset
+    debt_assets = [debt.get_asset() for debt in self._debts]
+    for asset in self._assets + [asset for asset in debt_assets if asset and asset not in self._assets]:
+      if asset.get_name() in asset_configs:
+        asset.set_sell_date(asset_configs[asset.get_name()].sell_date)
+
+  def build_checkpoint(self) -> SimulationCheckpoint:
+    return SimulationCheckpoint(
+      start_date=self._start_date,
+      today=self._today,
+      last_day=self._last_day,
+      last_output_date=self._last_output_date,
+      is_married=self._is_married,
+      year_married=self._year_married,
+      ledger=self._ledger,
+      starting_employer_balance=self._starting_employer_balance,
+      starting_stock_market_balance=self._starting_stock_market_balance,
+      shuffle_transfer_count=self._shuffle_transfer_count,
+      accounts=self._accounts,
+      account_store=self._account_store,
+      bills=self._bills,
+      debts=self._debts,
+      incomes=self._incomes,
+      assets=self._assets,
+      current_years_annual_federal_tax_income_record=self._current_years_annual_federal_tax_income_record,
+      last_years_annual_federal_tax_income_record=self._last_years_annual_federal_tax_income_record,
+      scheduler=self._scheduler
+    )
+
+  def __init_marriage(self, married: bool | int) -> None:
+    if isinstance(married, bool):
+      self._year_married = self._today.year
+      self._is_married = married
+    elif isinstance(married, int):
+      self._year_married = married
+      self._is_married = self._today.year >= married
+    else:
+      raise RuntimeError("Bad value for \"married\"")
+
+  def run(self, stop_date: date | None = None) -> SimulationResult:
+    """Simulates through the end date, or stops at the start of `stop_date` so the state there can be checkpointed."""
+    journal = self._ledger.get_journal()
+    phase_timer = self._phase_timer
+    checkpoint_store = self._checkpoint_store
+    next_checkpoint_date = checkpoint_store.get_next_checkpoint_date(self._today) if checkpoint_store else None
+    if stop_date and self._scheduler:
+      # Make sure the event loop lands on stop_date rather than stepping over it
+      self._scheduler.schedule(self._today, stop_date)
+    try:
+      while self._today <= self._full_config.output.end_date:
+        if stop_date and self._today >= stop_date:
+          break
+        if checkpoint_store and next_checkpoint_date and self._today >= next_checkpoint_date:
+          checkpoint_store.save(self.build_checkpoint())
+          next_checkpoint_date = checkpoint_store.get_next_checkpoint_date(self._today)
+        if self._scheduler:
+          with phase_timer.measure(SimulationPhase.ACCRUALS):
+            self.__handle_skipped_days()
+            self.__handle_accruals(self._today - timedelta(days=1))
+        with phase_timer.measure(SimulationPhase.CIRCULATION_CHECK):
+          assert abs(journal.get_imbalance()) < 0.01
+        if self._today == self._full_config.output.end_date:
+          self.__close_counterparty_balances()
+        self.__simulate_day()
+        with phase_timer.measure(SimulationPhase.SCHEDULING):
+          self.__advance_day()
+    except BankruptException as b:
+      self._output_sink.bankruptcy(self.__get_age(), b.get_money_needed(), self.__build_daily_summary())
+      result = self.__build_result(b.get_money_needed())
+      self._output_sink.totals(result)
+      return result
+    result = self.__build_result(None)
+    if self._today > self._full_config.output.end_date:
+      self._output_sink.totals(result)
+    return result
+
+  def __simulate_day(self) -> None:
+    today = self._today
+    phase_timer = self._phase_timer
+    with phase_timer.measure(SimulationPhase.LIFECYCLE):
+      self._warning_log.set_today(today)
+      self.__check_for_new_bills()
+      self.__check_for_new_debts()
+      self.__check_for_new_incomes()
+      self.__check_for_new_assets()
+      self.__check_asset_sell_dates()
+      self.__check_for_ended_bills()
+      self.__check_for_ended_debts()
+      self.__check_for_ended_incomes()
+      due_set = DueSet(today, self._bills, self._debts, self._incomes)
+    with phase_timer.measure(SimulationPhase.OUTPUT):
+      is_summary_day, is_print_day = self.__start_output_day()
+    with phase_timer.measure(SimulationPhase.INCOME):
+      is_shuffle_day = len(due_set.get_paying_incomes()) > 0
+      self.__handle_todays_income(is_print_day, due_set)
+    with phase_timer.measure(SimulationPhase.APPRECIATION):
+      self.__handle_todays_appreciation(is_print_day)
+    with phase_timer.measure(SimulationPhase.INTEREST):
+      self.__handle_todays_interest(is_print_day, due_set)
+    with phase_timer.measure(SimulationPhase.CAPITAL_GAINS):
+      self.__handle_todays_capital_gains(is_print_day)
+    with phase_timer.measure(SimulationPhase.INFLATION):
+      self.__handle_todays_inflation_adjustments(is_print_day)
+    with phase_timer.measure(SimulationPhase.PAYMENTS):
+      self.__handle_todays_payments(is_print_day, due_set)
+    is_new_year = today.month == 1 and today.day == 1
+    if is_new_year:
+      self._last_years_annual_federal_tax_income_record = self._current_years_annual_federal_tax_income_record
+      self._current_years_annual_federal_tax_income_record = AnnualFederalIncomeTaxRecord()
+      if not self._is_married and (self._year_married + 1) == today.year:
+        self._is_married = True
+    is_tax_day = today.month == 4 and today.day == 15
+    if is_tax_day:
+      with phase_timer.measure(SimulationPhase.TAX_DAY):
+        self.__handle_tax_day(is_print_day)
+    if is_shuffle_day:
+      with phase_timer.measure(SimulationPhase.SHUFFLE):
+        self.__shuffle_funds()
+    if is_summary_day:
+      with phase_timer.measure(SimulationPhase.OUTPUT):
+        self._output_sink.daily_summary(self.__build_daily_summary())
+    if is_summary_day and self._full_config.output.pause_on_output:
+      self._warning_log.pause(f"\n\t[{ConsolePrinter.get_formatted_date(today)} --- Age: {self.__get_age().years}]")
+
+  def __start_output_day(self) -> Tuple[bool, bool]:
+    """
+    Returns whether today gets a daily summary and whether the sink takes today's events. The print
+    frequency only spaces out the summaries; which days' events get reported is the sink's call.
+    """
+    is_summary_day = self.__is_print_day()
+    if is_summary_day:
+      self._last_output_date = self._today
+    is_print_day = self._output_sink.is_recording(is_summary_day)
+    if is_print_day:
+      self._output_sink.start_day(self._today, self.__get_age())
+    return is_summary_day, is_print_day
+
+  def __advance_day(self) -> None:
+    self._last_day = self._today
+    if self._scheduler:
+      self.__schedule_entity_events()
+      self._today = self._scheduler.pop_next_day(self._today)
+    else:
+      self._today += timedelta(days=1)
+
+  def __close_counterparty_balances(self) -> None:
+    """
+    The "obtained from" totals have always been taken as the last day starts, so they leave out
+    that day's own interest and payouts.
+    """
+    self.__settle_accounts()
+    self._closing_employer_balance = self._ledger.get_employer().peak_balance()
+    self._closing_stock_market_balance = self._ledger.get_stock_market().peak_balance()
+
+  def __settle_accounts(self) -> None:
+    # The store posts growth when balances are next touched; the ledger is read without touching them
+    if self._account_store:
+      self._account_store.settle()
+
+  def __build_result(self, money_needed: float | None) -> SimulationResult:
+    self.__settle_accounts()
+    employer_balance = self._closing_employer_balance
+    if employer_balance is None:
+      employer_balance = self._ledger.get_employer().peak_balance()
+    stock_market_balance = self._closing_stock_market_balance
+    if stock_market_balance is None:
+      stock_market_balance = self._ledger.get_stock_market().peak_balance()
+    return SimulationResult(
+      start_date=self._start_date,
+      end_date=min(self._today, self._full_config.output.end_date),
+      bankruptcy_date=self._today if money_needed is not None else None,
+      money_needed=money_needed or 0.0,
+      final_net_worth=self.get_net_worth(),
+      obtained_from_employers=self._starting_employer_balance - employer_balance,
+      obtained_from_stock_market=self._starting_stock_market_balance - stock_market_balance,
+      shuffle_transfer_count=self._shuffle_transfer_count,
+      warnings=self._warning_log.get_warnings(),
+      phase_timings=self._phase_timer.get_timings()
+    )
+
+  def get_net_worth(self) -> float:
+    total_debt_balance = 0.0
+    for debt in self._debts:
+      total_debt_balance += debt.get_balance(self._today)
+    total_account_balance = self.__get_total_account_balance()
+    total_assets_value = 0.0
+    for asset in self._assets:
+      if not asset.is_sold():
+        total_assets_value += asset.get_post_tax_value()
+    return total_account_balance + total_assets_value - total_debt_balance
+
+  def __handle_todays_income(self, is_print_day: bool, due_set: DueSet) -> None:
+    paying_incomes = due_set.get_paying_incomes()
+    if not paying_incomes:
+      return
+    if is_print_day:
+      self._output_sink.start_section("IncomeStream Payments")
+    federal_tax_table = self._federal_tax_schedule.get_table(self._today.year, self._is_married)
+    for income in paying_incomes:
+      income.handle_payout(
+        is_print_day,
+        federal_tax_table,
+        self._today,
+        self._current_years_annual_federal_tax_income_record,
+        self._payment_plan,
+        self._accounts
+      )
+    if is_print_day:
+      self._output_sink.end_section()
+
+  def __handle_todays_appreciation(self, is_print_day: bool) -> None:
+    is_appreciation_print_day = is_print_day and self.__is_asset_appreciation()
+    if is_appreciation_print_day:
+      self._output_sink.start_section("Asset Appreciation")
+    for asset in self._assets:
+      asset.handle_appreciation(self._today, is_print_day)
+    if is_appreciation_print_day:
+      self._output_sink.end_section()
+
+  def __handle_todays_interest(self, is_print_day: bool, due_set: DueSet) -> None:
+    is_account_interest_print_day = is_print_day and self.__is_account_interest()
+    accruing_debts = due_set.get_accruing_debts()
+    is_debt_interest_print_day = is_print_day and len(accruing_debts) > 0
+    if is_account_interest_print_day:
+      self._output_sink.start_section("Account Interest")
+    if self._account_store and not is_print_day:
+      self._account_store.handle_interest(self._today)
+    else:
+      for account in self._accounts:
+        account.handle_interest(self._today, is_print_day)
+    if is_account_interest_print_day:
+      self._output_sink.end_section()
+    if is_debt_interest_print_day:
+      self._output_sink.start_section("Debt Interest")
+    for debt in accruing_debts:
+      debt.handle_interest(self._today, is_print_day)
+    if is_debt_interest_print_day:
+      self._output_sink.end_section()
+
+  def __handle_todays_capital_gains(self, is_print_day: bool) -> None:
+    is_account_capital_gains_print_day = is_print_day and self.__is_capital_gains()
+    if is_account_capital_gains_print_day:
+      self._output_sink.start_section("Capital Gains")
+    if self._account_store and not is_print_day:
+      self._account_store.handle_capital_gains(self._today)
+    else:
+      for account in self._accounts:
+        account.handle_capital_gains(self._today, is_print_day)
+    if is_account_capital_gains_print_day:
+      self._output_sink.end_section()
+
+  def __handle_todays_inflation_adjustments(self, is_print_day: bool) -> None:
+    is_bill_inflation_adjustment_print_day = is_print_day and self.__is_bill_charge_increase()
+    if is_bill_inflation_adjustment_print_day:
+      self._output_sink.start_section("Inflation Adjustments")
+    for bill in self._bills:
+      bill.handle_potential_charge_increase(self._today, is_print_day)
+    is_income_inflation_adjustment_print_day = is_print_day and self.__is_income_charge_increase()
+    for income in self._incomes:
+      income.handle_potential_charge_increase(self._today, is_print_day)
+    if is_bill_inflation_adjustment_print_day or is_income_inflation_adjustment_print_day:
+      self._output_sink.end_section()
+
+  def __handle_todays_payments(self, is_print_day: bool, due_set: DueSet) -> None:
+    today = self._today
+    bill_charges: List[Tuple[Bill, float]] = []
+    for bill in due_set.get_charging_bills():
+      bill_charge = bill.get_charge_due(today)
+      if bill_charge is not None:
+        bill_charges.append((bill, bill_charge))
+    debt_charges: List[Tuple[Debt, float]] = []
+    for debt in due_set.get_charging_debts():
+      debt_charge = debt.get_charge_due(today)
+      if debt_charge is not None:
+        debt_charges.append((debt, debt_charge))
+    if not bill_charges and not debt_charges:
+      return
+    is_bill_payment_print_day = is_print_day and len(bill_charges) > 0
+    is_debt_payment_print_day = is_print_day and len(debt_charges) > 0
+    withdrawal_planner = WithdrawalPlanner(self._accounts, self.__get_post_tax_balances(), today)
+    if is_bill_payment_print_day:
+      self._output_sink.start_section("Bill Payments")
+    # One sale covers the whole day when it can; otherwise each charge gets its own try before bankruptcy
+    charges = [charge for _, charge in bill_charges + debt_charges]
+    self.__cover_shortfall(withdrawal_planner, withdrawal_planner.get_shortfall(charges))
+    for bill, bill_charge in bill_charges:
+      self.__cover_shortfall(withdrawal_planner, bill_charge - withdrawal_planner.get_available())
+      bill.pay_charge(is_print_day, today, withdrawal_planner.withdraw(bill_charge))
+    if is_bill_payment_print_day:
+      self._output_sink.end_section()
+    if is_debt_payment_print_day:
+      self._output_sink.start_section("Debt Payments")
+    for debt, debt_charge in debt_charges:
+      self.__cover_shortfall(withdrawal_planner, debt_charge - withdrawal_planner.get_available())
+      paid_off_asset = debt.pay_charge(
+        is_print_day,
+        today,
+        withdrawal_planner.withdraw(debt_charge),
+        self._assets,
+        debt_charge
+      )
+      if paid_off_asset:
+        self._liquidation_engine.add(paid_off_asset)
+    if is_debt_payment_print_day:
+      self._output_sink.end_section()
+
+  def __build_accounts(self, age_milestones: AgeMilestones) -> List[Account]:
+    accounts: List[Account] = []
+    for config in self._full_config.accounts:
+      accounts.append(Account(
+        today=self._today,
+        account_config=config,
+        ledger=self._ledger,
+        age_milestones=age_milestones,
+        warning_log=self._warning_log,
+        output_sink=self._output_sink
+      ))
+    return accounts
+
+  def __build_starting_bills(self) -> List[Bill]:
+    bills: List[Bill] = []
+    for config in self._full_config.bills:
+      if self._today >= config.start_date:
+        bills.append(Bill(
+          today=self._today,
+          bill_config=config,
+          ledger=self._ledger,
+          output_sink=self._output_sink
+        ))
+    return bills
+
+  def __build_starting_debts(self) -> List[Debt]:
+    debts: List[Debt] = []
+    for config in self._full_config.debts:
+      if self._today >= config.start_date:
+        debts.append(Debt(
+          today=self._today,
+          debt_config=config,
+          ledger=self._ledger,
+          output_sink=self._output_sink
+        ))
+    return debts
+
+  def __build_starting_incomes(self) -> List[IncomeStream]:
+    incomes: List[IncomeStream] = []
+    for config in self._full_config.income:
+      if self._today >= config.start_date:
+        incomes.append(IncomeStream(
+          today=self._today,
+          income_config=config,
+          ledger=self._ledger,
+          output_sink=self._output_sink
+        ))
+    return incomes
+
+  def __build_all_assets(self) -> List[Asset]:
+    assets: List[Asset] = []
+    for config in self._full_config.assets:
+      assets.append(Asset(
+        True,
+        self._today,
+        config,
+        self._output_sink
+      ))
+    return assets
+
+  def __build_lifecycle_index(self) -> None:
+    self._lifecycle_index = LifecycleIndex(self._full_config, self._today)
+    for bill in self._bills:
+      self._lifecycle_index.add_bill(bill)
+    for debt in self._debts:
+      self._lifecycle_index.add_debt(debt, self._today)
+    for income in self._incomes:
+      self._lifecycle_index.add_income(income)
+    for asset in self._assets:
+      self._lifecycle_index.add_asset(asset, self._today)
+
+  def __check_for_new_bills(self) -> None:
+    for config in self._lifecycle_index.pop_starting_bills(self._today):
+      bill = Bill(today=self._today, bill_config=config, ledger=self._ledger, output_sink=self._output_sink)
+      self._bills.append(bill)
+      self._lifecycle_index.add_bill(bill)
+
+  def __check_for_new_debts(self) -> None:
+    configs = self._lifecycle_index.pop_starting_debts(self._today)
+    for config in configs:
+      debt = Debt(today=self._today, debt_config=config, ledger=self._ledger, output_sink=self._output_sink)
+      self._debts.append(debt)
+      self._lifecycle_index.add_debt(debt, self._today)
+    if configs:
+      self._payment_plan.set_debts(self._debts, self._today)
+
+  def __check_for_new_incomes(self) -> None:
+    for config in self._lifecycle_index.pop_starting_incomes(self._today):
+      income = IncomeStream(today=self._today, income_config=config, ledger=self._ledger, output_sink=self._output_sink)
+      self._incomes.append(income)
+      self._lifecycle_index.add_income(income)
+
+  def __check_for_new_assets(self) -> None:
+    for debt_asset in self._lifecycle_index.pop_debt_assets(self._today):
+      # A resumed run re-adds every debt's asset, including ones already here or sold
+      if debt_asset.is_sold() or debt_asset in self._assets:
+        continue
+      self._assets.append(debt_asset)
+      self._lifecycle_index.add_asset(debt_asset, self._today)
+      self._liquidation_engine.add(debt_asset)
+
+  def __check_asset_sell_dates(self) -> None:
+    assets_to_sell = self._lifecycle_index.pop_assets_to_sell(self._today)
+    if not assets_to_sell:
+      return
+    for asset in self._assets:
+      if asset in assets_to_sell:
+        if asset.is_sellable():
+          for account in self._accounts:
+            if account.get_type() == AccountType.INVESTMENT:
+              sold_assets_worth = asset.sell()
+              worth_taken_from_buyer = self._ledger.get_buyer().take(sold_assets_worth)
+              account.deposit(worth_taken_from_buyer)
+              self._output_sink.asset_sale(self._today, asset.get_name(), worth_taken_from_buyer, False)
+              self._liquidation_engine.remove(asset)
+              break
+    self._assets = [a for a in self._assets if not a.is_sold()]
+
+  def __check_for_ended_bills(self) -> None:
+    for bill in self._lifecycle_index.pop_ended_bills(self._today):
+      self._bills.remove(bill)
+
+  def __check_for_ended_debts(self) -> None:
+    ended_debts = self._lifecycle_index.pop_ended_debts(self._today)
+    for debt in ended_debts:
+      self._debts.remove(debt)
+    if ended_debts:
+      self._payment_plan.set_debts(self._debts, self._today)
+
+  def __check_for_ended_incomes(self) -> None:
+    for income in self._lifecycle_index.pop_ended_incomes(self._today):
+      self._incomes.remove(income)
+
+  def __schedule_calendar_events(self) -> None:
+    assert self._scheduler
+    scheduler = self._scheduler
+    today = self._today
+    full_config = self._full_config
+    for year in range(today.year, full_config.output.end_date.year + 1):
+      scheduler.schedule(today, date(year, 1, 1))
+      scheduler.schedule(today, date(year, 4, 15))
+    scheduler.schedule(today, full_config.output.start_date)
+    scheduler.schedule(today, full_config.output.end_date)
+    for bill_config in full_config.bills:
+      scheduler.schedule(today, bill_config.start_date)
+      if bill_config.end_date:
+        scheduler.schedule(today, bill_config.end_date + timedelta(days=1))
+    for debt_config in full_config.debts:
+      scheduler.schedule(today, debt_config.start_date)
+      scheduler.schedule(today, debt_config.end_date + timedelta(days=1))
+      if debt_config.asset:
+        scheduler.schedule(today, debt_config.asset.sell_date)
+    for income_config in full_config.income:
+      scheduler.schedule(today, income_config.start_date)
+      scheduler.schedule(today, income_config.end_date + timedelta(days=1))
+    for asset_config in full_config.assets:
+      scheduler.schedule(today, asset_config.sell_date)
+
+  def __schedule_entity_events(self) -> None:
+    assert self._scheduler
+    scheduler = self._scheduler
+    today = self._today
+    # Interest and appreciation accrue lazily, so they never need a day of their own
+    scheduler.schedule(today, self.__get_next_print_day())
+    for bill in self._bills:
+      scheduler.schedule(today, bill.get_next_charge_date())
+      scheduler.schedule(today, bill.get_next_increase_date())
+    for debt in self._debts:
+      scheduler.schedule(today, debt.get_next_charge_date())
+    for income in self._incomes:
+      scheduler.schedule(today, income.get_next_payment_date())
+      scheduler.schedule(today, income.get_next_increase_date())
+
+  def __handle_skipped_days(self) -> None:
+    if self._account_store:
+      self._account_store.handle_skipped_days(self._last_day, self._today)
+    else:
+      for account in self._accounts:
+        account.handle_skipped_days(self._last_day, self._today)
+    for debt in self._debts:
+      debt.handle_skipped_days(self._last_day, self._today)
+
+  def __handle_accruals(self, until: date) -> None:
+    if self._account_store:
+      self._account_store.accrue(until)
+    else:
+      for account in self._accounts:
+        account.accrue(until)
+    for asset in self._assets:
+      asset.accrue(until)
+    for debt in self._debts:
+      debt.accrue(until)
+
+  def __get_next_print_day(self) -> date | None:
+    output = self._full_config.output
+    today = self._today
+    if self._quiet:
+      return None
+    if output.every_day:
+      next_print_day = today + timedelta(days=1)
+    elif output.every_week:
+      next_print_day = self._last_output_date + timedelta(weeks=1)
+    elif output.every_month:
+      next_print_day = DateCalculator.add_months(self._last_output_date, 1)
+    elif output.every_year:
+      next_print_day = DateCalculator.add_months(self._last_output_date, 12)
+    elif output.every_decade:
+      next_print_day = DateCalculator.add_months(self._last_output_date, 120)
+    else:
+      return None
+    # Month and year math can land a day short around month ends, so fall back to checking tomorrow
+    if next_print_day <= today:
+      return today + timedelta(days=1)
+    return next_print_day
+
+  def __is_print_day(self) -> bool:  # pylint: disable=too-many-return-statements
+    output = self._full_config.output
+    today = self._today
+    if self._quiet:
+      return False
+    if output.start_date and today < output.start_date:
+      return False
+    if today == output.start_date:
+      return True
+    if today == output.end_date:
+      return True
+    if output.every_day:
+      return True
+    if output.every_week:
+      return (today - self._last_output_date).days >= 7
+    # A whole month, year or decade has passed once today reaches the clamped anniversary
+    if output.every_month:
+      return today >= DateCalculator.add_months(self._last_output_date, 1)
+    if output.every_year:
+      return today >= DateCalculator.add_months(self._last_output_date, 12)
+    if output.every_decade:
+      return today >= DateCalculator.add_months(self._last_output_date, 120)
+    return False
+
+  def __build_daily_summary(self) -> DailySummary:
+    today = self._today
+    total_debt_balance = 0
+    for debt in self._debts:
+      total_debt_balance += debt.get_balance(today)
+    total_account_balance = 0
+    for account in self._accounts:
+      total_account_balance += account.get_balance()
+    total_sellable_assets_value = 0
+    for asset in self._assets:
+      if asset.is_sellable():
+        total_sellable_assets_value += asset.get_post_tax_value()
+    total_assets_value = 0
+    for asset in self._assets:
+      total_assets_value += asset.get_post_tax_value()
+    return DailySummary(
+      date=today,
+      total_debt_balance=total_debt_balance,
+      debt_balances=[(debt.get_name(), debt.get_balance(today)) for debt in self._debts],
+      total_account_balance=total_account_balance,
+      account_balances=[(account.get_name(), account.get_balance()) for account in self._accounts],
+      total_sellable_assets_value=total_sellable_assets_value,
+      total_assets_value=total_assets_value,
+      asset_values=[(asset.get_name(), asset.get_value(), asset.is_paid_off()) for asset in self._assets],
+      net_worth=total_account_balance + total_assets_value - total_debt_balance
+    )
+
+  def __is_asset_appreciation(self) -> bool:
+    for asset in self._assets:
+      if asset.appreciates_today(self._today):
+        return True
+    return False
+
+  def __is_account_interest(self) -> bool:
+    for account in self._accounts:
+      if account.is_interest_today(self._today):
+        return True
+    return False
+
+  def __is_capital_gains(self) -> bool:
+    for account in self._accounts:
+      if account.is_capital_gains_today(self._today):
+        return True
+    return False
+
+  def __is_bill_charge_increase(self) -> bool:
+    for bill in self._bills:
+      if bill.increases_today(self._today):
+        return True
+    return False
+
+  def __is_income_charge_increase(self) -> bool:
+    for income in self._incomes:
+      if income.increases_today(self._today):
+        return True
+    return False
+
+  def __get_age(self) -> relativedelta:
+    # Only printed, so worked out on demand; penalties go by AgeMilestones
+    return relativedelta(self._today, self._full_config.dob)
+
+  def __get_post_tax_balances(self) -> List[float]:
+    if self._account_store:
+      return self._account_store.get_post_tax_balances(self._today).tolist()
+    return [account.get_post_tax_balance(self._today) for account in self._accounts]
+
+  def __cover_shortfall(self, withdrawal_planner: WithdrawalPlanner, shortfall: float) -> None:
+    """Sells assets into the first investment account to raise `shortfall`, if they can raise all of it."""
+    if shortfall <= 0:
+      return
+    investment_account = next((a for a in self._accounts if a.get_type() == AccountType.INVESTMENT), None)
+    if not investment_account:
+      return
+    assets_to_sell = self._liquidation_engine.choose_assets_to_sell(shortfall)
+    if not assets_to_sell:
+      return
+    self._warning_log.warn("Selling", ", ".join(asset.get_name() for asset in assets_to_sell), "out of desperation.")
+    for asset in assets_to_sell:
+      worth_taken_from_buyer = self._ledger.get_buyer().take(asset.sell())
+      investment_account.deposit(worth_taken_from_buyer)
+      self._output_sink.asset_sale(self._today, asset.get_name(), worth_taken_from_buyer, True)
+      self._liquidation_engine.remove(asset)
+    withdrawal_planner.refresh(investment_account)
+    self._assets = [a for a in self._assets if not a.is_sold()]
+
+  def __handle_tax_day(self, is_print_day: bool) -> None:
+    if is_print_day:
+      self._output_sink.start_section("Tax Day")
+    federal_tax_table = self._federal_tax_schedule.get_table(self._today.year - 1, self._is_married)
+    tax_return = self._last_years_annual_federal_tax_income_record.get_annual_tax_returns(federal_tax_table)
+    if tax_return > 0:
+      cash_account = self._payment_plan.get_first_cash_account()
+      cash_account.deposit(self._ledger.get_internal_revenue_service().take(tax_return))
+      if is_print_day:
+        self._output_sink.tax_day(cash_account.get_name(), tax_return)
+    elif tax_return < 0:
+      taxes_owed = abs(tax_return)
+      account = self.__get_first_account_with_amount(taxes_owed)
+      self._ledger.get_internal_revenue_service().give(account.withdraw(taxes_owed, self._today))
+      if is_print_day:
+        self._output_sink.tax_day(account.get_name(), -taxes_owed)
+    else:
+      if is_print_day:
+        self._output_sink.tax_day(None, 0)
+
+  def __shuffle_funds(self) -> None:
+    self._shuffle_transfer_count += self._payment_plan.shuffle(self._today)
+
+  def __get_total_account_balance(self) -> float:
+    if self._account_store:
+      return self._account_store.get_total_balance()
+    total_account_balance = 0.0
+    for account in self._accounts:
+      total_account_balance += account.get_balance()
+    return total_account_balance
+
+  def __get_first_account_with_amount(self, amount: float) -> Account:
+    for account in self._accounts:
+      if account.get_post_tax_balance(self._today) > amount:
+        return account
+    raise BankruptException(amount)
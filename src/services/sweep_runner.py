@@ -0,0 +1,215 @@
+import copy
+from concurrent.futures import as_completed, ProcessPoolExecutor
+import dataclasses
+from datetime import date
+import itertools
+import os
+from typing import Any, Dict, Iterator, List, Tuple
+from entities.ledger import Ledger
+from exceptions.invalid_scenario_fork_exception import InvalidScenarioForkException
+from exceptions.unknown_sweep_path_exception import UnknownSweepPathException
+from models.configs.debt_config import DebtConfig
+from models.configs.full_config import FullConfig
+from models.configs.sweep_axis_config import SweepAxisConfig
+from models.configs.sweep_config import SweepConfig
+from models.results.simulation_result import SimulationResult
+from models.results.sweep_scenario_result import SweepScenarioResult
+from services.checkpoint_store import CheckpointStore
+from services.config_builder import ConfigBuilder
+from services.simulator import Simulator
+
+
+class SweepRunner:
+  """
+  Runs every point of a parameter grid. With a fork_date, the days before it are simulated once
+  from the base config and every scenario continues from a copy of that state, which is only
+  sound when scenarios differ from the base in nothing the shared prefix has already used.
+  """
+  _sweep_config: SweepConfig
+  _today: date
+  _base_config: dict
+
+  def __init__(self, sweep_config: SweepConfig, today: date):
+    self._sweep_config = sweep_config
+    self._today = today
+    self._base_config = ConfigBuilder.load_raw(sweep_config.base)
+
+  def get_scenarios(self) -> List[Dict[str, Any]]:
+    axes = self._sweep_config.axes
+    scenarios: List[Dict[str, Any]] = []
+    for combination in itertools.product(*[axis.values for axis in axes]):
+      scenarios.append({SweepRunner.get_axis_label(axis): value for axis, value in zip(axes, combination)})
+    return scenarios
+
+  def run(self) -> Iterator[SweepScenarioResult]:
+    """Yields one result per grid point, in the order the scenarios finish."""
+    scenarios = self.get_scenarios()
+    scenario_configs = [self.__build_scenario_config(overrides) for overrides in scenarios]
+    prefix_state: bytes | None = None
+    prefix_warning_count = 0
+    fork_date = self._sweep_config.fork_date
+    if fork_date:
+      base_full_config = ConfigBuilder.build(self._base_config)
+      for yaml_config in scenario_configs:
+        SweepRunner.__validate_fork(base_full_config, ConfigBuilder.build(yaml_config), fork_date)
+      prefix_result, prefix_state = self.__run_prefix(base_full_config, fork_date)
+      if prefix_result.bankruptcy_date:
+        for index, overrides in enumerate(scenarios):
+          yield SweepRunner.__build_scenario_result(index, overrides, prefix_result, 0)
+        return
+      prefix_warning_count = len(prefix_result.warnings)
+    max_workers = self._sweep_config.max_workers or os.cpu_count()
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+      futures = []
+      for index, overrides in enumerate(scenarios):
+        futures.append(executor.submit(
+          SweepRunner.run_scenario,
+          index,
+          scenario_configs[index],
+          overrides,
+          self._today,
+          self._sweep_config.event_driven,
+          prefix_state,
+          prefix_warning_count
+        ))
+      for future in as_completed(futures):
+        yield future.result()
+
+  @staticmethod
+  def run_scenario(
+    index: int,
+    yaml_config: dict,
+    overrides: Dict[str, Any],
+    today: date,
+    event_driven: bool,
+    prefix_state: bytes | None = None,
+    prefix_warning_count: int = 0
+  ) -> SweepScenarioResult:
+    full_config = ConfigBuilder.build(yaml_config)
+    result = Simulator(
+      full_config,
+      today,
+      Ledger(),
+      event_driven=event_driven,
+      quiet=True,
+      headless=True,
+      resume_state=prefix_state
+    ).run()
+    return SweepRunner.__build_scenario_result(index, overrides, result, prefix_warning_count)
+
+  @staticmethod
+  def __build_scenario_result(
+    index: int,
+    overrides: Dict[str, Any],
+    result: SimulationResult,
+    prefix_warning_count: int
+  ) -> SweepScenarioResult:
+    return SweepScenarioResult(
+      index=index,
+      overrides=overrides,
+      bankruptcy_date=result.bankruptcy_date,
+      final_net_worth=result.final_net_worth,
+      warning_count=prefix_warning_count + len(result.warnings)
+    )
+
+  def __run_prefix(self, base_full_config: FullConfig, fork_date: date) -> Tuple[SimulationResult, bytes]:
+    if not self._today < fork_date <= base_full_config.output.end_date:
+      raise InvalidScenarioForkException(f"fork_date {fork_date} must fall after today and by the end date")
+    simulator = Simulator(
+      base_full_config,
+      self._today,
+      Ledger(),
+      event_driven=self._sweep_config.event_driven,
+      quiet=True,
+      headless=True
+    )
+    result = simulator.run(stop_date=fork_date)
+    return result, CheckpointStore.serialize(simulator.build_checkpoint())
+
+  @staticmethod
+  def __validate_fork(base: FullConfig, scenario: FullConfig, fork_date: date) -> None:
+    # These shape every day of the prefix
+    for section in ("dob", "married", "accounts", "payment_order", "shuffle_tolerance", "federal_tax"):
+      if getattr(base, section) != getattr(scenario, section):
+        raise InvalidScenarioForkException(f"Forked scenarios cannot change {section}")
+    SweepRunner.__validate_started_items("bills", base.bills, scenario.bills, fork_date)
+    SweepRunner.__validate_started_items("debts", base.debts, scenario.debts, fork_date)
+    SweepRunner.__validate_started_items("income", base.income, scenario.income, fork_date)
+    SweepRunner.__validate_started_items("assets", base.assets, scenario.assets, fork_date)
+
+  @staticmethod
+  def __validate_started_items(section: str, base_items: List[Any], scenario_items: List[Any], fork_date: date) -> None:
+    # Items that start on or after the fork date are built from each scenario's own config
+    base_started = {item.name: item for item in base_items if SweepRunner.__has_started(item, fork_date)}
+    scenario_started = {item.name: item for item in scenario_items if SweepRunner.__has_started(item, fork_date)}
+    if base_started.keys() != scenario_started.keys():
+      raise InvalidScenarioForkException(
+        f"Forked scenarios must keep the same {section} starting before {fork_date.isoformat()}"
+      )
+    for name, base_item in base_started.items():
+      base_view = SweepRunner.__hide_future_dates(base_item, fork_date)
+      if base_view != SweepRunner.__hide_future_dates(scenario_started[name], fork_date):
+        raise InvalidScenarioForkException(
+          f"{section} {name!r} started before {fork_date.isoformat()}, so a forked scenario may only move "
+          f"its end or sell date, and only between dates on or after the fork"
+        )
+
+  @staticmethod
+  def __has_started(item: Any, fork_date: date) -> bool:
+    start_date = getattr(item, "start_date", None)
+    return start_date is None or start_date < fork_date
+
+  @staticmethod
+  def __hide_future_dates(item: Any, fork_date: date) -> Any:
+    # The dates Simulator re-reads on resume; a debt's own end_date shaped its payments and stays fixed
+    if isinstance(item, DebtConfig):
+      return dataclasses.replace(item, asset=SweepRunner.__hide_future_dates(item.asset, fork_date) if item.asset else None)
+    hidden: Dict[str, Any] = {}
+    for field in ("end_date", "sell_date"):
+      value = getattr(item, field, None)
+      if value is not None and value >= fork_date:
+        hidden[field] = None
+    return dataclasses.replace(item, **hidden)
+
+  @staticmethod
+  def get_axis_label(axis: SweepAxisConfig) -> str:
+    label = "/".join(str(segment) for segment in axis.path)
+    if axis.is_scale:
+      return f"{label} (x)"
+    return label
+
+  def __build_scenario_config(self, overrides: Dict[str, Any]) -> dict:
+    yaml_config = copy.deepcopy(self._base_config)
+    for axis in self._sweep_config.axes:
+      value = overrides[SweepRunner.get_axis_label(axis)]
+      container = yaml_config
+      for segment in axis.path[:-1]:
+        container = SweepRunner.__get_child(container, segment, axis.path)
+      key = SweepRunner.__get_key(container, axis.path[-1], axis.path)
+      if axis.is_scale:
+        container[key] = container[key] * value
+      else:
+        container[key] = copy.deepcopy(value)
+    return yaml_config
+
+  @staticmethod
+  def __get_child(container: Any, segment: str | int, path: List[str | int]) -> Any:
+    return container[SweepRunner.__get_key(container, segment, path)]
+
+  @staticmethod
+  def __get_key(container: Any, segment: str | int, path: List[str | int]) -> Any:
+    if isinstance(container, dict):
+      if segment in container:
+        return segment
+    elif isinstance(container, list):
+      if isinstance(segment, int):
+        if segment < len(container):
+          return segment
+      else:
+        # List items are matched by name, e.g. a bill's "name" or a payment_order entry's account name
+        for index, item in enumerate(container):
+          if isinstance(item, dict) and item.get("name") == segment:
+            return index
+          if isinstance(item, list) and item and item[0] == segment:
+            return index
+    raise UnknownSweepPathException(f"Given sweep path: {path} (no match for {segment!r})")
@@ -0,0 +1,119 @@
+from datetime import date
+from dateutil.relativedelta import relativedelta
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from models.results.daily_summary import DailySummary
+from services.console_printer import ConsolePrinter
+from services.output_sink import OutputSink
+
+
+class TerminalRenderer(OutputSink):
+  def is_recording(self, is_print_day: bool) -> bool:
+    # Anything more than the print days would bury the summaries
+    return is_print_day
+
+  def start_day(self, today: date, age: relativedelta) -> None:
+    ConsolePrinter.print_new_day_header(today, age)
+    ConsolePrinter.print_header("Today's Actions")
+
+  def start_section(self, title: str) -> None:
+    print(f"{title}:")
+
+  def end_section(self) -> None:
+    print()
+
+  def bill_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    label = TerminalRenderer.__get_period_label(period_type, "Unknown ChargePeriodType")
+    print(f"  {label} {name} Charge: \033[38;2;255;0;0m-${amount:,.2f}\033[0m")
+
+  def debt_charge(self, name: str, period_type: TimePeriodType, amount: float) -> None:
+    label = TerminalRenderer.__get_period_label(period_type, "Unknown ChargePeriodType")
+    print(f"  {label} {name} Charge: \033[38;2;255;0;0m-${amount:,.2f}\033[0m")
+
+  def bill_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    label = TerminalRenderer.__get_period_label(period_type, "Unknown IncreasePeriodValue")
+    print(f"  {label} {name} increased by \033[38;2;255;0;0m+${amount:,.2f}\033[0m")
+
+  def income_increase(self, name: str, period_type: TimePeriodType | None, amount: float) -> None:
+    label = TerminalRenderer.__get_period_label(period_type, "Unknown IncreasePeriodValue")
+    print(f"  {label} {name} increased by \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+
+  def payout(self, name: str, amount: float, account_type: AccountType | None) -> None:
+    if account_type == AccountType.FOURK:
+      print(f"  {name} 401k Payout: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+    elif account_type == AccountType.HSA:
+      print(f"  {name} HSA Payout: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+    else:
+      print(f"  {name} Payout: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+
+  def debt_allocation(self, name: str, amount: float) -> None:
+    print(f"    {name}: \033[38;2;0;255;0m-${amount:,.2f}\033[0m")
+
+  def account_allocation(self, name: str, amount: float) -> None:
+    print(f"    {name}: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+
+  def account_interest(self, name: str, amount: float) -> None:
+    print(f"  [Daily]   {name} Interest: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+
+  def capital_gains(self, name: str, amount: float) -> None:
+    print(f"  [Daily]   {name} Capital Gains: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+
+  def debt_interest(self, name: str, amount: float) -> None:
+    print(f"  [Daily]   {name} Interest: \033[38;2;255;128;0m+${amount:,.2f}\033[0m")
+
+  def appreciation(self, name: str, amount: float) -> None:
+    if amount > 0:
+      print(f"  [Daily]   {name} Appreciation: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+    else:
+      print(f"  [Daily]   {name} Depreciation: \033[38;2;255;0;0m-${abs(amount):,.2f}\033[0m")
+
+  def tax_day(self, account_name: str | None, amount: float) -> None:
+    if amount > 0:
+      print(f"  [Tax Day] {account_name}: \033[38;2;0;255;0m+${amount:,.2f}\033[0m")
+    elif amount < 0:
+      print(f"  [Tax Day] {account_name}: \033[38;2;255;0;0m-${abs(amount):,.2f}\033[0m")
+    else:
+      print("  [Tax Day] No Adjustment")
+
+  def daily_summary(self, summary: DailySummary) -> None:
+    ConsolePrinter.print_header("End of Day Summary")
+    # Debts
+    print("Debt Balances:")
+    print(f"  Total Debts Balance: \033[38;2;255;128;0m${summary.total_debt_balance:,.2f}\033[0m")
+    for name, balance in summary.debt_balances:
+      if balance > 0:
+        print(f"    {name} Balance: \033[38;2;255;128;0m${balance:,.2f}\033[0m")
+    # Accounts
+    print("\nAccount Balances:")
+    print(f"  Total Accounts Balance: \033[38;2;0;255;0m${summary.total_account_balance:,.2f}\033[0m")
+    for name, balance in summary.account_balances:
+      print(f"    {name} Balance: \033[38;2;0;255;0m${balance:,.2f}\033[0m")
+    # Assets
+    print("\nAssets:")
+    print(f"  Total Sellable Assets Value: \033[38;2;91;91;255m${summary.total_sellable_assets_value:,.2f}\033[0m")
+    print(f"  Total Unconditional Assets Value: \033[38;2;91;91;255m${summary.total_assets_value:,.2f}\033[0m")
+    for name, value, is_paid_off in summary.asset_values:
+      print(f"    {name} Value: \033[38;2;91;91;255m${value:,.2f}\033[0m")
+      if is_paid_off:
+        print("      Paid off: \033[38;2;0;255;0m✔\033[0m")
+      else:
+        print("      Paid off: \033[38;2;255;0;0m✘\033[0m")
+    # Net Worth
+    print(f"\nNet Worth: \033[38;2;0;255;255m${summary.net_worth:,.2f}\033[0m\n")
+
+  def bankruptcy(self, age: relativedelta, money_needed: float, summary: DailySummary) -> None:
+    ConsolePrinter.print_new_day_header(summary.date, age)
+    self.daily_summary(summary)
+    print(f"\nUnable to pay: \033[38;2;255;0;0m${money_needed:,.2f}\n\tBankrupt\n\033[0m")
+
+  @staticmethod
+  def __get_period_label(period_type: TimePeriodType | None, error_message: str) -> str:
+    if period_type == TimePeriodType.DAYS:
+      return "[Daily]  "
+    if period_type == TimePeriodType.WEEKS:
+      return "[Weekly] "
+    if period_type == TimePeriodType.MONTHS:
+      return "[Monthly]"
+    if period_type == TimePeriodType.YEARS:
+      return "[Yearly] "
+    raise RuntimeError(error_message)
@@ -0,0 +1,97 @@
+from datetime import date
+from typing import Dict, List, Tuple
+from entities.account import Account
+from exceptions.bankrupt_exception import BankruptException
+
+
+class WithdrawalPlanner:
+  """
+  Pays a day's charges out of the accounts in order. Post-tax balances are taken once when the
+  day's payments start and an account is re-read only after money moves through it, so each
+  charge is allocated across the accounts, and checked for a shortfall, before anything moves.
+  Paying x out of a taxed account lowers its post-tax balance by other than x (income tax and
+  penalties are charged on x, not on the balance), so looking ahead means replaying the taxes.
+  """
+  _accounts: List[Account]
+  _today: date
+  _post_tax_balances: Dict[Account, float]
+
+  def __init__(self, accounts: List[Account], post_tax_balances: List[float], today: date):
+    self._accounts = accounts
+    self._today = today
+    self._post_tax_balances = dict(zip(accounts, post_tax_balances))
+
+  def get_available(self) -> float:
+    total_post_tax_balance = 0.0
+    for account in self._accounts:
+      total_post_tax_balance += self._post_tax_balances[account]
+    return total_post_tax_balance
+
+  def get_shortfall(self, charges: List[float]) -> float:
+    """
+    How far the accounts fall short of paying `charges` in order, replaying each withdrawal's
+    taxes on copies of the balances it touches. A charge that comes up short is taken to be
+    made whole and to empty the accounts.
+    """
+    post_tax_balances = [self._post_tax_balances[account] for account in self._accounts]
+    replayed_accounts: Dict[int, Tuple[float, float, float, float]] = {}
+    shortfall = 0.0
+    for charge in charges:
+      available = sum(post_tax_balances)
+      if available < charge:
+        shortfall += charge - available
+        post_tax_balances = [0.0] * len(post_tax_balances)
+        continue
+      running_charge = charge
+      for position, post_tax_balance in enumerate(post_tax_balances):
+        if post_tax_balance > running_charge:
+          post_tax_balances[position] = self.__replay_withdrawal(replayed_accounts, position, running_charge)
+          break
+        post_tax_balances[position] = self.__replay_withdrawal(replayed_accounts, position, post_tax_balance)
+        running_charge -= post_tax_balance
+    return shortfall
+
+  def refresh(self, account: Account) -> None:
+    """Call after depositing into `account` outside the planner."""
+    self._post_tax_balances[account] = account.get_post_tax_balance(self._today)
+
+  def withdraw(self, charge: float) -> List[float]:
+    """
+    Drains the accounts in order until `charge` is covered and returns the amounts taken, or
+    raises BankruptException without touching any account when they cannot cover it.
+    """
+    if self.get_available() < charge:
+      raise BankruptException(charge)
+    allocation: List[Tuple[Account, float]] = []
+    running_charge = charge
+    for account in self._accounts:
+      post_tax_balance = self._post_tax_balances[account]
+      if post_tax_balance > running_charge:
+        allocation.append((account, running_charge))
+        break
+      allocation.append((account, post_tax_balance))
+      running_charge -= post_tax_balance
+    withdrawals: List[float] = []
+    for account, amount in allocation:
+      withdrawals.append(account.withdraw(amount, self._today))
+      # Re-read rather than subtract; see the class docstring
+      self._post_tax_balances[account] = account.get_post_tax_balance(self._today)
+    return withdrawals
+
+  def __replay_withdrawal(
+    self,
+    replayed_accounts: Dict[int, Tuple[float, float, float, float]],
+    position: int,
+    amount: float
+  ) -> float:
+    """Account.withdraw on a copy of the account at `position`; returns its post-tax balance afterwards."""
+    if position not in replayed_accounts:
+      account = self._accounts[position]
+      capital_gains_rate, per_dollar_rate = account.get_withdrawal_tax_rates(self._today)
+      replayed_accounts[position] = (account.get_balance(), account.get_untaxed_gains(), capital_gains_rate, per_dollar_rate)
+    balance, untaxed_gains, capital_gains_rate, per_dollar_rate = replayed_accounts[position]
+    capital_gains_tax = min(amount, untaxed_gains) * capital_gains_rate
+    balance -= amount + capital_gains_tax + amount * per_dollar_rate
+    untaxed_gains -= capital_gains_tax
+    replayed_accounts[position] = (balance, untaxed_gains, capital_gains_rate, per_dollar_rate)
+    return balance - (untaxed_gains * capital_gains_rate + balance * per_dollar_rate)
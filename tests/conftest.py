@@ -0,0 +1,67 @@
+from datetime import date
+from typing import Callable, List
+import pytest
+from entities.account import Account
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.warning_log import WarningLog
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from services.output_sink import OutputSink
+
+# The owner of every account the fixtures build turns 59 and a half on 2049-07-01 and 65 on 2055-01-01
+DOB = date(1990, 1, 1)
+
+
+def __build_account_config(  # pylint: disable=too-many-arguments
+  name: str,
+  account_type: AccountType,
+  balance: float,
+  today: date,
+  *,
+  interest_rate: float = 0,
+  interest_period_type: TimePeriodType = TimePeriodType.YEARS,
+  pays_capital_gains_tax: bool = False,
+  pays_income_tax: bool = False
+) -> AccountConfig:
+  return AccountConfig(
+    name=name,
+    type=account_type,
+    balance=balance,
+    interest_rate=interest_rate,
+    interest_period_type=interest_period_type,
+    interest_period_value=1,
+    last_interest_date=today,
+    pays_capital_gains_tax=pays_capital_gains_tax,
+    pays_income_tax=pays_income_tax
+  )
+
+
+@pytest.fixture(name="age_milestones")
+def fixture_age_milestones() -> AgeMilestones:
+  return AgeMilestones(DOB)
+
+
+@pytest.fixture(name="build_account_config")
+def fixture_build_account_config() -> Callable[..., AccountConfig]:
+  """
+  (name, account_type, balance, today, *, interest_rate, interest_period_type, pays_capital_gains_tax,
+  pays_income_tax); interest posts every period of one
+  """
+  return __build_account_config
+
+
+@pytest.fixture(name="build_accounts")
+def fixture_build_accounts(age_milestones: AgeMilestones) -> Callable[[List[AccountConfig], date], List[Account]]:
+  """Builds an Account for each config on one shared ledger, headless, as of the given day."""
+  ledger = Ledger()
+
+  def build_accounts(account_configs: List[AccountConfig], today: date) -> List[Account]:
+    warning_log = WarningLog(today, is_headless=True)
+    return [
+      Account(today, account_config, ledger, age_milestones, warning_log, OutputSink())
+      for account_config in account_configs
+    ]
+
+  return build_accounts
@@ -0,0 +1,119 @@
+from datetime import date, timedelta
+from typing import Callable, List
+import pytest
+from entities.account import Account
+from entities.account_store import AccountStore
+from entities.ledger import Ledger
+from entities.misc.age_milestones import AgeMilestones
+from entities.misc.warning_log import WarningLog
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+from models.enums.time_period_type import TimePeriodType
+from services.output_sink import OutputSink
+
+TODAY = date(2030, 1, 1)
+
+
+def test_store_matches_accounts_through_growth_and_withdrawals(
+  age_milestones: AgeMilestones,
+  build_account_config: Callable[..., AccountConfig],
+  build_accounts: Callable[[List[AccountConfig], date], List[Account]]
+):
+  account_configs = [
+    build_account_config(
+      name,
+      account_type,
+      balance,
+      TODAY,
+      interest_rate=8,
+      interest_period_type=TimePeriodType.DAYS,
+      pays_capital_gains_tax=account_type == AccountType.INVESTMENT,
+      pays_income_tax=account_type in (AccountType.FOURK, AccountType.HSA)
+    )
+    for name, account_type, balance in (
+      ("Checking", AccountType.CASH, 3000),
+      ("Brokerage", AccountType.INVESTMENT, 20000),
+      ("401k", AccountType.FOURK, 40000),
+      ("HSA", AccountType.HSA, 5000)
+    )
+  ]
+  warning_log = WarningLog(TODAY, is_headless=True)
+  account_store = AccountStore(TODAY, account_configs, Ledger(), age_milestones, warning_log, OutputSink())
+  stored_accounts = account_store.get_accounts()
+  accounts = build_accounts(account_configs, TODAY)
+  today = TODAY
+  while today < date(2030, 3, 1):
+    today += timedelta(days=1)
+    account_store.handle_capital_gains(today)
+    for account in accounts:
+      if account.is_capital_gains_today(today):
+        account.handle_capital_gains(today, False)
+  for stored_account, account in zip(stored_accounts, accounts):
+    stored_account.withdraw(1000, today)
+    account.withdraw(1000, today)
+  expected_balances = [account.get_balance() for account in accounts]
+  assert list(account_store.get_balances()) == pytest.approx(expected_balances, rel=1e-12)
+  expected_post_tax_balances = [account.get_post_tax_balance(today) for account in accounts]
+  assert list(account_store.get_post_tax_balances(today)) == pytest.approx(expected_post_tax_balances, rel=1e-12)
+  for stored_account, expected in zip(stored_accounts, expected_post_tax_balances):
+    assert stored_account.get_post_tax_balance(today) == pytest.approx(expected, rel=1e-12)
+
+
+def test_deferred_growth_settles_before_balances_are_read_or_written(
+  age_milestones: AgeMilestones,
+  build_account_config: Callable[..., AccountConfig],
+  build_accounts: Callable[[List[AccountConfig], date], List[Account]]
+):
+  account_configs = [
+    build_account_config(
+      "Savings",
+      AccountType.SAVINGS,
+      8000,
+      TODAY,
+      interest_rate=4,
+      interest_period_type=TimePeriodType.DAYS
+    ),
+    build_account_config(
+      "Brokerage",
+      AccountType.INVESTMENT,
+      20000,
+      TODAY,
+      interest_rate=8,
+      interest_period_type=TimePeriodType.WEEKS
+    ),
+    # Empty until the deposit below, so its weeks count from then on
+    build_account_config(
+      "Roth IRA",
+      AccountType.ROTH_IRA,
+      0,
+      TODAY,
+      interest_rate=8,
+      interest_period_type=TimePeriodType.WEEKS
+    )
+  ]
+  ledger = Ledger()
+  warning_log = WarningLog(TODAY, is_headless=True)
+  account_store = AccountStore(TODAY, account_configs, ledger, age_milestones, warning_log, OutputSink())
+  stored_accounts = account_store.get_accounts()
+  accounts = build_accounts(account_configs, TODAY)
+  today = TODAY
+  while today < date(2030, 4, 1):
+    today += timedelta(days=1)
+    if today == date(2030, 2, 15):
+      stored_accounts[2].deposit(ledger.get_employer().take(1000))
+      accounts[2].deposit(1000)
+    account_store.handle_interest(today)
+    account_store.handle_capital_gains(today)
+    for account in accounts:
+      account.handle_interest(today, False)
+      account.handle_capital_gains(today, False)
+  # Nothing has read a balance since the deposit, so the growth since then is still owed
+  bank_balance = ledger.get_bank().peak_balance()
+  stock_market_balance = ledger.get_stock_market().peak_balance()
+  assert account_store.get_total_balance() == pytest.approx(sum(a.get_balance() for a in accounts), rel=1e-12)
+  assert ledger.get_bank().peak_balance() < bank_balance
+  assert ledger.get_stock_market().peak_balance() < stock_market_balance
+  assert abs(ledger.get_journal().get_imbalance()) < 0.01
+  for stored_account, account in zip(stored_accounts, accounts):
+    assert stored_account.get_balance() == pytest.approx(account.get_balance(), rel=1e-12)
+    assert stored_account.get_next_interest_date() == account.get_next_interest_date()
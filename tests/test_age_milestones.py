@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Callable, List
+from entities.account import Account
+from entities.misc.age_milestones import AgeMilestones
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+
+
+def test_penalty_end_dates_clamp_a_leap_day_birthday():
+  age_milestones = AgeMilestones(date(2000, 2, 29))
+  assert age_milestones.get_fourk_penalty_end_date() == date(2059, 8, 29)
+  assert age_milestones.get_hsa_penalty_end_date() == date(2065, 2, 28)
+
+
+def test_penalty_rates_lapse_on_the_milestone_days():
+  age_milestones = AgeMilestones(date(1990, 1, 15))
+  assert age_milestones.get_penalty_rate(AccountType.FOURK, date(2049, 7, 14)) == 0.1
+  assert age_milestones.get_penalty_rate(AccountType.ROTH_IRA, date(2049, 7, 15)) == 0.0
+  assert age_milestones.get_penalty_rate(AccountType.HSA, date(2055, 1, 14)) == 0.2
+  assert age_milestones.get_penalty_rate(AccountType.HSA, date(2055, 1, 15)) == 0.0
+  assert age_milestones.get_penalty_rate(AccountType.INVESTMENT, date(2030, 1, 1)) == 0.0
+
+
+def test_cached_post_tax_balance_follows_deposits_and_lapsing_penalties(
+  build_account_config: Callable[..., AccountConfig],
+  build_accounts: Callable[[List[AccountConfig], date], List[Account]]
+):
+  # The fixtures' owner turns 59 and a half on 2049-07-01
+  today = date(2049, 6, 30)
+  account_config = build_account_config("401k", AccountType.FOURK, 1000, today, pays_income_tax=True)
+  account = build_accounts([account_config], today)[0]
+  assert account.get_post_tax_balance(today) == 1000 - (1000 * 0.22 + 1000 * 0.1)
+  account.deposit(1000)
+  assert account.get_post_tax_balance(today) == 2000 - (2000 * 0.22 + 2000 * 0.1)
+  assert account.get_post_tax_balance(date(2049, 7, 1)) == 2000 - 2000 * 0.22
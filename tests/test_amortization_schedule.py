@@ -0,0 +1,101 @@
+from datetime import date, timedelta
+import numpy_financial as npf
+import pytest
+from entities.debt import Debt
+from entities.ledger import Ledger
+from models.configs.debt_config import DebtConfig
+from models.enums.time_period_type import TimePeriodType
+from services.date_calculator import DateCalculator
+from services.financial_calculator import FinancialCalculator
+from services.output_sink import OutputSink
+
+START = date(2030, 1, 1)
+
+
+def __build_debt() -> Debt:
+  return Debt(
+    START,
+    DebtConfig(
+      name="Car",
+      principal=20000,
+      balance=20000,
+      start_date=START,
+      end_date=date(2035, 1, 1),
+      interest_rate=6,
+      interest_period_type=TimePeriodType.MONTHS,
+      interest_period_value=1,
+      charge_period_type=TimePeriodType.MONTHS,
+      charge_period_value=1,
+      asset=None
+    ),
+    Ledger(),
+    OutputSink()
+  )
+
+
+def __charge(debt: Debt, today: date) -> float:
+  """One scheduled charge day the way the daily loop runs it: interest first, then the payment."""
+  if debt.is_interest_today(today):
+    debt.handle_interest(today, False)
+  charge = debt.get_charge_due(today)
+  assert charge is not None
+  debt.pay_charge(False, today, [charge], [], charge)
+  return charge
+
+
+def test_schedule_matches_numpy_financial_for_evenly_spaced_charges():
+  # Every 30 days the daily compounding comes to one fixed periodic rate, which is what npf amortizes at
+  periods = 24
+  period_rate = (1 + 0.06 / 365) ** 30 - 1
+  payment = float(-npf.pmt(period_rate, periods, 10000))
+  schedule = FinancialCalculator.build_amortization_schedule(
+    payment=payment,
+    balance=10000,
+    interest_rate=6,
+    last_interest_date=START,
+    interest_period_type=TimePeriodType.DAYS,
+    interest_period_value=30,
+    first_charge_date=START + timedelta(days=30),
+    charge_period_type=TimePeriodType.DAYS,
+    charge_period_value=30,
+    # The day before the last charge, so rounding in the final balance cannot add a stray row
+    end_date=START + timedelta(days=30 * periods - 1)
+  )
+  all_periods = list(range(1, periods + 1))
+  assert schedule.dates == [START + timedelta(days=30 * period) for period in all_periods]
+  assert schedule.payoff_date == START + timedelta(days=30 * periods)
+  assert schedule.payments == pytest.approx([payment] * periods, rel=1e-9)
+  assert schedule.interest == pytest.approx(list(-npf.ipmt(period_rate, all_periods, periods, 10000)), rel=1e-9)
+  assert schedule.principal == pytest.approx(list(-npf.ppmt(period_rate, all_periods, periods, 10000)), rel=1e-9)
+  assert schedule.total_interest == pytest.approx(payment * periods - 10000, rel=1e-9)
+  assert schedule.balances[-1] == 0
+
+
+def test_debt_pays_off_on_the_last_monthly_charge_before_its_end_date():
+  schedule = __build_debt().get_amortization_schedule(START)
+  # The first charge falls on the start date, so five years of monthly charges end a month short of it
+  assert len(schedule.dates) == 60
+  assert schedule.dates[0] == START
+  assert schedule.payoff_date == date(2034, 12, 1)
+  assert schedule.payments[-1] < schedule.payment
+
+
+def test_charges_follow_the_schedule_until_an_extra_payment_re_amortizes_it():
+  debt = __build_debt()
+  schedule = debt.get_amortization_schedule(START)
+  today = START
+  for row in range(4):
+    assert __charge(debt, today) == schedule.payments[row]
+    assert debt.get_balance(today) == pytest.approx(schedule.balances[row], rel=1e-12)
+    today = DateCalculator.add_months(today, 1)
+  # Paid between the April and May charges, so the cached projection no longer holds
+  debt.pay(5000)
+  assert __charge(debt, date(2030, 5, 1)) == pytest.approx(debt.get_minimum_payment())
+  re_amortized = debt.get_amortization_schedule(date(2030, 5, 1))
+  assert re_amortized is not schedule
+  assert re_amortized.dates[0] == date(2030, 5, 1)
+  assert re_amortized.payoff_date is not None and re_amortized.payoff_date < date(2034, 12, 1)
+  # Once the balance is under the payment the charge clears it
+  debt.pay(debt.get_balance(date(2030, 5, 15)) - 100)
+  assert __charge(debt, date(2030, 6, 1)) == pytest.approx(100 * (1 + 0.06 / 365) ** 31)
+  assert debt.get_balance(date(2030, 6, 1)) == 0
@@ -0,0 +1,72 @@
+import os
+from datetime import date
+from pathlib import Path
+import pytest
+from entities.ledger import Ledger
+from exceptions.incompatible_checkpoint_exception import IncompatibleCheckpointException
+from models.enums.time_period_type import TimePeriodType
+from models.results.simulation_result import SimulationResult
+from services.checkpoint_store import CheckpointStore
+from services.config_builder import ConfigBuilder
+from services.simulator import Simulator
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+
+
+def __build_simulator(
+  event_driven: bool,
+  checkpoint_store: CheckpointStore | None = None,
+  resume_state: bytes | None = None
+) -> Simulator:
+  return Simulator(
+    ConfigBuilder.build_from_path(SMALL_CONFIG_PATH),
+    TODAY,
+    Ledger(),
+    event_driven=event_driven,
+    quiet=True,
+    headless=True,
+    checkpoint_store=checkpoint_store,
+    resume_state=resume_state
+  )
+
+
+def __get_final_summary(result: SimulationResult) -> tuple:
+  return (
+    result.end_date,
+    result.bankruptcy_date,
+    result.money_needed,
+    result.final_net_worth,
+    result.obtained_from_employers,
+    result.obtained_from_stock_market,
+    result.shuffle_transfer_count
+  )
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_resuming_a_saved_checkpoint_finishes_like_an_uninterrupted_run(tmp_path: Path, event_driven: bool):
+  checkpoint_store = CheckpointStore(str(tmp_path), TimePeriodType.YEARS)
+  uninterrupted_result = __build_simulator(event_driven, checkpoint_store=checkpoint_store).run()
+  assert sorted(os.listdir(tmp_path)) == [f"{year}-01-01.checkpoint" for year in range(2027, 2034)]
+  resume_state = CheckpointStore.read(str(tmp_path / "2029-01-01.checkpoint"))
+  resumed_result = __build_simulator(event_driven, resume_state=resume_state).run()
+  assert resumed_result.start_date == TODAY
+  assert __get_final_summary(resumed_result) == __get_final_summary(uninterrupted_result)
+
+
+def test_a_run_stopped_and_resumed_in_memory_finishes_like_an_uninterrupted_run():
+  uninterrupted_result = __build_simulator(False).run()
+  simulator = __build_simulator(False)
+  simulator.run(stop_date=date(2030, 7, 19))
+  resume_state = CheckpointStore.serialize(simulator.build_checkpoint())
+  resumed_result = __build_simulator(False, resume_state=resume_state).run()
+  assert __get_final_summary(resumed_result) == __get_final_summary(uninterrupted_result)
+
+
+def test_a_checkpoint_from_another_format_version_is_rejected(monkeypatch: pytest.MonkeyPatch):
+  simulator = __build_simulator(False)
+  simulator.run(stop_date=date(2027, 1, 1))
+  resume_state = CheckpointStore.serialize(simulator.build_checkpoint())
+  monkeypatch.setattr(CheckpointStore, "FORMAT_VERSION", CheckpointStore.FORMAT_VERSION + 1)
+  with pytest.raises(IncompatibleCheckpointException, match="format"):
+    __build_simulator(False, resume_state=resume_state)
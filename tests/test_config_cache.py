@@ -0,0 +1,60 @@
+import os
+import shutil
+from pathlib import Path
+import pytest
+from services.config_builder import ConfigBuilder
+from services.config_cache import ConfigCache
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+
+
+@pytest.fixture(name="yaml_path")
+def fixture_yaml_path(tmp_path: Path) -> Path:
+  yaml_path = tmp_path / "main.yml"
+  shutil.copyfile(SMALL_CONFIG_PATH, yaml_path)
+  return yaml_path
+
+
+def __get_cache_names(yaml_path: Path) -> list:
+  return sorted(os.listdir(yaml_path.parent / ConfigCache.CACHE_DIRECTORY_NAME))
+
+
+def __forbid_building(monkeypatch: pytest.MonkeyPatch) -> None:
+  def build(_: dict):
+    raise AssertionError("Built the config instead of loading it from the cache")
+
+  monkeypatch.setattr(ConfigBuilder, "build", build)
+
+
+def test_a_hit_loads_the_stored_config_without_building_it(yaml_path: Path, monkeypatch: pytest.MonkeyPatch):
+  built_config = ConfigCache.build_from_path(str(yaml_path))
+  assert built_config == ConfigBuilder.build_from_path(str(yaml_path))
+  assert len(__get_cache_names(yaml_path)) == 1
+  __forbid_building(monkeypatch)
+  assert ConfigCache.build_from_path(str(yaml_path)) == built_config
+  assert len(__get_cache_names(yaml_path)) == 1
+
+
+def test_editing_the_yaml_misses_and_rebuilds(yaml_path: Path):
+  ConfigCache.build_from_path(str(yaml_path))
+  with open(yaml_path, "a", encoding="utf-8") as yaml_file:
+    yaml_file.write("shuffle_tolerance: 1234\n")
+  assert ConfigCache.build_from_path(str(yaml_path)).shuffle_tolerance == 1234
+  assert len(__get_cache_names(yaml_path)) == 2
+
+
+def test_a_schema_version_bump_misses_and_rebuilds(yaml_path: Path, monkeypatch: pytest.MonkeyPatch):
+  built_config = ConfigCache.build_from_path(str(yaml_path))
+  monkeypatch.setattr(ConfigCache, "SCHEMA_VERSION", ConfigCache.SCHEMA_VERSION + 1)
+  assert ConfigCache.build_from_path(str(yaml_path)) == built_config
+  assert len(__get_cache_names(yaml_path)) == 2
+
+
+def test_a_truncated_entry_is_rebuilt_and_overwritten(yaml_path: Path, monkeypatch: pytest.MonkeyPatch):
+  built_config = ConfigCache.build_from_path(str(yaml_path))
+  cache_path = yaml_path.parent / ConfigCache.CACHE_DIRECTORY_NAME / __get_cache_names(yaml_path)[0]
+  cache_path.write_bytes(cache_path.read_bytes()[:100])
+  assert ConfigCache.build_from_path(str(yaml_path)) == built_config
+  __forbid_building(monkeypatch)
+  assert ConfigCache.build_from_path(str(yaml_path)) == built_config
+  assert len(__get_cache_names(yaml_path)) == 1
@@ -0,0 +1,35 @@
+from datetime import date, timedelta
+import pytest
+from dateutil.relativedelta import relativedelta
+from models.enums.time_period_type import TimePeriodType
+from services.date_calculator import DateCalculator
+
+
+@pytest.mark.parametrize("some_date, months, expected", [
+  (date(2025, 1, 31), 1, date(2025, 2, 28)),
+  (date(2024, 1, 31), 1, date(2024, 2, 29)),
+  (date(2025, 3, 31), 1, date(2025, 4, 30)),
+  (date(2025, 3, 31), -1, date(2025, 2, 28)),
+  (date(2025, 12, 31), 2, date(2026, 2, 28)),
+  (date(2024, 2, 29), 12, date(2025, 2, 28)),
+  (date(2024, 2, 29), 48, date(2028, 2, 29)),
+  (date(2100, 1, 31), 1, date(2100, 2, 28)),
+  (date(2000, 1, 31), 1, date(2000, 2, 29)),
+  (date(2025, 1, 15), -13, date(2023, 12, 15))
+])
+def test_add_months_clamps_to_the_end_of_shorter_months(some_date: date, months: int, expected: date):
+  assert DateCalculator.add_months(some_date, months) == expected
+
+
+def test_add_months_matches_relativedelta():
+  some_date = date(2023, 12, 25)
+  while some_date < date(2025, 1, 8):
+    for months in (-25, -12, -1, 1, 2, 6, 12, 13, 49):
+      expected = some_date + relativedelta(months=months)
+      assert DateCalculator.add_months(some_date, months) == expected, (some_date, months)
+    some_date += timedelta(days=1)
+
+
+def test_years_step_through_add_months():
+  assert DateCalculator.add_period(date(2024, 2, 29), TimePeriodType.YEARS, 1) == date(2025, 2, 28)
+  assert DateCalculator.subtract_period(date(2025, 3, 31), TimePeriodType.MONTHS, 1) == date(2025, 2, 28)
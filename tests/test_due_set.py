@@ -0,0 +1,80 @@
+from datetime import date
+from typing import List
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.ledger import Ledger
+from entities.misc.due_set import DueSet
+from models.configs.bill_config import BillConfig
+from models.configs.debt_config import DebtConfig
+from models.enums.time_period_type import TimePeriodType
+from services.output_sink import OutputSink
+
+TODAY = date(2030, 1, 1)
+
+
+def __build_bills(ledger: Ledger) -> List[Bill]:
+  bills = []
+  for name, charge, start_date in (
+    ("Rent", 1500, TODAY),
+    ("Free Trial", 0, TODAY),
+    ("Gym", 50, date(2030, 2, 1))
+  ):
+    bill_config = BillConfig(
+      name=name,
+      charge=charge,
+      charge_period_type=TimePeriodType.MONTHS,
+      charge_period_value=1,
+      annual_inflation_flat=None,
+      annual_inflation_percentage=None,
+      annual_inflation_period_type=None,
+      annual_inflation_period_value=None,
+      start_date=start_date,
+      end_date=None
+    )
+    bills.append(Bill(TODAY, bill_config, ledger, OutputSink()))
+  return bills
+
+
+def __build_debts(ledger: Ledger) -> List[Debt]:
+  debts = []
+  for name, balance, interest_period_type in (
+    ("Car Loan", 20000, TimePeriodType.DAYS),
+    ("Student Loan", 10000, TimePeriodType.MONTHS),
+    ("Paid Off Loan", 0, TimePeriodType.DAYS)
+  ):
+    debt_config = DebtConfig(
+      name=name,
+      principal=20000,
+      balance=balance,
+      start_date=date(2029, 12, 1),
+      end_date=date(2034, 12, 1),
+      interest_rate=6,
+      interest_period_type=interest_period_type,
+      interest_period_value=1,
+      charge_period_type=TimePeriodType.MONTHS,
+      charge_period_value=1,
+      asset=None
+    )
+    debts.append(Debt(TODAY, debt_config, ledger, OutputSink()))
+  return debts
+
+
+def test_due_set_lists_what_is_due_today():
+  ledger = Ledger()
+  bills = __build_bills(ledger)
+  debts = __build_debts(ledger)
+  due_set = DueSet(TODAY, bills, debts, [])
+  # The free trial charges nothing and the gym has not started
+  assert due_set.get_charging_bills() == bills[:1]
+  # The paid off loan neither accrues nor charges
+  assert due_set.get_accruing_debts() == debts[:2]
+  assert due_set.get_charging_debts() == debts[:2]
+  assert due_set.get_paying_incomes() == []
+
+
+def test_due_set_skips_what_is_not_due_today():
+  ledger = Ledger()
+  due_set = DueSet(date(2030, 1, 15), __build_bills(ledger), __build_debts(ledger), [])
+  assert due_set.get_charging_bills() == []
+  assert due_set.get_accruing_debts() == []
+  assert due_set.get_charging_debts() == []
@@ -0,0 +1,132 @@
+import os
+from typing import List, Tuple
+import numpy as np
+import pytest
+from models.configs.federal_tax_config import FederalTaxConfig
+from models.configs.federal_tax_table_config import FederalTaxTableConfig
+from models.configs.federal_tax_year_config import FederalTaxYearConfig
+from services.config_builder import ConfigBuilder
+from services.federal_tax_schedule import FederalTaxSchedule
+from services.federal_tax_table import FederalTaxTable
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+SINGLE_2025 = FederalTaxTableConfig(
+  standard_deduction=14600,
+  brackets=[(0, 10), (11600, 12), (47150, 22), (100525, 24), (191950, 32), (243725, 35), (609350, 37)]
+)
+# The tax owed on taxable income at each single 2025 lower bound, bracket by bracket
+SINGLE_2025_BASE_TAXES = [0, 1160, 5426, 17168.5, 39110.5, 55678.5, 183647.25]
+
+
+def __get_baseline_tax(is_married: bool, gross_income: float) -> float:
+  """The hard-coded 2025 calculation the table-driven engine replaced, kept as the reference."""
+  if is_married:
+    standard_deduction = 29200
+    brackets: List[Tuple[float, float, float]] = [
+      (0, 23200, 0.10),
+      (23200, 94300, 0.12),
+      (94300, 201050, 0.22),
+      (201050, 383900, 0.24),
+      (383900, 487450, 0.32),
+      (487450, 731200, 0.35),
+      (731200, float("inf"), 0.37)
+    ]
+  else:
+    standard_deduction = 14600
+    brackets = [
+      (0, 11600, 0.10),
+      (11600, 47150, 0.12),
+      (47150, 100525, 0.22),
+      (100525, 191950, 0.24),
+      (191950, 243725, 0.32),
+      (243725, 609350, 0.35),
+      (609350, float("inf"), 0.37)
+    ]
+  taxable_income = max(0, gross_income - standard_deduction)
+  tax = 0.0
+  for lower, upper, rate in brackets:
+    if taxable_income > lower:
+      tax += (min(taxable_income, upper) - lower) * rate
+    else:
+      break
+  return tax
+
+
+def __get_default_table_config(is_married: bool) -> FederalTaxTableConfig:
+  """The table the config builder falls back to when a config lists no federal_tax section."""
+  default_year = ConfigBuilder.build_from_path(SMALL_CONFIG_PATH).federal_tax.years[0]
+  return default_year.married if is_married else default_year.single
+
+
+@pytest.mark.parametrize("bracket", range(len(SINGLE_2025.brackets)))
+def test_income_on_a_lower_bound_owes_nothing_at_that_brackets_rate(bracket: int):
+  table = FederalTaxTable(SINGLE_2025)
+  lower_bound, rate = SINGLE_2025.brackets[bracket]
+  gross_income = SINGLE_2025.standard_deduction + lower_bound
+  assert table.get_tax(gross_income) == pytest.approx(SINGLE_2025_BASE_TAXES[bracket], abs=1e-9)
+  assert table.get_tax(gross_income + 100) == pytest.approx(SINGLE_2025_BASE_TAXES[bracket] + rate, abs=1e-9)
+  if bracket > 0:
+    _, rate_below = SINGLE_2025.brackets[bracket - 1]
+    expected_below = SINGLE_2025_BASE_TAXES[bracket] - rate_below / 100
+    assert table.get_tax(gross_income - 1) == pytest.approx(expected_below, abs=1e-9)
+
+
+def test_zero_and_top_bracket_incomes():
+  table = FederalTaxTable(SINGLE_2025)
+  assert table.get_tax(0) == 0.0
+  assert table.get_tax(SINGLE_2025.standard_deduction) == 0.0
+  assert table.get_tax(1_000_000) == pytest.approx(183647.25 + (1_000_000 - 14600 - 609350) * 0.37, abs=1e-9)
+
+
+def test_inflation_factor_scales_the_deduction_and_bounds_but_not_the_rates():
+  table = FederalTaxTable(SINGLE_2025, inflation_factor=2.0)
+  assert table.get_standard_deduction() == 29200
+  assert table.get_tax(29200 + 2 * 11600) == pytest.approx(2 * 1160, abs=1e-9)
+
+
+@pytest.mark.parametrize("is_married", [False, True])
+def test_default_tables_reproduce_the_baseline_tax(is_married: bool):
+  table_config = __get_default_table_config(is_married)
+  table = FederalTaxTable(table_config)
+  gross_incomes = [float(gross_income) for gross_income in range(0, 1_500_001, 250)]
+  # On and either side of every bracket edge, where a strict versus non-strict comparison would show
+  for lower_bound, _ in table_config.brackets:
+    edge = table_config.standard_deduction + lower_bound
+    gross_incomes += [edge - 0.01, edge, edge + 0.01]
+  for gross_income in gross_incomes:
+    expected = __get_baseline_tax(is_married, gross_income)
+    assert table.get_tax(gross_income) == pytest.approx(expected, rel=1e-12, abs=1e-9)
+  assert list(table.get_taxes(np.array(gross_incomes))) == pytest.approx(
+    [__get_baseline_tax(is_married, gross_income) for gross_income in gross_incomes],
+    rel=1e-12,
+    abs=1e-9
+  )
+
+
+def test_schedule_picks_the_latest_listed_year_and_indexes_later_years():
+  married_2025 = FederalTaxTableConfig(standard_deduction=29200, brackets=[(0, 10), (23200, 12)])
+  single_2027 = FederalTaxTableConfig(standard_deduction=20000, brackets=[(0, 15)])
+  schedule = FederalTaxSchedule(FederalTaxConfig(
+    annual_inflation_percentage=10,
+    years=[
+      FederalTaxYearConfig(year=2025, single=SINGLE_2025, married=married_2025),
+      FederalTaxYearConfig(year=2027, single=single_2027, married=married_2025)
+    ]
+  ))
+  # Years before the first listed one use it as is
+  assert schedule.get_table(2024, False).get_standard_deduction() == 14600
+  assert schedule.get_table(2025, False).get_standard_deduction() == 14600
+  assert schedule.get_table(2025, True).get_standard_deduction() == 29200
+  assert schedule.get_table(2026, False).get_standard_deduction() == pytest.approx(14600 * 1.1)
+  assert schedule.get_table(2027, False).get_standard_deduction() == 20000
+  assert schedule.get_table(2027, False).get_tax(30000) == pytest.approx(1500)
+  assert schedule.get_table(2029, False).get_standard_deduction() == pytest.approx(20000 * 1.1 ** 2)
+  assert schedule.get_table(2029, False) is schedule.get_table(2029, False)
+
+
+def test_schedule_holds_tables_flat_without_an_inflation_percentage():
+  schedule = FederalTaxSchedule(FederalTaxConfig(
+    annual_inflation_percentage=None,
+    years=[FederalTaxYearConfig(year=2025, single=SINGLE_2025, married=SINGLE_2025)]
+  ))
+  assert schedule.get_table(2040, False).get_tax(100000) == FederalTaxTable(SINGLE_2025).get_tax(100000)
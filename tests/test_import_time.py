@@ -0,0 +1,41 @@
+import os
+import subprocess
+import sys
+
+SRC_DIRECTORY = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+# Cumulative microseconds for `import main`, best of a few runs; it was ~300ms before deferring the heavy imports
+IMPORT_TIME_BUDGET_MICROSECONDS = 200_000
+DEFERRED_MODULES = ["concurrent.futures", "cProfile", "numpy", "numpy_financial", "pstats", "yaml"]
+
+
+def __run_python(*args: str) -> subprocess.CompletedProcess:
+  return subprocess.run(
+    [sys.executable, *args],
+    cwd=SRC_DIRECTORY,
+    capture_output=True,
+    text=True,
+    check=True
+  )
+
+
+def __measure_import_time() -> int:
+  # -X importtime writes "import time: self | cumulative | module" lines to stderr, innermost first
+  stderr = __run_python("-X", "importtime", "-c", "import main").stderr
+  for line in reversed(stderr.splitlines()):
+    _, cumulative, module = line.split("|")
+    if module.strip() == "main":
+      return int(cumulative)
+  raise AssertionError(f"No import time reported for main:\n{stderr}")
+
+
+def test_main_does_not_import_deferred_modules():
+  script = f"import sys, main; print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+  loaded_modules = __run_python("-c", script).stdout.strip()
+  assert loaded_modules == "", f"Imported at startup: {loaded_modules}"
+
+
+def test_main_import_time_within_budget():
+  import_time = min(__measure_import_time() for _ in range(3))
+  assert import_time < IMPORT_TIME_BUDGET_MICROSECONDS, (
+    f"import main took {import_time / 1000:.1f}ms (budget {IMPORT_TIME_BUDGET_MICROSECONDS / 1000:.0f}ms)"
+  )
@@ -0,0 +1,63 @@
+import json
+import os
+from datetime import date
+from pathlib import Path
+import pytest
+from entities.ledger import Ledger
+from services.config_builder import ConfigBuilder
+from services.json_lines_writer import JsonLinesWriter
+from services.simulator import Simulator
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+
+
+def test_writer_streams_every_days_events_in_order_and_closes_with_the_totals(tmp_path: Path):
+  full_config = ConfigBuilder.build_from_path(SMALL_CONFIG_PATH)
+  # Sold on a day that is not a print day
+  full_config.assets[0].sell_date = date(2030, 6, 1)
+  path = tmp_path / "run.jsonl"
+  writer = JsonLinesWriter(str(path))
+  try:
+    result = Simulator(
+      full_config,
+      TODAY,
+      Ledger(),
+      headless=True,
+      output_sink=writer
+    ).run()
+  finally:
+    writer.close()
+  with open(path, "r", encoding="utf-8") as jsonl:
+    events = [json.loads(line) for line in jsonl]
+  dates = [date.fromisoformat(event["date"]) for event in events]
+  assert dates == sorted(dates)
+  assert {event["type"] for event in events} == {
+    "charge",
+    "inflation_adjustment",
+    "payout",
+    "allocation",
+    "interest",
+    "appreciation",
+    "tax_day",
+    "asset_sale",
+    "daily_summary",
+    "totals"
+  }
+  # The yearly print frequency spaces out the summaries but not the events between them
+  summary_dates = [event["date"] for event in events if event["type"] == "daily_summary"]
+  assert summary_dates == [f"{year}-01-01" for year in range(2026, 2034)] + ["2033-12-31"]
+  grocery_charges = [event for event in events if event["type"] == "charge" and event["name"] == "Groceries"]
+  assert len(grocery_charges) == (date(2033, 12, 31) - date(2026, 1, 5)).days // 7 + 1
+  assert [event["date"] for event in events if event["type"] == "tax_day"] == [
+    f"{year}-04-15" for year in range(2026, 2034)
+  ]
+  boat_sale = next(event for event in events if event["type"] == "asset_sale")
+  assert (boat_sale["date"], boat_sale["name"], boat_sale["forced"]) == ("2030-06-01", "Boat", False)
+  totals = events[-1]
+  assert totals["type"] == "totals"
+  assert totals["date"] == "2033-12-31"
+  assert totals["bankruptcy_date"] is None
+  assert totals["final_net_worth"] == pytest.approx(result.final_net_worth)
+  assert totals["obtained_from_stock_market"] == pytest.approx(result.obtained_from_stock_market)
+  assert totals["shuffle_transfer_count"] == result.shuffle_transfer_count
@@ -0,0 +1,85 @@
+import os
+from datetime import date
+import pytest
+from entities.asset import Asset
+from entities.bill import Bill
+from entities.debt import Debt
+from entities.income import IncomeStream
+from entities.ledger import Ledger
+from models.configs.full_config import FullConfig
+from services.config_builder import ConfigBuilder
+from services.lifecycle_index import LifecycleIndex
+from services.output_sink import OutputSink
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+
+
+@pytest.fixture(name="full_config")
+def fixture_full_config() -> FullConfig:
+  return ConfigBuilder.build_from_path(SMALL_CONFIG_PATH)
+
+
+def __get_names(configs: list) -> list:
+  return [config.name for config in configs]
+
+
+def test_configs_start_on_their_start_day_and_earlier_ones_are_not_queued(full_config: FullConfig):
+  lifecycle_index = LifecycleIndex(full_config, TODAY)
+  # Starting today counts; the Annual Subscription started in 2025 and is expected to be running
+  assert __get_names(lifecycle_index.pop_starting_bills(TODAY)) == ["Rent"]
+  assert lifecycle_index.pop_starting_bills(date(2026, 1, 4)) == []
+  assert __get_names(lifecycle_index.pop_starting_bills(date(2026, 1, 5))) == ["Groceries"]
+  assert lifecycle_index.pop_starting_bills(date(2026, 1, 5)) == []
+  assert __get_names(lifecycle_index.pop_starting_incomes(date(2026, 1, 9))) == ["Job"]
+  assert __get_names(lifecycle_index.pop_starting_debts(date(2029, 6, 30))) == []
+  assert __get_names(lifecycle_index.pop_starting_debts(date(2029, 7, 1))) == ["House"]
+
+
+def test_a_start_day_the_event_loop_stepped_over_is_dropped(full_config: FullConfig):
+  lifecycle_index = LifecycleIndex(full_config, TODAY)
+  # Car Insurance (2026-02-10) was due on a day never visited; Spending Money is due today
+  assert __get_names(lifecycle_index.pop_starting_bills(date(2026, 3, 1))) == ["Spending Money"]
+  assert lifecycle_index.pop_starting_bills(date(2026, 2, 10)) == []
+
+
+def test_ties_keep_config_order(full_config: FullConfig):
+  for bill_config in full_config.bills:
+    bill_config.start_date = date(2027, 1, 1)
+  lifecycle_index = LifecycleIndex(full_config, TODAY)
+  assert __get_names(lifecycle_index.pop_starting_bills(date(2027, 1, 1))) == [
+    bill_config.name for bill_config in full_config.bills
+  ]
+
+
+def test_entities_run_through_their_end_day(full_config: FullConfig):
+  lifecycle_index = LifecycleIndex(full_config, TODAY)
+  ledger = Ledger()
+  rent = Bill(TODAY, full_config.bills[0], ledger, OutputSink())
+  job = IncomeStream(TODAY, full_config.income[0], ledger, OutputSink())
+  car_loan = Debt(TODAY, full_config.debts[0], ledger, OutputSink())
+  lifecycle_index.add_bill(rent)
+  lifecycle_index.add_income(job)
+  lifecycle_index.add_debt(car_loan, TODAY)
+  assert lifecycle_index.pop_ended_bills(date(2029, 6, 30)) == []
+  assert lifecycle_index.pop_ended_bills(date(2029, 7, 1)) == [rent]
+  assert lifecycle_index.pop_ended_debts(date(2030, 6, 15)) == []
+  assert lifecycle_index.pop_ended_debts(date(2030, 6, 16)) == [car_loan]
+  assert lifecycle_index.pop_ended_incomes(date(2032, 12, 31)) == []
+  # Ends are popped even when the loop first lands well after them
+  assert lifecycle_index.pop_ended_incomes(date(2033, 3, 1)) == [job]
+
+
+def test_debt_assets_join_on_the_day_added_and_sell_on_their_sell_day(full_config: FullConfig):
+  lifecycle_index = LifecycleIndex(full_config, TODAY)
+  car_loan = Debt(TODAY, full_config.debts[0], Ledger(), OutputSink())
+  lifecycle_index.add_debt(car_loan, TODAY)
+  car = lifecycle_index.pop_debt_assets(TODAY)
+  assert car == [car_loan.get_asset()]
+  lifecycle_index.add_asset(car[0], TODAY)
+  assert lifecycle_index.pop_assets_to_sell(date(2031, 6, 14)) == []
+  assert lifecycle_index.pop_assets_to_sell(date(2031, 6, 15)) == car
+  full_config.assets[0].sell_date = date(2025, 12, 31)
+  lifecycle_index.add_asset(Asset(True, TODAY, full_config.assets[0], OutputSink()), TODAY)
+  # A sell date already in the past is never queued
+  assert lifecycle_index.pop_assets_to_sell(date(2099, 1, 1)) == []
@@ -0,0 +1,102 @@
+import os
+from datetime import date
+from typing import List, Tuple
+from entities.asset import Asset
+from entities.ledger import Ledger
+from models.configs.asset_config import AssetConfig
+from models.enums.asset_type import AssetType
+from models.enums.time_period_type import TimePeriodType
+from services.config_builder import ConfigBuilder
+from services.liquidation_engine import LiquidationEngine
+from services.output_sink import OutputSink
+from services.simulator import Simulator
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+
+
+def __build_asset(name: str, value: float, appreciation_rate: float, is_paid_off: bool = True) -> Asset:
+  return Asset(
+    is_paid_off,
+    TODAY,
+    AssetConfig(
+      name=name,
+      type=AssetType.MISC,
+      value=value,
+      appreciation_rate=appreciation_rate,
+      appreciation_period_type=TimePeriodType.YEARS,
+      appreciation_period_value=1,
+      pays_capital_gains_tax=False,
+      sell_date=None
+    ),
+    OutputSink()
+  )
+
+
+def __get_names(assets: List[Asset]) -> List[str]:
+  return [asset.get_name() for asset in assets]
+
+
+def test_assets_are_sold_cheapest_per_dollar_first():
+  # With no untaxed gains, the cost per dollar is just the appreciation given up
+  car = __build_asset("Car", 20000, -10)
+  boat = __build_asset("Boat", 9000, -5)
+  house = __build_asset("House", 300000, 3)
+  liquidation_engine = LiquidationEngine([house, boat, car])
+  assert __get_names(liquidation_engine.choose_assets_to_sell(5000)) == ["Car"]
+  assert __get_names(liquidation_engine.choose_assets_to_sell(25000)) == ["Car", "Boat"]
+  # The House alone covers this, so the cheaper picks before it are dropped
+  assert __get_names(liquidation_engine.choose_assets_to_sell(100000)) == ["House"]
+  assert liquidation_engine.choose_assets_to_sell(400000) == []
+  assert liquidation_engine.get_total_proceeds() == 329000
+
+
+def test_picks_the_rest_cover_are_dropped_and_one_cheaper_asset_wins():
+  boat = __build_asset("Boat", 1000, -1)
+  cabin = __build_asset("Cabin", 4000, 0)
+  land = __build_asset("Land", 10000, 1)
+  # Boat is taken first, then dropped once Cabin and Land cover the shortfall on their own
+  assert __get_names(LiquidationEngine.choose_cheapest([land, cabin, boat], 14000)) == ["Cabin", "Land"]
+  stocks = __build_asset("Stocks", 5000, 1)
+  bonds = __build_asset("Bonds", 6000, 1.2)
+  gold = __build_asset("Gold", 7000, 1.5)
+  # Stocks and Bonds are cheaper per dollar and cost 122 together; Gold alone covers it for 105
+  assert __get_names(LiquidationEngine.choose_cheapest([gold, bonds, stocks], 7000)) == ["Gold"]
+  assert __get_names(LiquidationEngine.choose_cheapest([gold, bonds, stocks], 11000)) == ["Stocks", "Bonds"]
+
+
+def test_only_paid_off_unsold_assets_are_sellable():
+  car = __build_asset("Car", 20000, -10, is_paid_off=False)
+  boat = __build_asset("Boat", 9000, -5)
+  liquidation_engine = LiquidationEngine([car, boat])
+  assert __get_names(liquidation_engine.choose_assets_to_sell(5000)) == ["Boat"]
+  car.set_is_paid_off(True)
+  liquidation_engine.add(car)
+  assert __get_names(liquidation_engine.choose_assets_to_sell(5000)) == ["Car"]
+  liquidation_engine.remove(car)
+  assert liquidation_engine.choose_assets_to_sell(10000) == []
+
+
+class SaleRecorder(OutputSink):
+  sales: List[Tuple[date, str, float, bool]]
+
+  def __init__(self):
+    self.sales = []
+
+  def asset_sale(self, today: date, name: str, amount: float, is_forced: bool) -> None:
+    self.sales.append((today, name, amount, is_forced))
+
+
+def test_a_shortfall_forces_a_sale_before_bankruptcy():
+  full_config = ConfigBuilder.build_from_path(SMALL_CONFIG_PATH)
+  for bill_config in full_config.bills:
+    bill_config.charge *= 1.8
+  sale_recorder = SaleRecorder()
+  result = Simulator(full_config, TODAY, Ledger(), quiet=True, headless=True, output_sink=sale_recorder).run()
+  assert result.bankruptcy_date == date(2027, 9, 1)
+  # The Boat is the only paid-off asset; the Car and House still carry debt
+  assert len(sale_recorder.sales) == 1
+  sale_date, name, _, is_forced = sale_recorder.sales[0]
+  assert (name, is_forced) == ("Boat", True)
+  assert sale_date < result.bankruptcy_date
+  assert any(warning.message == "Selling Boat out of desperation." for warning in result.warnings)
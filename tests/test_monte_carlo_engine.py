@@ -0,0 +1,60 @@
+import os
+import time
+from datetime import date, timedelta
+import pytest
+from entities.ledger import Ledger
+from models.configs.full_config import FullConfig
+from services.config_builder import ConfigBuilder
+from services.monte_carlo_engine import MonteCarloEngine
+from services.simulator import Simulator
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODEL_CONFIG_PATH = os.path.join(ROOT_DIRECTORY, "config", "model", "main.yml")
+TODAY = date(2026, 10, 17)
+RELATIVE_TOLERANCE = 1e-9
+# Seconds for 10k paths over 40 years on one core; it was ~130s before paths stepped on the event calendar
+TIMING_PATHS = 10_000
+TIMING_YEARS = 40
+TIMING_BUDGET_SECONDS = 20
+
+
+def __build_config(bill_scale: float) -> FullConfig:
+  full_config = ConfigBuilder.build_from_path(MODEL_CONFIG_PATH)
+  for bill_config in full_config.bills:
+    bill_config.charge *= bill_scale
+  return full_config
+
+
+# 1.5 times the bills sells the assets and then goes bankrupt partway through
+@pytest.mark.parametrize("bill_scale", [1.0, 1.5])
+def test_zero_volatility_paths_match_simulator(bill_scale: float):
+  result = MonteCarloEngine(
+    __build_config(bill_scale),
+    TODAY,
+    2,
+    seed=1,
+    return_volatility=0,
+    inflation_volatility=0
+  ).run()
+  simulator = Simulator(__build_config(bill_scale), TODAY, Ledger(), quiet=True, headless=True)
+  for row, record_date in enumerate(result.dates):
+    simulation_result = simulator.run(record_date + timedelta(days=1))
+    is_bankrupt = simulation_result.bankruptcy_date is not None
+    assert result.cumulative_bankruptcy_probability[row] == (1.0 if is_bankrupt else 0.0), record_date
+    if is_bankrupt:
+      return
+    expected = pytest.approx(simulator.get_net_worth(), rel=RELATIVE_TOLERANCE)
+    for percentile in (5, 50, 95):
+      assert result.net_worth_percentiles[percentile][row] == expected, record_date
+  assert bill_scale == 1.0, "Expected the scaled bills to go bankrupt"
+
+
+def test_ten_thousand_paths_over_forty_years_within_budget():
+  full_config = __build_config(1.0)
+  full_config.output.end_date = date(TODAY.year + TIMING_YEARS, TODAY.month, TODAY.day)
+  start = time.perf_counter()
+  MonteCarloEngine(full_config, TODAY, TIMING_PATHS, seed=1).run()
+  elapsed = time.perf_counter() - start
+  assert elapsed < TIMING_BUDGET_SECONDS, (
+    f"{TIMING_PATHS} paths over {TIMING_YEARS} years took {elapsed:.1f}s (budget {TIMING_BUDGET_SECONDS}s)"
+  )
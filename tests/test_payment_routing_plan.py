@@ -0,0 +1,55 @@
+from datetime import date
+from typing import Callable, List
+import pytest
+from entities.account import Account
+from entities.misc.payment_routing_plan import PaymentRoutingPlan
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+
+TODAY = date(2030, 1, 1)
+PAYMENT_ORDER: List[List] = [["Checking", 5000], ["Savings", 10000], ["Investment", None]]
+
+
+@pytest.fixture(name="build_checking_savings_investment")
+def fixture_build_checking_savings_investment(
+  build_account_config: Callable[..., AccountConfig],
+  build_accounts: Callable[[List[AccountConfig], date], List[Account]]
+) -> Callable[[float, float, float], List[Account]]:
+  def build_checking_savings_investment(checking: float, savings: float, investment: float) -> List[Account]:
+    return build_accounts([
+      build_account_config("Checking", AccountType.CASH, checking, TODAY),
+      build_account_config("Savings", AccountType.SAVINGS, savings, TODAY),
+      build_account_config("Investment", AccountType.INVESTMENT, investment, TODAY)
+    ], TODAY)
+
+  return build_checking_savings_investment
+
+
+def __shuffle(accounts: List[Account], shuffle_tolerance: float) -> int:
+  return PaymentRoutingPlan(PAYMENT_ORDER, shuffle_tolerance, accounts, [], TODAY).shuffle(TODAY)
+
+
+def test_shuffle_drains_overfill_down_the_order_and_counts_transfers(
+  build_checking_savings_investment: Callable[[float, float, float], List[Account]]
+):
+  accounts = build_checking_savings_investment(20000, 2000, 0)
+  # Checking's overfill tops Savings past its expectation, and Savings' overfill then returns to Checking
+  assert __shuffle(accounts, 1000) == 2
+  assert [account.get_balance() for account in accounts] == [12000, 10000, 0]
+
+
+def test_shuffle_moves_overfill_into_the_first_underfilled_account(
+  build_checking_savings_investment: Callable[[float, float, float], List[Account]]
+):
+  accounts = build_checking_savings_investment(9000, 4000, 0)
+  assert __shuffle(accounts, 1000) == 1
+  assert [account.get_balance() for account in accounts] == [5000, 8000, 0]
+
+
+def test_shuffle_leaves_accounts_within_the_tolerance(
+  build_checking_savings_investment: Callable[[float, float, float], List[Account]]
+):
+  accounts = build_checking_savings_investment(5000, 10900, 0)
+  assert __shuffle(accounts, 1000) == 0
+  assert __shuffle(accounts, 500) == 1
+  assert [account.get_balance() for account in accounts] == [5900, 10000, 0]
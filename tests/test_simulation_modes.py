@@ -0,0 +1,62 @@
+import os
+from datetime import date
+from typing import Dict, List, Tuple
+import pytest
+from entities.ledger import Ledger
+from models.results.simulation_result import SimulationResult
+from services.config_builder import ConfigBuilder
+from services.simulator import Simulator
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+MODES: Dict[str, Dict[str, bool]] = {
+  "event_driven": {"event_driven": True},
+  "vectorized_accounts": {"vectorized_accounts": True},
+  "event_driven_vectorized_accounts": {"event_driven": True, "vectorized_accounts": True},
+  "headless": {"headless": True}
+}
+
+
+def __run(bill_scale: float, mode: Dict[str, bool]) -> Tuple[SimulationResult, List[float]]:
+  full_config = ConfigBuilder.build_from_path(SMALL_CONFIG_PATH)
+  for bill_config in full_config.bills:
+    bill_config.charge *= bill_scale
+  ledger = Ledger()
+  result = Simulator(
+    full_config,
+    TODAY,
+    ledger,
+    event_driven=mode.get("event_driven", False),
+    quiet=True,
+    headless=mode.get("headless", False),
+    vectorized_accounts=mode.get("vectorized_accounts", False)
+  ).run()
+  journal = ledger.get_journal()
+  ledger_totals = [
+    journal.get_user_change(),
+    journal.get_counterparty_change(),
+    ledger.get_bank().peak_balance(),
+    ledger.get_biller().peak_balance(),
+    ledger.get_buyer().peak_balance(),
+    ledger.get_debtor().peak_balance(),
+    ledger.get_employer().peak_balance(),
+    ledger.get_internal_revenue_service().peak_balance(),
+    ledger.get_stock_market().peak_balance()
+  ]
+  return result, ledger_totals
+
+
+# 1.8 times the bills goes bankrupt in the second year
+@pytest.mark.parametrize("bill_scale", [1.0, 1.8])
+@pytest.mark.parametrize("mode", MODES.keys())
+def test_mode_matches_default_run(monkeypatch: pytest.MonkeyPatch, mode: str, bill_scale: float):
+  # Runs that are not headless prompt on warnings
+  monkeypatch.setattr("builtins.input", lambda *_: "")
+  expected_result, expected_ledger_totals = __run(bill_scale, {})
+  result, ledger_totals = __run(bill_scale, MODES[mode])
+  assert result.bankruptcy_date == expected_result.bankruptcy_date
+  assert result.money_needed == pytest.approx(expected_result.money_needed)
+  assert result.shuffle_transfer_count == expected_result.shuffle_transfer_count
+  # Closed-form accrual and array sums round differently, but only in the last few bits
+  assert result.final_net_worth == pytest.approx(expected_result.final_net_worth, rel=1e-9)
+  assert ledger_totals == pytest.approx(expected_ledger_totals, rel=1e-9, abs=1e-6)
@@ -0,0 +1,56 @@
+import os
+from datetime import date
+from pathlib import Path
+import pytest
+from exceptions.invalid_scenario_fork_exception import InvalidScenarioForkException
+from models.configs.sweep_axis_config import SweepAxisConfig
+from models.configs.sweep_config import SweepConfig
+from services.sweep_runner import SweepRunner
+
+SMALL_CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "configs", "small.yml")
+TODAY = date(2026, 1, 1)
+
+
+def test_forked_scenarios_cannot_change_the_shuffle_tolerance(tmp_path: Path):
+  base_path = tmp_path / "main.yml"
+  with open(SMALL_CONFIG_PATH, "r", encoding="utf-8") as small_config:
+    base_path.write_text(small_config.read() + "shuffle_tolerance: 1000\n", encoding="utf-8")
+  sweep_runner = SweepRunner(
+    SweepConfig(
+      base=str(base_path),
+      axes=[SweepAxisConfig(path=["shuffle_tolerance"], values=[1000, 5000], is_scale=False)],
+      max_workers=1,
+      event_driven=True,
+      fork_date=date(2029, 1, 1)
+    ),
+    TODAY
+  )
+  with pytest.raises(InvalidScenarioForkException, match="shuffle_tolerance"):
+    next(sweep_runner.run())
+
+
+@pytest.mark.parametrize("event_driven", [False, True])
+def test_forked_scenarios_match_unforked_ones(event_driven: bool):
+  axes = [
+    # Rent started before the fork, but its end date has not passed yet
+    SweepAxisConfig(
+      path=["bills", "Rent", "end_date"],
+      values=[None, {"month": 6, "day": 30, "year": 2030}],
+      is_scale=False
+    ),
+    # Escrow only starts after the fork
+    SweepAxisConfig(path=["bills", "Mortgage Escrow", "charge"], values=[1.0, 1.5], is_scale=True)
+  ]
+  results = {}
+  for fork_date in (None, date(2028, 3, 14)):
+    sweep_runner = SweepRunner(
+      SweepConfig(base=SMALL_CONFIG_PATH, axes=axes, max_workers=1, event_driven=event_driven, fork_date=fork_date),
+      TODAY
+    )
+    results[fork_date] = sorted(
+      (result.index, result.bankruptcy_date, result.final_net_worth, result.warning_count)
+      for result in sweep_runner.run()
+    )
+  # Every scenario ends up somewhere different
+  assert len({final_net_worth for _, _, final_net_worth, _ in results[None]}) == 4
+  assert results[date(2028, 3, 14)] == results[None]
@@ -0,0 +1,35 @@
+from datetime import date
+from typing import Callable, List
+import pytest
+from entities.account import Account
+from models.configs.account_config import AccountConfig
+from models.enums.account_type import AccountType
+from services.withdrawal_planner import WithdrawalPlanner
+
+TODAY = date(2030, 1, 1)
+
+
+@pytest.fixture(name="planner")
+def fixture_planner(
+  build_account_config: Callable[..., AccountConfig],
+  build_accounts: Callable[[List[AccountConfig], date], List[Account]]
+) -> WithdrawalPlanner:
+  accounts = build_accounts([
+    build_account_config("Checking", AccountType.CASH, 600, TODAY),
+    build_account_config("Savings", AccountType.SAVINGS, 1000, TODAY, pays_income_tax=True)
+  ], TODAY)
+  return WithdrawalPlanner(accounts, [account.get_post_tax_balance(TODAY) for account in accounts], TODAY)
+
+
+def test_no_shortfall_when_the_accounts_cover_every_charge(planner: WithdrawalPlanner):
+  assert planner.get_shortfall([500, 500, 300]) == 0
+
+
+def test_shortfall_replays_the_income_tax_on_each_withdrawal(planner: WithdrawalPlanner):
+  # 600 + 780 is available up front, but the second charge takes 400 out of Savings and the 88
+  # of income tax on it leaves 512, or 399.36 post-tax, for the third
+  assert planner.get_shortfall([500, 500, 500]) == pytest.approx(100.64)
+
+
+def test_a_short_charge_empties_the_accounts_for_the_ones_after_it(planner: WithdrawalPlanner):
+  assert planner.get_shortfall([2000, 100]) == pytest.approx(620 + 100)